@@ -0,0 +1,51 @@
+"""
+Benchmark the Headless Batch CLI with the Stub Worker in Place of Blender
+
+Creates a folder of dummy FBX files (optionally with hanging, broken and flaky ones),
+runs batch_prepare.py over it with stub_blender.py and prints the throughput report.
+
+    python Benchmark/bench_batch.py --files 32 --workers 4 --faults
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "..", "Blender")]
+
+import batch_prepare
+
+STUB_BLENDER = f'"{sys.executable}" "{os.path.join(BENCH_DIR, "stub_blender.py")}"'
+
+
+def make_inputs(input_dir, file_count, faults):
+    names = [f"take_{index:04d}.fbx" for index in range(file_count)]
+    if faults:
+        names += ["take_hang.fbx", "take_broken.fbx", "take_flaky.fbx"]
+    for name in names:
+        with open(os.path.join(input_dir, name), "wb") as fbx_file:
+            fbx_file.write(os.urandom(64 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--faults", action="store_true", help="Add Hanging, Broken and Flaky Files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir, output_dir = os.path.join(temp_dir, "in"), os.path.join(temp_dir, "out")
+        os.makedirs(input_dir)
+        make_inputs(input_dir, args.files, args.faults)
+        jobs = batch_prepare.find_jobs(input_dir, output_dir)
+        report = batch_prepare.run_batch(jobs, STUB_BLENDER, {"prep_options": {}}, workers=args.workers,
+                                         timeout=2.0, retries=1)
+        batch_prepare.print_report(report)
+        expected_failures = 2 if args.faults else 0
+    return 0 if len(report["failed"]) == expected_failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Benchmark Chunked Batch Animation Retargeting against one Unchunked Batch (Mocked unreal)
+
+Registers a performer's animation library (plus sequences of another skeleton, which are
+filtered out), then retargets it with batch_retarget_animations in one chunk and in
+fixed-size chunks, printing throughput and the peak simulated editor memory (loaded
+packages). Then retargets it again with an editor crash partway through, restarts the
+editor and resumes from the checkpoint manifest, checking every sequence is retargeted
+exactly once.
+
+    python Benchmark/bench_batch_retarget.py --sequences 1000 --chunk-size 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Unreal")]
+
+import numpy as np
+
+import unreal
+from automate_asset import auto_ikr_to_rtg, auto_skms_to_ikrs, batch_retarget_animations
+from bench_ikr_batch import LIBRARY_PATH, make_library
+from bench_rtg_matrix import FINGER_CHAINS, MANNY_CHAINS, make_target
+
+TAKES_PATH = "/Game/Mocap/Takes"
+FRAME_RATE = 120
+
+
+class EditorCrash(BaseException):
+    pass
+
+
+def make_project(sequence_count, source_dir, seed=0):
+    """
+    One Performer's IK Rig, a Manny Retargeter and the Performer's Takes (1 to 5 Minutes at 120 Hz)
+    """
+    make_library(1, source_dir)
+    auto_skms_to_ikrs(LIBRARY_PATH)
+    ikr_source = unreal.EditorAssetLibrary.load_asset(f"{LIBRARY_PATH}/Batch00/Rigs/IKR_SKM_Actor0000")
+    ikr_target = make_target("Manny", MANNY_CHAINS + FINGER_CHAINS)
+    rtg = auto_ikr_to_rtg(ikr_source, ikr_target, unreal.Rotator(0, 0, 0), unreal.Rotator(0, 0, 90))
+
+    source_mesh = unreal.IKRigController.get_controller(ikr_source).get_skeletal_mesh()
+    skeleton = source_mesh.get_editor_property("skeleton")
+    frame_counts = np.random.default_rng(seed).integers(60, 300, sequence_count) * FRAME_RATE
+    for index, frame_count in enumerate(frame_counts):
+        unreal.add_anim_sequence(f"{TAKES_PATH}/Session{index // 100:02d}/Take{index:05d}", skeleton,
+                                 int(frame_count), len(source_mesh._bone_names))
+    other_skeleton = unreal.add_skeletal_mesh("/Game/Props/SKM_Prop", ["root"]).get_editor_property("skeleton")
+    for index in range(10):
+        unreal.add_anim_sequence(f"{TAKES_PATH}/Props/PropTake{index:02d}", other_skeleton, 1200, 1)
+
+    # Start from a Cold Editor: Nothing Loaded but what the Batch Loads
+    unreal.restart_editor()
+    return unreal.EditorAssetLibrary.load_asset(rtg.get_path_name())
+
+
+def retargeted_outputs():
+    return sorted(path for path, asset in unreal._assets.items()
+                  if isinstance(asset, unreal.AnimSequence) and path.split(".")[-1].endswith("_Manny"))
+
+
+def run(sequence_count, chunk_size, source_dir, manifest_dir, label):
+    rtg = make_project(sequence_count, source_dir)
+    start = time.perf_counter()
+    report = batch_retarget_animations(rtg, TAKES_PATH, chunk_size=chunk_size,
+                                       manifest_path=os.path.join(manifest_dir, f"{label}.json"))
+    seconds = time.perf_counter() - start
+    stats = unreal.stats
+    print(f"{label:>10}: {report['retargeted']:5d} sequences in {len(report['chunks']):3d} chunks, "
+          f"{stats.simulated_seconds / 60:6.1f} min simulated "
+          f"({report['retargeted'] / stats.simulated_seconds:5.2f} seq/s), "
+          f"peak loaded {stats.peak_loaded_bytes / 2 ** 20:8.1f} MB, after run {unreal.loaded_bytes() / 2 ** 20:6.1f} MB, "
+          f"{seconds * 1000:7.1f} ms wall")
+    return report, stats.peak_loaded_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sequences", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--crash-at", type=int, default=None, help="Sequence Index of the Crash (Default: 43%%)")
+    args = parser.parse_args()
+    crash_at = int(args.sequences * 0.43) if args.crash_at is None else args.crash_at
+
+    with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as manifest_dir:
+        single, single_peak = run(args.sequences, args.sequences, source_dir, manifest_dir, "one chunk")
+        chunked, chunked_peak = run(args.sequences, args.chunk_size, source_dir, manifest_dir, "chunked")
+
+        # Crash Partway, Restart and Resume from the Manifest
+        rtg = make_project(args.sequences, source_dir)
+        manifest_path = os.path.join(manifest_dir, "crash.json")
+        retarget_count = 0
+
+        def crash(asset_data):
+            nonlocal retarget_count
+            retarget_count += 1
+            if retarget_count > crash_at:
+                raise EditorCrash()
+
+        unreal.on_retarget = crash
+        try:
+            batch_retarget_animations(rtg, TAKES_PATH, chunk_size=args.chunk_size, manifest_path=manifest_path)
+            crashed = False
+        except EditorCrash:
+            crashed = True
+        unreal.on_retarget = None
+        unreal.restart_editor()
+        rtg = unreal.EditorAssetLibrary.load_asset(rtg.get_path_name())
+        resumed = batch_retarget_animations(rtg, TAKES_PATH, chunk_size=args.chunk_size, manifest_path=manifest_path)
+        outputs = retargeted_outputs()
+        print(f"   resumed: crashed at sequence {crash_at}, {resumed['resumed']} done before the crash, "
+              f"{resumed['retargeted']} retargeted after restart, {len(outputs)} outputs")
+
+    expected_resumed = crash_at // args.chunk_size * args.chunk_size
+    ok = (single["retargeted"] == chunked["retargeted"] == args.sequences and not chunked["failed"]
+          and chunked_peak < single_peak and crashed and resumed["resumed"] == expected_resumed
+          and resumed["resumed"] + resumed["retargeted"] == args.sequences and len(outputs) == args.sequences
+          and all(unreal._assets[path]._saved for path in outputs))
+    print(f"{single_peak / chunked_peak:.1f}x lower peak memory; Filtered, Chunked, Resumed Exactly Once: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
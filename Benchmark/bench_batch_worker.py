@@ -0,0 +1,139 @@
+"""
+Run the Background Blender Worker In-Process on a Mocked bpy
+
+Runs batch_worker.main with Blender's ``--background --python ... --`` command line on fake
+Motive FBX inputs (JSON the fake importer builds a synthetic rig and a prop mesh from):
+a mesh-only output with the cache (a miss, then a hit without preparing or exporting), a
+prop with the same vertex count but different geometry (a miss), an animated output, and
+an animated output with a baked take whose keys are reduced. Checks the result line each
+run prints, that mesh-only outputs are exported in the rest pose, that reduced takes are
+exported with their simplify factor and a measured size before and after, and that
+hashing the skeleton leaves the imported bones untouched.
+
+    python Benchmark/bench_batch_worker.py --bones 60
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import bpy
+import synthetic
+import batch_worker
+from bench_keyframe_reduction import bake_take
+from batch_prepare import RESULT_PREFIX
+
+
+def write_input(path, bone_count, prop_offset=0.0, frames=0):
+    """
+    Fake Motive FBX: the Rig to Build, a Prop Mesh (Moved by the Offset, same Vertex Count) and
+    the Frames of a Take to Bake on the Rig
+    """
+    with open(path, "w") as fbx_file:
+        json.dump({"bones": bone_count, "prop_offset": prop_offset, "frames": frames}, fbx_file)
+
+
+def import_fake_fbx(path):
+    with open(path) as fbx_file:
+        take = json.load(fbx_file)
+    armature = synthetic.make_armature(bpy, take["bones"])
+    if take.get("frames"):
+        bake_take(armature, take["frames"])
+    prop = bpy.data.meshes.new("Prop")
+    offset = take["prop_offset"]
+    prop.from_pydata([(offset, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    bpy.context.scene.collection.objects.link(bpy.data.objects.new("Prop", prop))
+
+
+def run_worker(input_path, output_path, options):
+    """
+    Run the Worker as Blender would and Parse its Result Line
+    """
+    sys.argv = ["blender", "--background", "--factory-startup", "--python", "batch_worker.py", "--",
+                "--input", input_path, "--output", output_path, "--options", json.dumps(options)]
+    bpy.reset_stats()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        batch_worker.main()
+    seconds = time.perf_counter() - start
+    result_lines = [line for line in output.getvalue().splitlines() if line.startswith(RESULT_PREFIX)]
+    return json.loads(result_lines[-1][len(RESULT_PREFIX):]) if len(result_lines) == 1 else None, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=60)
+    args = parser.parse_args()
+    bpy.fbx_importer = import_fake_fbx
+
+    ok = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        take_path, moved_path = os.path.join(temp_dir, "take.fbx"), os.path.join(temp_dir, "take_moved.fbx")
+        write_input(take_path, args.bones)
+        write_input(moved_path, args.bones, prop_offset=0.5)
+        baked_path = os.path.join(temp_dir, "take_baked.fbx")
+        write_input(baked_path, args.bones, frames=600)
+        decimate = {"location_tolerance": 0.005, "rotation_tolerance": 1.0}
+        options = {"cache_dir": os.path.join(temp_dir, "cache"), "prep_options": {"build_mode": "DATA"}}
+
+        runs = [
+            ("mesh-only", take_path, options, "MISS"),
+            ("mesh-only rerun", take_path, options, "HIT"),
+            ("moved prop", moved_path, options, "MISS"),
+            ("animated", take_path, {"with_animation": True}, None),
+            ("decimated", baked_path, {"with_animation": True, "decimate": decimate}, None),
+        ]
+        for label, input_path, run_options, expected_cache in runs:
+            output_path = os.path.join(temp_dir, label.replace(" ", "_") + ".fbx")
+            result, seconds = run_worker(input_path, output_path, run_options)
+            if result is None:
+                print(f"{label:>16}: no single result line")
+                ok = False
+                continue
+            armature = bpy.data.objects["Skeleton"]
+            # Reduced Takes are also Exported Unreduced, to Measure the Size before
+            exports = bpy.stats.ops["export_scene.fbx"]
+            exported = exports > 0
+            ok &= (result["armatures"] == 1 and result["bones"] == args.bones and os.path.isfile(output_path)
+                   and result.get("cache") == expected_cache
+                   and exports == (0 if expected_cache == "HIT" else 2 if run_options.get("decimate") else 1))
+            if run_options.get("with_animation"):
+                ok &= armature.data.pose_position != "REST" and bpy.last_export["bake_anim"]
+            else:
+                ok &= armature.data.pose_position == "REST"
+            if exported:
+                ok &= not bpy.last_export["bake_anim"] or run_options.get("with_animation", False)
+            print(f"{label:>16}: cache {result.get('cache', '-'):4}, {bpy.stats.op_calls:4d} operator calls, "
+                  f"exported {exported}, {seconds * 1000:6.1f} ms")
+            if run_options.get("decimate"):
+                factor = result["decimation"][0]["fbx_simplify_factor"]
+                ok &= (bpy.last_export["bake_anim_simplify_factor"] == factor
+                       and result["output_bytes"] < result["fbx_bytes_before"]
+                       and not os.path.exists(os.path.splitext(output_path)[0] + ".unreduced.fbx"))
+                print(f"{'':>16}  keys {result['decimation'][0]['keys_before']} -> "
+                      f"{result['decimation'][0]['keys_after']}, FBX {result['fbx_bytes_before'] / 1e3:.0f} -> "
+                      f"{result['output_bytes'] / 1e3:.0f} KB (simplify factor {factor:.2f})")
+
+        # Hashing the Skeleton must not Rename or Move the Imported Bones
+        bpy.reset_data()
+        import_fake_fbx(take_path)
+        armature = bpy.data.objects["Skeleton"]
+        bone_names = [bone.name for bone in armature.data.bones]
+        digest = batch_worker.skeleton_digest([armature])
+        ok &= bone_names == [bone.name for bone in armature.data.bones] and bpy.stats.op_calls == 0
+        ok &= digest == batch_worker.skeleton_digest([armature])
+
+    print(f"One Result Line per Run, Rest Pose Export, Cache Hit and Geometry-Aware Miss, Digest Untouched: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
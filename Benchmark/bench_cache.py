@@ -0,0 +1,72 @@
+"""
+Benchmark the Batch Output Cache with the Stub Worker in Place of Blender
+
+Builds a capture library where many takes share a few skeletons, then runs the batch
+CLI over it with a cache: the first run pays once per skeleton, the nightly
+re-run is served from the input memo without starting any worker. A third run with a
+changed script version checks the memo no longer serves the unchanged inputs.
+
+    python Benchmark/bench_cache.py --takes 40 --skeletons 4
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "..", "Blender")]
+
+import batch_prepare
+import prep_cache
+
+STUB_BLENDER = f'"{sys.executable}" "{os.path.join(BENCH_DIR, "stub_blender.py")}"'
+
+
+def make_library(input_dir, take_count, skeleton_count, seed=0):
+    """
+    Takes Start with one of a few Skeleton Headers followed by Take-Specific Data
+    """
+    rng = random.Random(seed)
+    skeletons = [rng.randbytes(4096) for _ in range(skeleton_count)]
+    for index in range(take_count):
+        with open(os.path.join(input_dir, f"take_{index:04d}.fbx"), "wb") as fbx_file:
+            fbx_file.write(skeletons[index % skeleton_count] + rng.randbytes(60 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--takes", type=int, default=40)
+    parser.add_argument("--skeletons", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    real_script_version = prep_cache.script_version
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = os.path.join(temp_dir, "in")
+        os.makedirs(input_dir)
+        make_library(input_dir, args.takes, args.skeletons)
+        input_hits = {}
+        for label in ("first run", "nightly re-run", "after a script change"):
+            print(f"--- {label}")
+            if label == "after a script change":
+                # Scripts Edited since the Memos were Written (Only the Batch sees the New Version here,
+                # the Stub Workers still Key Outputs by the Real One)
+                prep_cache.script_version = lambda: "edited" + real_script_version()
+            output_dir = os.path.join(temp_dir, label.replace(" ", "_"))
+            report_path = os.path.join(temp_dir, label.replace(" ", "_") + ".json")
+            batch_prepare.main([input_dir, output_dir, "--blender", STUB_BLENDER, "--workers", str(args.workers),
+                                "--cache-dir", os.path.join(temp_dir, "cache"), "--report", report_path])
+            with open(report_path) as report_file:
+                input_hits[label] = json.load(report_file)["cache"]["batch"]["input_hits"]
+        prep_cache.script_version = real_script_version
+
+    ok = (input_hits["first run"] == 0 and input_hits["nightly re-run"] == args.takes
+          and input_hits["after a script change"] == 0)
+    print(f"Input Memo Served the Re-Run and Missed after the Script Change: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Micro-Benchmark the Compiled Bone-to-Chain Index against the Linear Chain Scan
+
+Resolves synthetic bone names with the original linear ``startswith`` scan over the
+chain table and with ChainIndex (cold trie walks, and memoized lookups timed after a
+warm-up pass, best of five), and checks that both agree.
+
+    python Benchmark/bench_chain_index.py --names 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import synthetic
+from skeletal_mesh_preparation import SKP_CHAIN_TABLES, ChainIndex
+
+
+def linear_find(chains, strip_prefix, bone_name):
+    """
+    The Original Lookup: Split the Prefix and Scan every Chain with startswith
+    """
+    if strip_prefix:
+        prefixes = bone_name.split("_")
+        if len(prefixes) > 1:
+            bone_name = prefixes[-1]
+    for key, value in chains.items():
+        if any(bone_name.startswith(core_name) for core_name in value["bones"]):
+            return key
+    return "Default"
+
+
+def make_names(count, seed=0):
+    """
+    Synthetic Bone Names across several Performers (Repeated Names like a Multi-Take Batch)
+    """
+    rng = random.Random(seed)
+    fingers = [f"{side}Hand{finger}{joint}" for side in ("Left", "Right")
+               for finger in ("Thumb", "Index", "Middle", "Ring", "Pinky") for joint in (1, 2, 3)]
+    pool = [name for name, _ in synthetic.bone_names(len(synthetic.MOTIVE_BONES))] + \
+        [f"Skeleton_{finger}" for finger in fingers]
+    names = []
+    for _ in range(count):
+        name = rng.choice(pool)
+        names.append(name.replace("Skeleton", f"Actor{rng.randrange(50):02d}"))
+    return names
+
+
+def time_lookups(lookup, names):
+    start = time.perf_counter()
+    results = [lookup(name) for name in names]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--names", type=int, default=10000)
+    parser.add_argument("--table", default="OPTITRACK_FINGERS", choices=sorted(SKP_CHAIN_TABLES))
+    args = parser.parse_args()
+
+    table = SKP_CHAIN_TABLES[args.table]
+    names = make_names(args.names)
+
+    linear_seconds, expected = time_lookups(
+        lambda name: linear_find(table["chains"], table["strip_prefix"], name), names)
+    start = time.perf_counter()
+    chain_index = ChainIndex(table["chains"], strip_prefix=table["strip_prefix"])
+    compile_seconds = time.perf_counter() - start
+    cold_seconds, cold = time_lookups(chain_index.match, names)
+    # Warm the Memo first, so the Memoized Pass Times only Hits
+    _, warm = time_lookups(chain_index.find, names)
+    warm_seconds = min(time_lookups(chain_index.find, names)[0] for _ in range(5))
+
+    for label, seconds in (("linear scan", linear_seconds), ("trie walk", cold_seconds), ("memoized", warm_seconds)):
+        print(f"{label:>11}: {seconds * 1e9 / len(names):8.1f} ns/bone")
+    print(f"    compile: {compile_seconds * 1e6:8.1f} us ({len(table['chains'])} chains)")
+    identical = expected == cold == warm
+    print(f"Identical Chains: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Benchmark the FBX Folder to Retargeters Pipeline against Scripting each Stage per Asset (Mocked unreal)
+
+Writes a Blender batch output folder of fake FBX files (two capture sessions and one
+broken file), then takes it to retargeters for two UE5 target characters: once importing
+one file per call, saving each asset and re-querying the asset registry between stages,
+and once with auto_fbx_folder_to_rtgs. Prints simulated editor time, import calls,
+registry queries and the pipeline's stage timings, checks both produce the same assets,
+and re-runs the pipeline on the unchanged folder to check rigs and retargeters are reused.
+
+    python Benchmark/bench_fbx_pipeline.py --files 40
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Unreal")]
+
+import unreal
+import synthetic
+from automate_asset import (auto_fbx_folder_to_rtgs, auto_ikr_to_rtg, auto_skm_to_ikr, build_fbx_import_task,
+                            find_ik_rigs, find_skeletal_meshes)
+from bench_rtg_matrix import FINGER_CHAINS, MANNY_CHAINS, make_target
+
+DESTINATION_PATH = "/Game/Mocap/Performers"
+TARGET_PATH = "/Game/Characters"
+
+
+def write_output_folder(output_dir, file_count):
+    """
+    Blender Batch Output: Prepared Performers Split over two Session Folders, plus one Broken File
+    """
+    bone_names = [name for name, _ in synthetic.MOTIVE_BONES]
+    for index in range(file_count):
+        session_dir = os.path.join(output_dir, f"Session{index % 2}")
+        os.makedirs(session_dir, exist_ok=True)
+        # Retargeters are Named by the IK Rig Name up to its Next Underscore: one Name per Performer
+        with open(os.path.join(session_dir, f"Actor{index:03d}.fbx"), "w") as fbx_file:
+            json.dump({"bones": bone_names}, fbx_file)
+    with open(os.path.join(output_dir, "Session0", "Broken.fbx"), "w") as fbx_file:
+        fbx_file.write("not an fbx")
+
+
+def make_targets():
+    unreal.reset_data()
+    make_target("Manny", MANNY_CHAINS + FINGER_CHAINS)
+    make_target("Quinn", MANNY_CHAINS + FINGER_CHAINS)
+    unreal.reset_stats()
+
+
+def per_asset(output_dir, rotator_source, rotator_target):
+    """
+    Baseline: one Import Call and Save per File, Re-Querying the Asset Registry between Stages
+    """
+    for root, _, files in os.walk(output_dir):
+        for name in sorted(files):
+            relative_dir = os.path.relpath(root, output_dir).replace(os.sep, "/")
+            task = build_fbx_import_task(os.path.join(root, name), f"{DESTINATION_PATH}/{relative_dir}")
+            task.set_editor_property("save", True)
+            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+            unreal.EditorAssetLibrary.save_loaded_assets(task.get_objects())
+    for skm in find_skeletal_meshes(DESTINATION_PATH):
+        auto_skm_to_ikr(skm)
+    for ikr_source in find_ik_rigs(DESTINATION_PATH):
+        for ikr_target in find_ik_rigs(TARGET_PATH):
+            auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target)
+
+
+def created_assets():
+    return sorted(path for path, asset in unreal._assets.items()
+                  if isinstance(asset, (unreal.SkeletalMesh, unreal.IKRigDefinition, unreal.IKRetargeter)))
+
+
+def summary(label, seconds):
+    stats = unreal.stats
+    print(f"{label:>16}: {stats.simulated_seconds:6.1f} s simulated, "
+          f"{stats.calls['AssetTools.import_asset_tasks']:3d} import calls, "
+          f"{stats.calls['AssetRegistry.get_assets']:3d} registry queries, {stats.save_calls:4d} save calls, "
+          f"{seconds * 1000:6.1f} ms wall")
+    return stats.simulated_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=40)
+    args = parser.parse_args()
+    rotator_source, rotator_target = unreal.Rotator(0, 0, 0), unreal.Rotator(0, 0, 90)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        write_output_folder(output_dir, args.files)
+
+        make_targets()
+        start = time.perf_counter()
+        per_asset(output_dir, rotator_source, rotator_target)
+        per_asset_simulated = summary("per asset", time.perf_counter() - start)
+        per_asset_created = created_assets()
+
+        make_targets()
+        start = time.perf_counter()
+        report = auto_fbx_folder_to_rtgs(output_dir, TARGET_PATH, rotator_source, rotator_target, DESTINATION_PATH)
+        pipeline_simulated = summary("pipeline", time.perf_counter() - start)
+        pipeline_created = created_assets()
+        print("  stage timings: " + ", ".join(f"{stage} {seconds * 1000:.1f} ms"
+                                             for stage, seconds in report["timings"].items()))
+
+        unreal.reset_stats()
+        start = time.perf_counter()
+        rerun = auto_fbx_folder_to_rtgs(output_dir, TARGET_PATH, rotator_source, rotator_target, DESTINATION_PATH)
+        summary("pipeline (rerun)", time.perf_counter() - start)
+
+    ok = (per_asset_created == pipeline_created and len(report["imported"]) == args.files
+          and [os.path.basename(path) for path in report["failed_imports"]] == ["Broken.fbx"]
+          and len(report["retargeters"]["built"]) == 2 * args.files
+          and len(rerun["ik_rigs"]["skipped"]) == args.files and len(rerun["retargeters"]["skipped"]) == 2 * args.files)
+    print(f"{per_asset_simulated / pipeline_simulated:.1f}x less simulated editor time; "
+          f"Same Assets, Broken File Reported, Rerun Reused: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Benchmark Bulk IK Rig Generation against one auto_skm_to_ikr Call per Mesh (Mocked unreal)
+
+Registers a library of captured performers' skeletal meshes (one with extra finger bones),
+then builds their IK Rigs one call (and one save) per mesh, and with auto_skms_to_ikrs in
+one transaction and one bulk save, both from the spec and by cloning the IK Rig template.
+Prints recorded editor calls, undo transactions, save calls and simulated editor seconds,
+checks every path builds the same rigs, then re-runs the batch to check up-to-date rigs
+are skipped without loading them, only a re-imported mesh is rebuilt, and each mesh's
+bones are read once.
+
+    python Benchmark/bench_ikr_batch.py --meshes 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Unreal")]
+
+import unreal
+import synthetic
+from automate_asset import (IKR_SPEC, IKR_TEMPLATE_PATH, auto_skm_to_ikr, auto_skms_to_ikrs, find_skeletal_meshes,
+                            ikr_spec_hash)
+
+LIBRARY_PATH = "/Game/Mocap/Performers"
+
+
+def make_library(mesh_count, source_dir, mesh_prefix="SKM_"):
+    """
+    Register Performer Meshes (with Source FBX Files) under the Library Path and a Decoy Mesh outside it.
+    The Last Performer also has Finger Bones. Retargeters are Named by the IK Rig Name up to its Next
+    Underscore, so Retargeter Benchmarks Name the Meshes without a Prefix (mesh_prefix="").
+    """
+    unreal.reset_data()
+    bone_names = [name for name, _ in synthetic.MOTIVE_BONES]
+    for index in range(mesh_count):
+        source_file = os.path.join(source_dir, f"Actor{index:04d}.fbx")
+        with open(source_file, "wb") as fbx_file:
+            fbx_file.write(b"FBX")
+        fingers = ["LeftHandIndex1", "RightHandIndex1"] if index == mesh_count - 1 else []
+        unreal.add_skeletal_mesh(f"{LIBRARY_PATH}/Batch{index // 50:02d}/{mesh_prefix}Actor{index:04d}", bone_names + fingers,
+                                 [source_file])
+    unreal.add_skeletal_mesh("/Game/Characters/SKM_Manny", ["root", "pelvis"])
+
+
+def rig_snapshot(ikr):
+    """
+    Comparable Summary of an IK Rig's Solver, Goals, Bone Settings and Chains
+    """
+    solvers = [(solver.root_bone, solver.root_behavior, solver.allow_stretch) for solver in ikr._solvers]
+    settings = [sorted((bone, setting.rotation_stiffness, setting.use_preferred_angles, repr(setting.preferred_angles))
+                       for bone, setting in bone_settings.items()) for bone_settings in ikr._bone_settings]
+    goals = sorted((goal.goal_name, goal.bone_name) for goal in ikr._goals.values())
+    chains = sorted((chain.chain_name, chain.start_bone, chain.end_bone, chain.ik_goal_name)
+                    for chain in ikr._chains.values())
+    return solvers, settings, goals, chains, ikr._retarget_root, ikr._skeletal_mesh.get_path_name()
+
+
+def snapshots():
+    template_path = unreal._object_path(IKR_TEMPLATE_PATH)
+    return {path: rig_snapshot(asset) for path, asset in unreal._assets.items()
+            if isinstance(asset, unreal.IKRigDefinition) and path != template_path}
+
+
+def spec_rejected(**changes):
+    try:
+        ikr_spec_hash({**IKR_SPEC, **changes})
+    except ValueError:
+        return True
+    return False
+
+
+def summary(label, seconds):
+    stats = unreal.stats
+    print(f"{label:>16}: {stats.call_count:7d} calls, {stats.transactions:5d} transactions, "
+          f"{stats.save_calls:4d} save calls ({stats.packages_saved} packages), "
+          f"{stats.simulated_seconds:7.1f} s simulated, {seconds * 1000:7.1f} ms wall")
+    return stats.simulated_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meshes", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as source_dir:
+        make_library(args.meshes, source_dir)
+        start = time.perf_counter()
+        for skm in find_skeletal_meshes(LIBRARY_PATH):
+            auto_skm_to_ikr(skm)
+        per_mesh_simulated = summary("per mesh", time.perf_counter() - start)
+        per_mesh_rigs = snapshots()
+
+        make_library(args.meshes, source_dir)
+        start = time.perf_counter()
+        spec_report = auto_skms_to_ikrs(LIBRARY_PATH, template_path=None)
+        summary("batch (spec)", time.perf_counter() - start)
+        spec_rigs = snapshots()
+
+        make_library(args.meshes, source_dir)
+        start = time.perf_counter()
+        report = auto_skms_to_ikrs(LIBRARY_PATH)
+        batch_simulated = summary("batch (template)", time.perf_counter() - start)
+        batch_rigs = snapshots()
+        clones = unreal.stats.calls["EditorAssetLibrary.duplicate_asset"]
+
+        unreal.reset_stats()
+        start = time.perf_counter()
+        rerun = auto_skms_to_ikrs(LIBRARY_PATH)
+        summary("batch (rerun)", time.perf_counter() - start)
+        rerun_loads = unreal.stats.calls["EditorAssetLibrary.load_asset"]
+
+        # Re-Import one Performer from a Changed Source File
+        reimported = os.path.join(source_dir, "Actor0000.fbx")
+        os.utime(reimported, (time.time() + 60, time.time() + 60))
+        unreal.reset_stats()
+        start = time.perf_counter()
+        changed = auto_skms_to_ikrs(LIBRARY_PATH)
+        summary("batch (reimport)", time.perf_counter() - start)
+        bone_reads = unreal.stats.calls["AnimPoseExtensions.get_bone_names"]
+
+    invalid_specs = (spec_rejected(chains=IKR_SPEC["chains"] + [("Extra", "Hips", "Hips", "Missing_Goal")]),
+                     spec_rejected(goals=IKR_SPEC["goals"] * 2),
+                     spec_rejected(bone_settings=[("Spine", {"stiffness": 1})]))
+    print(f"Template Clones: {clones} of {args.meshes}, Invalid Specs Rejected: {all(invalid_specs)}, "
+          f"Rigs Loaded on Rerun: {rerun_loads}, Bone Reads on Reimport: {bone_reads}")
+    ok = (per_mesh_rigs == spec_rigs == batch_rigs and len(batch_rigs) == args.meshes
+          and len(spec_report["built"]) == len(report["built"]) == args.meshes and clones == args.meshes - 1
+          and all(invalid_specs)
+          and not rerun["built"] and len(rerun["skipped"]) == args.meshes and rerun_loads == 0
+          and bone_reads == args.meshes
+          and changed["built"] == [f"{LIBRARY_PATH}/Batch00/SKM_Actor0000.SKM_Actor0000"])
+    print(f"{per_mesh_simulated / batch_simulated:.1f}x less simulated editor time; "
+          f"Same Rigs, Up to Date Skipped, Re-Import Rebuilt: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Benchmark Incremental Re-Runs of SkeletalMeshPreparation on a Mocked bpy
+
+Runs the preparation on a synthetic rig, re-runs it unchanged, then moves one bone
+and re-runs again, reporting the time and the placeholders created/updated/deleted.
+Then strips the tags off one placeholder (as a run from before placeholders were tagged
+left it) and parents the user's own P_ objects to bones, and checks the re-run adopts
+the untagged placeholder but leaves the user's objects alone.
+
+    python Benchmark/bench_incremental.py --bones 100
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+from mathutils import Matrix
+
+import bpy
+import synthetic
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+
+def timed_run(smp, armature):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    return time.perf_counter() - start, dict(smp.placeholder_changes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=100)
+    parser.add_argument("--build-mode", default="DATA", choices=["OPERATOR", "DATA"])
+    parser.add_argument("--output-mode", default="OBJECTS", choices=["OBJECTS", "SKINNED"])
+    args = parser.parse_args()
+
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, args.bones)
+    smp = SkeletalMeshPreparation(mesh_size=2.0, armature_rename=True,
+                                  build_mode=args.build_mode, output_mode=args.output_mode)
+
+    runs = [("first run", timed_run(smp, armature)), ("unchanged", timed_run(smp, armature))]
+    moved_bone = armature.pose.bones[args.bones // 2]
+    moved_bone.matrix = moved_bone.matrix @ Matrix.Translation((0.0, 0.1, 0.0))
+    runs.append(("one bone moved", timed_run(smp, armature)))
+
+    # An Untagged Placeholder of an Earlier Run, and the User's own Objects Parented to Bones
+    if args.output_mode == "OBJECTS":
+        legacy = next(pobj for pobj in armature.children if pobj.get("skp_output") == "OBJECTS")
+        del legacy["skp_output"], legacy["skp_fingerprint"]
+    user_material = bpy.data.materials.new("M_Prop")
+    user_objects = []
+    for name, bone_name in (("P_Sword", armature.pose.bones[1].name), (f"P_{armature.pose.bones[2].name}", None)):
+        user_mesh = bpy.data.meshes.new(name)
+        user_mesh.materials.append(user_material)
+        user_object = bpy.data.objects.new(name, user_mesh)
+        user_object.parent, user_object.parent_type = armature, "BONE"
+        user_object.parent_bone = bone_name or armature.pose.bones[3].name
+        user_objects.append(user_object)
+    runs.append(("legacy + user", timed_run(smp, armature)))
+    user_kept = all(user_object.name in bpy.data.objects for user_object in user_objects)
+
+    for label, (seconds, changes) in runs:
+        summary = ", ".join(f"{count} {change}" for change, count in changes.items())
+        print(f"{label:>14}: {seconds * 1000:8.2f} ms ({summary})")
+    placeholder_count = len(smp.find_existing_placeholders(armature))
+    legacy_changes = runs[-1][1][1]
+    expected_count, expected_updated = ((len(armature.pose.bones), 1) if args.output_mode == "OBJECTS" else (1, 0))
+    ok = (placeholder_count == expected_count and user_kept and legacy_changes["updated"] == expected_updated
+          and legacy_changes["deleted"] == 0)
+    print(f"Placeholders after Re-Runs: {placeholder_count}; Untagged Placeholder Adopted, User Objects Kept: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark Shared-Mesh Instancing of Bone Placeholders on a Mocked bpy
+
+Reports mesh datablock count, primitive operator calls and an estimated FBX payload
+with and without ``mesh_instancing`` on a synthetic rig, in both build modes, and checks
+instanced placeholders are built without primitive operators and match across build
+modes. The FBX payload is estimated from the geometry written (the fake bpy does not
+write FBX); it is not a measured file size.
+
+    python Benchmark/bench_instancing.py --bones 1000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import bpy
+import synthetic
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+# Rough Binary FBX Sizes: a Model Node per Object and Double-Precision Geometry Arrays per Mesh
+FBX_MODEL_BYTES = 512
+FBX_GEOMETRY_HEADER_BYTES = 1024
+
+
+def estimate_fbx_bytes(objects):
+    """
+    Estimate the FBX Payload of Mesh Objects (Shared Geometry is Written Once)
+    """
+    meshes = {id(obj.data): obj.data for obj in objects}
+    total = FBX_MODEL_BYTES * len(objects)
+    for mesh in meshes.values():
+        corners = sum(len(face) for face in mesh.faces)
+        # Positions, Polygon Indices, Per-Corner Normals and UVs
+        total += FBX_GEOMETRY_HEADER_BYTES + len(mesh.co) * 24 + corners * (4 + 24 + 16)
+    return total
+
+
+def run(bone_count, mesh_instancing, mesh_primitive, build_mode):
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    bpy.reset_stats()
+    smp = SkeletalMeshPreparation(mesh_primitive=mesh_primitive, mesh_size=2.0,
+                                  build_mode=build_mode, mesh_instancing=mesh_instancing)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    elapsed = time.perf_counter() - start
+
+    placeholders = [obj for obj in bpy.data.objects if obj.name.startswith("P_")]
+    return {
+        "objects": len(placeholders),
+        "meshes": len(bpy.data.meshes),
+        "fbx_bytes": estimate_fbx_bytes(placeholders),
+        "primitive_ops": sum(count for name, count in bpy.stats.ops.items() if ".primitive_" in name),
+        "seconds": elapsed,
+        "placeholders": {obj.name: (np.asarray(obj.matrix_world), obj.data.name) for obj in placeholders},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=1000)
+    parser.add_argument("--primitive", default="CUBE", choices=["CUBE", "SPHERE"])
+    args = parser.parse_args()
+
+    instanced = {}
+    for build_mode in ("OPERATOR", "DATA"):
+        for mesh_instancing in (False, True):
+            result = run(args.bones, mesh_instancing, args.primitive, build_mode)
+            label = f"{build_mode} {'instanced' if mesh_instancing else 'unique'}"
+            print(f"{label:>18}: {result['objects']} objects, {result['meshes']} mesh datablocks, "
+                  f"{result['primitive_ops']} primitive ops, ~{result['fbx_bytes'] / 1024:.1f} KiB FBX (estimated), "
+                  f"{result['seconds'] * 1000:.1f} ms")
+            if mesh_instancing:
+                instanced[build_mode] = result
+
+    operator, data = instanced["OPERATOR"], instanced["DATA"]
+    ok = (operator["primitive_ops"] == 0 and operator["meshes"] == data["meshes"]
+          and operator["placeholders"].keys() == data["placeholders"].keys()
+          and all(np.allclose(matrix, data["placeholders"][name][0]) and mesh_name == data["placeholders"][name][1]
+                  for name, (matrix, mesh_name) in operator["placeholders"].items()))
+    print(f"Instanced without Primitive Operators, Same Placeholders in both Build Modes: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
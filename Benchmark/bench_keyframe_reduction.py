@@ -0,0 +1,145 @@
+"""
+Benchmark Error-Bounded Keyframe Reduction on a Mocked bpy
+
+Bakes a synthetic per-frame 120 Hz take (with capture jitter) onto a Motive rig, then
+reduces it at several tolerances, reporting key count, timing, the measured size of the
+FBX exported before and after (the fake exporter re-samples and simplifies the curves as
+Blender's does) and the largest location/rotation error of the reduced curves against
+the baked ones.
+The batched reduction is compared against reducing one channel group at a time.
+
+    python Benchmark/bench_keyframe_reduction.py --minutes 5
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+
+import bpy
+from bench_motive_csv import FRAME_RATE, basis_animation, make_rig
+from keyframe_reduction import (collect_channel_groups, decimate_action, decimate_channels, fcurve_metric,
+                                quaternion_angles)
+from motive_csv import bake_channels, ensure_action_fcurves
+
+TOLERANCES = [(0.0005, 0.1), (0.001, 0.25), (0.002, 0.5), (0.005, 1.0)]
+
+
+def bake_take(armature, frame_count, jitter=0.0002, seed=0):
+    """
+    Bake the Known Animation plus Capture Jitter on every Frame; Returns the Baked Curves by Data Path
+    """
+    times = np.arange(frame_count) / FRAME_RATE
+    locations, quaternions = basis_animation(times, len(armature.pose.bones), seed)
+    rng = np.random.default_rng(seed + 3)
+    locations[:, 0] += rng.normal(scale=jitter, size=locations[:, 0].shape)
+    quaternions += rng.normal(scale=jitter, size=quaternions.shape)
+    quaternions /= np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+    action = bpy.data.actions.new("SyntheticTake")
+    fcurves = ensure_action_fcurves(armature, action)
+    key_frames = 1 + times * FRAME_RATE
+    for bone_index, pose_bone in enumerate(armature.pose.bones):
+        data_path = f'pose.bones["{pose_bone.name}"]'
+        bake_channels(fcurves, data_path + ".location", pose_bone.name, key_frames, locations[:, bone_index])
+        bake_channels(fcurves, data_path + ".rotation_quaternion", pose_bone.name, key_frames,
+                      quaternions[:, bone_index])
+    return action, {(fcurve.data_path, fcurve.array_index): fcurve.keyframe_points.co.copy() for fcurve in fcurves}
+
+
+def restore(action, baked):
+    for fcurve in action.fcurves:
+        fcurve.keyframe_points.co = baked[(fcurve.data_path, fcurve.array_index)].copy()
+        fcurve.keyframe_points.interpolation = np.full(len(fcurve.keyframe_points.co), 1, dtype=np.int32)
+
+
+def max_errors(action, baked):
+    """
+    Largest Location Distance and Quaternion Angle (Degrees) of the Reduced Curves at every Baked Frame
+    """
+    properties = {}
+    for fcurve in action.fcurves:
+        frames, values = baked[(fcurve.data_path, fcurve.array_index)].T
+        co = fcurve.keyframe_points.co
+        properties.setdefault(fcurve.data_path, []).append((np.interp(frames, co[:, 0], co[:, 1]), values))
+    location_error = rotation_error = 0.0
+    for data_path, channels in properties.items():
+        reduced = np.stack([channel[0] for channel in channels], axis=-1)
+        original = np.stack([channel[1] for channel in channels], axis=-1).astype(np.float64)
+        if fcurve_metric(data_path) == "ROTATION":
+            reduced /= np.linalg.norm(reduced, axis=-1, keepdims=True)
+            original /= np.linalg.norm(original, axis=-1, keepdims=True)
+            rotation_error = max(rotation_error, float(quaternion_angles(reduced, original).max()))
+        else:
+            location_error = max(location_error, float(np.linalg.norm(reduced - original, axis=-1).max()))
+    return location_error, rotation_error
+
+
+def per_group_seconds(action, location_tolerance, rotation_tolerance):
+    """
+    Baseline: the same Reduction Run one Channel Group at a Time
+    """
+    tolerances = {"LOCATION": location_tolerance, "ROTATION": rotation_tolerance}
+    start = time.perf_counter()
+    for (metric, _, _), groups in collect_channel_groups(action.fcurves).items():
+        for _, group_keys in groups:
+            frames = group_keys[0][None, :, 0].astype(np.float64)
+            values = np.stack([channel_keys[:, 1] for channel_keys in group_keys], axis=-1)[None].astype(np.float64)
+            decimate_channels(frames, values, tolerances[metric], metric)
+    return time.perf_counter() - start
+
+
+def exported_bytes(path, simplify_factor):
+    """
+    Size of the Scene Exported with Baked Animation at the Simplify Factor
+    """
+    bpy.ops.export_scene.fbx(filepath=path, bake_anim=True, bake_anim_simplify_factor=simplify_factor)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--jitter", type=float, default=0.0002, help="Capture Noise (Meters / Quaternion Units)")
+    args = parser.parse_args()
+
+    armature = make_rig()
+    frame_count = int(args.minutes * 60 * FRAME_RATE)
+    action, baked = bake_take(armature, frame_count, jitter=args.jitter)
+    print(f"Baked {frame_count} frames x {len(armature.pose.bones)} bones "
+          f"({sum(len(co) for co in baked.values())} keys)")
+
+    temp_dir = tempfile.TemporaryDirectory()
+    fbx_path = os.path.join(temp_dir.name, "take.fbx")
+    bytes_before = exported_bytes(fbx_path, 1.0)
+    print(f"Exported without reduction: {bytes_before / 1e6:.1f} MB")
+
+    failures = 0
+    for location_tolerance, rotation_tolerance in TOLERANCES:
+        restore(action, baked)
+        baseline_seconds = per_group_seconds(action, location_tolerance, rotation_tolerance)
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = decimate_action(action, location_tolerance=location_tolerance,
+                                    rotation_tolerance=rotation_tolerance)
+        location_error, rotation_error = max_errors(action, baked)
+        bytes_after = exported_bytes(fbx_path, stats["fbx_simplify_factor"])
+        failures += location_error > location_tolerance * 1.001 or rotation_error > rotation_tolerance * 1.001
+        print(f"tol {location_tolerance * 1000:4.1f} mm / {rotation_tolerance:4.2f} deg: "
+              f"{stats['keys_after']:8d} keys ({stats['key_ratio'] * 100:5.1f}%), "
+              f"FBX {bytes_after / 1e6:5.1f} MB ({bytes_after / bytes_before * 100:5.1f}%, "
+              f"factor {stats['fbx_simplify_factor']:.2f}), "
+              f"{stats['seconds']:5.2f} s (per group {baseline_seconds:5.2f} s), "
+              f"max err {location_error * 1000:.3f} mm / {rotation_error:.3f} deg")
+    temp_dir.cleanup()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
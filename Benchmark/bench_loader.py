@@ -0,0 +1,147 @@
+"""
+Benchmark the Change-Aware Unreal Script Loader (Mocked unreal)
+
+Copies the Unreal scripts and Common into a temporary project beside a set of synthetic
+automation modules importing them, then times loading, re-running with nothing changed,
+saving a file unchanged, editing one automation module and editing the shared
+pipeline_trace, against reloading every module each run. Checks only changed modules
+and their importers are reloaded, dependencies first, that the loader finds the scripts
+under the project when run without a file, and that the IK Rig spec is validated once.
+
+    python Benchmark/bench_loader.py --modules 40
+"""
+import argparse
+import contextlib
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes")]
+
+import unreal
+
+HELPER_SOURCE = '''import pipeline_trace
+from automate_asset import IKR_SPEC, console_log
+
+@pipeline_trace.traced()
+def helper_{index}(skm):
+    console_log(message="Helper {index}", indexer="Helper-Python")
+    return [chain[0] for chain in IKR_SPEC["chains"]]
+'''
+
+
+def make_project(project_dir, module_count):
+    """
+    Project with the Pipeline's Unreal and Common Folders, plus Synthetic Automation Modules
+    """
+    unreal_dir = os.path.join(project_dir, "OptiSkelUE5Pipe", "Unreal")
+    common_dir = os.path.join(project_dir, "OptiSkelUE5Pipe", "Common")
+    os.makedirs(unreal_dir)
+    os.makedirs(common_dir)
+    for name in ("loader.py", "automate_asset.py"):
+        shutil.copy(os.path.join(REPO_DIR, "Unreal", name), unreal_dir)
+    shutil.copy(os.path.join(REPO_DIR, "Common", "pipeline_trace.py"), common_dir)
+    helpers = [f"auto_helper_{index:03d}" for index in range(module_count)]
+    for index, helper in enumerate(helpers):
+        with open(os.path.join(unreal_dir, helper + ".py"), "w") as helper_file:
+            helper_file.write(HELPER_SOURCE.format(index=index))
+    return unreal_dir, common_dir, helpers
+
+
+def edit(path):
+    with open(path, "a") as source_file:
+        source_file.write("\n# Edited\n")
+
+
+def touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def reload_all(module_names):
+    """
+    Previous Workflow: Reload every Module on every Run
+    """
+    start = time.perf_counter()
+    for module_name in module_names:
+        importlib.reload(sys.modules[module_name])
+    return time.perf_counter() - start
+
+
+def find_without_file(loader_path):
+    """
+    Script Directory the Loader Finds when its Source is Run without a File (e.g. in the Python Console)
+    """
+    namespace = {"__name__": "console"}
+    with open(loader_path) as loader_file:
+        exec(compile(loader_file.read(), "<console>", "exec"), namespace)
+    return namespace["find_script_dir"]()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=40, help="Synthetic Automation Modules")
+    args = parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as project_dir:
+        unreal_dir, common_dir, helpers = make_project(project_dir, args.modules)
+        unreal.project_dir = project_dir
+        sys.path.insert(0, unreal_dir)
+        import loader
+        entry_modules = ["automate_asset"] + helpers
+        all_modules = ["pipeline_trace"] + entry_modules
+        automate_asset_path = os.path.join(unreal_dir, "automate_asset.py")
+        trace_path = os.path.join(common_dir, "pipeline_trace.py")
+
+        scenarios = [
+            ("first load", None, []),
+            ("no changes", None, []),
+            ("saved unchanged", lambda: touch(automate_asset_path), []),
+            ("edit one module", lambda: edit(os.path.join(unreal_dir, helpers[0] + ".py")), [helpers[0]]),
+            ("edit it again", lambda: edit(os.path.join(unreal_dir, helpers[0] + ".py")), [helpers[0]]),
+            ("edit automate_asset", lambda: edit(automate_asset_path), entry_modules),
+            ("edit pipeline_trace", lambda: edit(trace_path), all_modules),
+        ]
+        for label, change, expected in scenarios:
+            if change is not None:
+                change()
+            report = loader.load(entry_modules)
+            ok &= report["reloaded"] == expected and list(report["modules"]) == entry_modules
+            print(f"{label:>20}: {report['seconds'] * 1000:8.2f} ms, reloaded {len(report['reloaded']):3d} "
+                  + (f"({', '.join(report['reloaded'][:3])}{', ...' if len(report['reloaded']) > 3 else ''})"
+                     if report["reloaded"] else ""))
+        print(f"{'reload all':>20}: {min(reload_all(all_modules) for _ in range(3)) * 1000:8.2f} ms, "
+              f"reloaded {len(all_modules):3d}")
+
+        found_dir = find_without_file(os.path.join(unreal_dir, "loader.py"))
+        ok &= os.path.samefile(found_dir, unreal_dir)
+        print(f"Without a file, found the scripts at {os.path.relpath(found_dir, project_dir)}")
+
+        automate_asset = sys.modules["automate_asset"]
+        validations = []
+        validate = automate_asset.validate_ikr_spec
+        automate_asset.validate_ikr_spec = lambda spec: validations.append(spec) or validate(spec)
+        cached = timeit.timeit(lambda: automate_asset.ikr_spec_hash(automate_asset.IKR_SPEC), number=2000) / 2000
+        automate_asset._ikr_spec_hashes.clear()
+        uncached = timeit.timeit(lambda: (automate_asset._ikr_spec_hashes.clear(),
+                                          automate_asset.ikr_spec_hash(automate_asset.IKR_SPEC)), number=2000) / 2000
+        automate_asset.validate_ikr_spec = validate
+        ok &= len(validations) == 2000
+        print(f"IK Rig spec hash: {cached * 1e6:.1f} us cached, {uncached * 1e6:.1f} us validated and hashed")
+
+        with contextlib.suppress(ValueError):
+            sys.path.remove(unreal_dir)
+
+    print(f"Only Changed Modules and their Importers Reloaded, Dependencies First, Scripts Found: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
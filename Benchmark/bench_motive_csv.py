@@ -0,0 +1,204 @@
+"""
+Benchmark Streaming Motive CSV Ingestion and Bulk Keyframe Baking on a Mocked bpy
+
+Writes a synthetic 120 Hz Motive CSV take (Global Quaternions, one occlusion gap and a
+Bone Marker column set) from a known pose-bone animation, bakes it with motive_csv.py
+and checks the baked keys against that animation.
+
+    python Benchmark/bench_motive_csv.py --minutes 1
+    python Benchmark/bench_motive_csv.py --minutes 60 --chunk-frames 8192
+"""
+import argparse
+import contextlib
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+from mathutils import Matrix
+
+import bpy
+import synthetic
+from motive_csv import (MOTIVE_CSV_BONE_MAP, MOTIVE_TO_BLENDER_AXES, bake_motive_csv, matrices_to_quaternions,
+                        quaternions_to_matrices, read_rest_pose)
+
+FRAME_RATE = 120.0
+GAP_BONE = "LeftHand"
+GAP_FRAMES = (200, 260)
+
+
+def make_rig(seed=0):
+    """
+    Synthetic Motive Rig with Rotated Rest Bones and a Rotated Armature Object
+    """
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, len(synthetic.MOTIVE_BONES), seed=seed)
+    rng = np.random.default_rng(seed)
+    for bone in armature.data.bones:
+        rotation = quaternions_to_matrices(rng.normal(size=4))
+        rest = np.asarray(bone.matrix_local)
+        rest[:3, :3] = rotation
+        bone.matrix_local = Matrix(rest)
+    armature_matrix = np.eye(4)
+    armature_matrix[:3, :3] = quaternions_to_matrices(np.array([math.cos(0.35), 0.0, 0.0, math.sin(0.35)]))
+    armature_matrix[:3, 3] = (1.0, -2.0, 0.0)
+    armature.matrix_basis = Matrix(armature_matrix)
+    return armature
+
+
+def basis_animation(times, bone_count, seed=0):
+    """
+    Known Pose-Bone Basis Locations (F, B, 3) and WXYZ Quaternions (F, B, 4)
+    """
+    rng = np.random.default_rng(seed + 1)
+    axes = rng.normal(size=(bone_count, 3))
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+    frequencies = rng.uniform(0.1, 1.5, bone_count)
+    phases = rng.uniform(0, 2 * math.pi, bone_count)
+    half_angles = 0.5 * 1.2 * np.sin(2 * math.pi * frequencies * times[:, None] + phases)
+    quaternions = np.concatenate([np.cos(half_angles)[..., None], np.sin(half_angles)[..., None] * axes], axis=-1)
+    locations = np.zeros((len(times), bone_count, 3))
+    locations[:, 0] = 0.5 * np.stack([np.sin(times), np.cos(times), 0.2 * np.sin(3 * times)], axis=-1)
+    return locations, quaternions
+
+
+def forward_kinematics(locations, quaternions, rest_matrices, parent_indices, armature_matrix_world):
+    """
+    World Matrices (F, B, 4, 4) of a Basis Animation (Parents before Children)
+    """
+    frame_count, bone_count = quaternions.shape[:2]
+    basis = np.zeros((frame_count, bone_count, 4, 4))
+    basis[..., :3, :3] = quaternions_to_matrices(quaternions)
+    basis[..., :3, 3] = locations
+    basis[..., 3, 3] = 1.0
+    pose = np.empty_like(basis)
+    for bone_index, parent_index in enumerate(parent_indices):
+        if parent_index < 0:
+            pose[:, bone_index] = rest_matrices[bone_index] @ basis[:, bone_index]
+        else:
+            rest_relative = np.linalg.inv(rest_matrices[parent_index]) @ rest_matrices[bone_index]
+            pose[:, bone_index] = pose[:, parent_index] @ rest_relative @ basis[:, bone_index]
+    return armature_matrix_world @ pose
+
+
+def write_take(path, armature, frame_count, chunk_frames=8192, seed=0):
+    """
+    Write a Motive CSV Take of the Known Animation (Random Quaternion Signs, one Occlusion Gap)
+    """
+    segments = {fbx_name: segment for segment, fbx_name in MOTIVE_CSV_BONE_MAP.items()}
+    bone_names = [pose_bone.name for pose_bone in armature.pose.bones]
+    csv_names = ["Skeleton:" + segments[name.split("_")[-1]] for name in bone_names]
+    rest_matrices, parent_indices = read_rest_pose(armature, bone_names)
+    armature_matrix_world = np.asarray(armature.matrix_world)
+    rest_world_rotations = (armature_matrix_world @ rest_matrices)[:, :3, :3]
+    axes = MOTIVE_TO_BLENDER_AXES
+    gap_bone = bone_names.index("Skeleton_" + GAP_BONE)
+    rng = np.random.default_rng(seed + 2)
+
+    metadata = ["Format Version", "1.23", "Take Name", "SyntheticTake",
+                "Capture Frame Rate", f"{FRAME_RATE:f}", "Export Frame Rate", f"{FRAME_RATE:f}",
+                "Total Frames in Take", str(frame_count), "Total Exported Frames", str(frame_count),
+                "Rotation Type", "Quaternion", "Length Units", "Meters", "Coordinate Space", "Global"]
+    columns = [(csv_name, "Bone", prop, axis) for csv_name in csv_names
+               for prop, axis_names in (("Rotation", "XYZW"), ("Position", "XYZ")) for axis in axis_names]
+    columns += [(csv_names[0] + "_Marker", "Bone Marker", "Position", axis) for axis in "XYZ"]
+
+    with open(path, "w", newline="") as csv_file:
+        csv_file.write(",".join(metadata) + "\n\n")
+        csv_file.write(",Type," + ",".join(column[1] for column in columns) + "\n")
+        csv_file.write(",Name," + ",".join(column[0] for column in columns) + "\n")
+        csv_file.write(",ID," + ",".join(str(index) for index in range(len(columns))) + "\n")
+        csv_file.write(",," + ",".join(column[2] for column in columns) + "\n")
+        csv_file.write("Frame,Time (Seconds)," + ",".join(column[3] for column in columns) + "\n")
+
+        for start in range(0, frame_count, chunk_frames):
+            frames = np.arange(start, min(start + chunk_frames, frame_count))
+            times = frames / FRAME_RATE
+            world = forward_kinematics(*basis_animation(times, len(bone_names), seed),
+                                       rest_matrices, parent_indices, armature_matrix_world)
+            motive_rotations = axes.T @ world[..., :3, :3] @ rest_world_rotations.transpose(0, 2, 1) @ axes
+            quaternions = matrices_to_quaternions(motive_rotations)
+            quaternions *= rng.choice([-1.0, 1.0], size=quaternions.shape[:2])[..., None]
+            positions = world[..., :3, 3] @ axes
+            transforms = np.concatenate([quaternions[..., [1, 2, 3, 0]], positions], axis=-1)
+            transforms[(frames >= GAP_FRAMES[0]) & (frames < GAP_FRAMES[1]), gap_bone] = np.nan
+            values = np.concatenate([frames[:, None], times[:, None], transforms.reshape(len(frames), -1),
+                                     positions[:, 0] + 0.05], axis=1)
+            text = io.StringIO()
+            np.savetxt(text, values, fmt=["%d", "%.6f"] + ["%.6f"] * (values.shape[1] - 2), delimiter=",")
+            csv_file.write(text.getvalue().replace("nan", ""))
+
+
+def check_take(armature, stats, frame_count, seed=0):
+    """
+    Largest Location and Rotation Error of the Baked Keys, and whether the Quaternions are Continuous
+    """
+    bone_names = [pose_bone.name for pose_bone in armature.pose.bones]
+    fcurves = armature.animation_data.action.fcurves
+    times = np.arange(frame_count) / FRAME_RATE
+    expected_locations, expected_quaternions = basis_animation(times, len(bone_names), seed)
+    gap_bone = bone_names.index("Skeleton_" + GAP_BONE)
+    # Occluded Frames Hold the Last Valid Frame
+    expected_locations[GAP_FRAMES[0]:GAP_FRAMES[1], gap_bone] = expected_locations[GAP_FRAMES[0] - 1, gap_bone]
+    expected_quaternions[GAP_FRAMES[0]:GAP_FRAMES[1], gap_bone] = expected_quaternions[GAP_FRAMES[0] - 1, gap_bone]
+
+    location_error = rotation_error = 0.0
+    continuous = True
+    for bone_index, bone_name in enumerate(bone_names):
+        data_path = f'pose.bones["{bone_name}"]'
+        locations = np.stack([fcurves.find(data_path + ".location", index=index).keyframe_points.co[:, 1]
+                              for index in range(3)], axis=-1)
+        quaternions = np.stack([fcurves.find(data_path + ".rotation_quaternion", index=index).keyframe_points.co[:, 1]
+                                for index in range(4)], axis=-1)
+        location_error = max(location_error, float(np.abs(locations - expected_locations[:, bone_index]).max()))
+        dots = np.abs(np.sum(quaternions * expected_quaternions[:, bone_index], axis=-1))
+        rotation_error = max(rotation_error, float(np.degrees(2 * np.arccos(np.clip(dots, 0, 1))).max()))
+        continuous &= bool((np.sum(quaternions[1:] * quaternions[:-1], axis=-1) >= 0).all())
+    return location_error, rotation_error, continuous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=1.0)
+    parser.add_argument("--chunk-frames", type=int, default=4096)
+    parser.add_argument("--keep", help="Write the Take here instead of a Temporary File")
+    args = parser.parse_args()
+
+    armature = make_rig()
+    frame_count = int(args.minutes * 60 * FRAME_RATE)
+    path = args.keep or os.path.join(tempfile.mkdtemp(prefix="motive_csv_"), "take.csv")
+
+    start = time.perf_counter()
+    write_take(path, armature, frame_count)
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"Wrote {frame_count} frames x {len(armature.pose.bones)} bones ({size_mb:.1f} MB) "
+          f"in {time.perf_counter() - start:.1f} s")
+
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = bake_motive_csv(path, armature, frame_start=1, chunk_frames=args.chunk_frames)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    location_error, rotation_error, continuous = check_take(armature, stats, frame_count)
+    total_seconds = stats["read_seconds"] + stats["bake_seconds"]
+    print(f"Read + Convert: {stats['read_seconds']:.2f} s, Bake: {stats['bake_seconds']:.2f} s, "
+          f"{stats['frames_per_second']:.0f} frames/s ({size_mb / total_seconds:.1f} MB/s)")
+    print(f"Projected 1 h @ 120 Hz: {60 * 60 * FRAME_RATE / stats['frames_per_second']:.1f} s, "
+          f"Peak Traced Memory: {peak_bytes / 1e6:.1f} MB")
+    print(f"Max Location Error: {location_error:.2e} m, Max Rotation Error: {rotation_error:.4f} deg, "
+          f"Continuous Quaternions: {continuous}")
+    if not args.keep:
+        os.remove(path)
+    return 0 if location_error < 1e-3 and rotation_error < 0.05 and continuous else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark the Live Motive Stream Preview over Localhost on a Mocked bpy
+
+Writes a synthetic 120 Hz Motive CSV take of a known animation, replays it over UDP with
+motive_live.py's replay server and previews it on the armature at 60 updates per second,
+once with a cheap apply and once with a simulated apply slower than the stream. Prints
+frames applied and dropped and the latency of applied frames, and checks the latency
+stays within the bound, every received frame is accounted for, and the armature holds
+the pose of the last applied frame. Also checks the preview runs on Blender's timer, and
+that a sender whose clock is an hour behind still has its fresh frames applied.
+
+    python Benchmark/bench_motive_live.py --seconds 5 --slow-apply-ms 25
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+
+import bpy
+from bench_motive_csv import FRAME_RATE, basis_animation, make_rig, write_take
+from motive_csv import quaternions_to_matrices
+from motive_live import LivePreview, decode_packet, encode_frame, format_stats, replay_take, run_offline
+
+
+def pose_error(armature, frame):
+    """
+    Largest Difference of the Armature's Basis Matrices from the Known Animation at the Frame's Take Time
+    (Bones Occluded in the Frame are Skipped)
+    """
+    expected_locations, expected_quaternions = basis_animation(np.array([frame.timestamp]),
+                                                               len(armature.pose.bones))
+    expected = np.tile(np.eye(4), (len(armature.pose.bones), 1, 1))
+    expected[:, :3, :3] = quaternions_to_matrices(expected_quaternions[0])
+    expected[:, :3, 3] = expected_locations[0]
+    basis = np.empty(len(armature.pose.bones) * 16, dtype=np.float32)
+    armature.pose.bones.foreach_get("matrix_basis", basis)
+    basis = basis.reshape(-1, 4, 4).transpose(0, 2, 1)
+    return float(np.abs(basis[frame.bone_ids] - expected[frame.bone_ids]).max())
+
+
+def accounted(stats):
+    """
+    Every Received Frame was Applied, Dropped or is still Buffered
+    """
+    dropped = sum(count for reason, count in stats["dropped"].items() if reason != "malformed")
+    return stats["received"] == stats["applied"] + dropped + stats["pending"]
+
+
+async def timer_preview(armature, take_path, seconds):
+    """
+    Preview Ticked through bpy.app.timers (the Fake Runs Timers when Asked)
+    """
+    preview = LivePreview(armature, port=0, fps=60)
+    preview.start()
+    replay = asyncio.ensure_future(replay_take(take_path, port=preview.receiver.port, seconds=seconds))
+    while not replay.done():
+        bpy.run_timers()
+        await asyncio.sleep(preview.interval)
+    bpy.run_timers()
+    registered = bpy.app.timers.is_registered(preview._tick)
+    preview.stop()
+    return preview.applied, registered and not bpy.app.timers.is_registered(preview._tick)
+
+
+def skewed_clock(bone_count, max_latency):
+    """
+    Frames from a Sender whose Clock is an Hour Behind: Fresh Frames are Applied with their Transit as
+    Latency, a Frame Left in the Buffer past the Bound is Dropped. Returns (Applied, Late, Latency ms)
+    """
+    preview = LivePreview(None, max_latency=max_latency)
+    preview.receiver.bone_names = [f"bone_{index}" for index in range(bone_count)]
+    positions, rotations = np.zeros((bone_count, 3)), np.tile([0.0, 0.0, 0.0, 1.0], (bone_count, 1))
+    start = time.time()
+    for index, transit in enumerate((0.002, 0.001, 0.004, 0.001)):
+        received = start - (3 - index) * 0.01
+        preview.ring.push(decode_packet(encode_frame(index, index / FRAME_RATE, positions, rotations,
+                                                     received - 3600.0 - transit), received)[1])
+        if index == 3:
+            time.sleep(2.0 * max_latency)
+        preview.update()
+    return preview.applied, preview.dropped["late"], max(preview.latencies) * 1000.0
+
+
+def packet_round_trip(bone_count):
+    """
+    Encode and Decode Microseconds per Frame, and whether an Occluded Bone is Left Out
+    """
+    rng = np.random.default_rng(0)
+    positions, rotations = rng.normal(size=(bone_count, 3)), rng.normal(size=(bone_count, 4))
+    positions[1] = np.nan
+    number = 2000
+    start = time.perf_counter()
+    for index in range(number):
+        packet = encode_frame(index, index / FRAME_RATE, positions, rotations)
+    encode_us = (time.perf_counter() - start) / number * 1e6
+    start = time.perf_counter()
+    for _ in range(number):
+        _, frame = decode_packet(packet)
+    decode_us = (time.perf_counter() - start) / number * 1e6
+    return encode_us, decode_us, 1 not in frame.bone_ids and np.allclose(frame.rotations[0], rotations[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--max-latency", type=float, default=0.1)
+    parser.add_argument("--slow-apply-ms", type=float, default=25.0, help="Simulated Apply Cost of the Slow Run")
+    args = parser.parse_args()
+
+    armature = make_rig()
+    encode_us, decode_us, round_trip = packet_round_trip(len(armature.pose.bones))
+    print(f"Packets of {len(armature.pose.bones)} bones: encode {encode_us:.1f} us, decode {decode_us:.1f} us")
+
+    ok = round_trip
+    with tempfile.TemporaryDirectory() as temp_dir:
+        take_path = os.path.join(temp_dir, "take.csv")
+        write_take(take_path, armature, int(math.ceil(args.seconds * FRAME_RATE)) + 1)
+
+        for label, apply_ms in (("cheap apply", 0.0), ("slow apply", args.slow_apply_ms)):
+            bpy.reset_stats()
+            preview = LivePreview(armature, port=0, fps=60.0, max_latency=args.max_latency)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats = asyncio.run(run_offline(take_path, preview, args.seconds, apply_seconds=apply_ms / 1000.0))
+            seconds = time.perf_counter() - start
+            error = pose_error(armature, preview.last_frame)
+            latency_ok = stats["latency_ms"]["p95"] <= args.max_latency * 1000.0
+            print(f"{label:>11} ({apply_ms:.0f} ms): sent {stats['sent']}, " + format_stats(stats)
+                  + f", {bpy.stats.tags} update tags in {seconds:.1f}s, pose error {error:.1e}")
+            ok &= (latency_ok and accounted(stats) and stats["applied"] > 0 and error < 1e-4
+                   and bpy.stats.tags == stats["applied"] and stats["received"] == stats["sent"])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            applied, timer_ok = asyncio.run(timer_preview(armature, take_path, 1.0))
+        print(f"Timer preview applied {applied} frames, registered and unregistered: {timer_ok}")
+        ok &= timer_ok and applied > 0
+
+    skew_applied, skew_late, skew_latency_ms = skewed_clock(len(armature.pose.bones), args.max_latency)
+    print(f"Sender clock an hour behind: {skew_applied} of 3 fresh frames applied (max latency "
+          f"{skew_latency_ms:.1f} ms), {skew_late} of 1 buffered past the bound dropped late")
+    ok &= skew_applied == 3 and skew_late == 1 and skew_latency_ms < args.max_latency * 1000.0
+
+    print(f"Latency within {args.max_latency * 1000:.0f} ms, Frames Accounted for, Pose Matches the Take: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark the PALETTE Coloring against per-Chain CHAIN Materials on a Crowd of Actors (Mocked bpy)
+
+Prepares a crowd of Motive rigs with each coloring method and output mode, and counts
+what UE5 gets from the exported FBX files: material assets, and draw calls, which are
+one per material section of each actor's skeletal mesh (UE merges an actor's placeholder
+meshes into one skeletal mesh, with one section per distinct material). Also checks that
+every palette UV lands on the pixel holding its chain's color, and that each CHAIN
+material's linear Base Color is that pixel's sRGB color decoded, so both methods render
+the same colors.
+
+    python Benchmark/bench_palette.py --actors 50 --chain-table OPTITRACK_FINGERS
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+
+import bpy
+import synthetic
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+
+def palette_matches(smp, mesh):
+    """
+    Check the Palette UVs Sample the same Color as the Mesh's Chain Color Attribute
+    """
+    image = bpy.data.images[smp.construct_palette_image_name()]
+    pixels = image.pixels.values.reshape(-1, 4)
+    uvs = mesh.uv_layers["UVMap"].data._arrays["uv"]
+    colors = mesh.color_attributes["ChainColor"].data._arrays["color_srgb"]
+    sampled = pixels[np.floor(uvs[:, 0] * image.size[0]).astype(int)]
+    return np.allclose(sampled, colors)
+
+
+def chain_colors_match(smp, chain_table):
+    """
+    Check each CHAIN Material's Base Color is its Chain's Palette Pixel Decoded from sRGB
+    """
+    chain_smp = SkeletalMeshPreparation(mesh_color_method="CHAIN", chain_table=chain_table)
+    with contextlib.redirect_stdout(io.StringIO()):
+        chain_smp.create_materials_skp_chain()
+    pixels = bpy.data.images[smp.construct_palette_image_name()].pixels.values.reshape(-1, 4)
+    return all(np.allclose(bpy.data.materials[chain_smp.construct_material_name(key)].node_tree.nodes[
+                               "Principled BSDF"].inputs["Base Color"].default_value[:3],
+                           SkeletalMeshPreparation.srgb_to_linear(pixels[index, :3]), atol=1e-6)
+               for index, key in enumerate(smp.get_palette_chains()))
+
+
+def run(mesh_color_method, output_mode, actor_count, bone_count, chain_table):
+    bpy.reset_data()
+    armatures = [synthetic.make_armature(bpy, bone_count, name=f"Actor{index:02d}", seed=index)
+                 for index in range(actor_count)]
+    smp = SkeletalMeshPreparation(mesh_size=2.0, mesh_color_method=mesh_color_method, build_mode="DATA",
+                                  mesh_instancing=True, output_mode=output_mode, chain_table=chain_table)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for armature in armatures:
+            smp.run(selected_armature=armature)
+    elapsed = time.perf_counter() - start
+
+    draw_calls = 0
+    palette_ok = True
+    for armature in armatures:
+        meshes = [child.data for child in armature.children if child.type == "MESH"]
+        draw_calls += len({material.name for mesh in meshes for material in mesh.materials})
+        if mesh_color_method == "PALETTE":
+            palette_ok &= all(palette_matches(smp, mesh) for mesh in meshes)
+    result = {
+        "materials": len(bpy.data.materials),
+        "textures": len(bpy.data.images),
+        "draw_calls": draw_calls,
+        "meshes": len(bpy.data.meshes),
+        "seconds": elapsed,
+        "palette_ok": palette_ok,
+    }
+    if mesh_color_method == "PALETTE":
+        result["palette_ok"] &= chain_colors_match(smp, chain_table)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actors", type=int, default=50)
+    parser.add_argument("--bones", type=int, default=len(synthetic.MOTIVE_BONES))
+    parser.add_argument("--chain-table", default="OPTITRACK")
+    args = parser.parse_args()
+
+    all_ok = True
+    for output_mode in ("OBJECTS", "SKINNED"):
+        results = {method: run(method, output_mode, args.actors, args.bones, args.chain_table)
+                   for method in ("CHAIN", "PALETTE")}
+        for method, result in results.items():
+            all_ok &= result["palette_ok"]
+            print(f"{output_mode:>7} {method:>7}: {result['materials']:3d} materials, {result['textures']} textures, "
+                  f"{result['draw_calls']:4d} draw calls for {args.actors} actors, {result['meshes']:4d} meshes, "
+                  f"{result['seconds'] * 1000:7.1f} ms")
+        chain, palette = results["CHAIN"], results["PALETTE"]
+        print(f"{output_mode:>7}: {chain['materials'] / palette['materials']:.0f}x fewer materials, "
+              f"{chain['draw_calls'] / palette['draw_calls']:.1f}x fewer draw calls")
+    print(f"Palette UVs Sample the Chain Colors, CHAIN Materials Match the Palette in Linear: {all_ok}")
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark the Placeholder Build Modes of SkeletalMeshPreparation on a Mocked bpy
+
+Counts operator calls and scene updates per bone for the OPERATOR and DATA build modes
+and checks that both modes produce identical placeholders.
+
+    python Benchmark/bench_placeholder.py --bones 50
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+
+import bpy
+import synthetic
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+
+def run_mode(build_mode, bone_count, mesh_primitive):
+    """
+    Run the Preparation once on a Fresh Synthetic Armature and Collect the Statistics
+    """
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    smp = SkeletalMeshPreparation(mesh_primitive=mesh_primitive, mesh_size=2.0, build_mode=build_mode)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    elapsed = time.perf_counter() - start
+
+    placeholders = {
+        obj.name: (np.asarray(obj.matrix_world), obj.data.co.copy(), obj.data.materials[0].name, obj.parent_bone)
+        for obj in bpy.data.objects if obj.name.startswith("P_")
+    }
+    return {
+        "seconds": elapsed,
+        "ops_per_bone": bpy.stats.op_calls / bone_count,
+        "updates_per_bone": bpy.stats.updates / bone_count,
+        "ops": dict(bpy.stats.ops),
+    }, placeholders
+
+
+def compare(reference, candidate):
+    """
+    Check Two Placeholder Sets are Identical (Names, World Matrices, Vertices, Materials, Parent Bones)
+    """
+    if reference.keys() != candidate.keys():
+        return False
+    for name, (matrix, verts, material, parent_bone) in reference.items():
+        other = candidate[name]
+        if not (np.allclose(matrix, other[0]) and np.allclose(verts, other[1])):
+            return False
+        if (material, parent_bone) != (other[2], other[3]):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=50)
+    parser.add_argument("--primitive", default="CUBE", choices=["CUBE", "SPHERE"])
+    args = parser.parse_args()
+
+    results = {}
+    for build_mode in ("OPERATOR", "DATA"):
+        results[build_mode] = run_mode(build_mode, args.bones, args.primitive)
+
+    for build_mode, (result, _) in results.items():
+        print(f"{build_mode:>8}: {result['ops_per_bone']:6.2f} ops/bone, "
+              f"{result['updates_per_bone']:6.2f} updates/bone, {result['seconds'] * 1000:8.2f} ms")
+    identical = compare(results["OPERATOR"][1], results["DATA"][1])
+    print(f"Identical Placeholders: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Benchmark the Source x Target Retargeter Matrix against one auto_ikr_to_rtg Call per Pair (Mocked unreal)
+
+Builds IK Rigs for a library of captured performers and a few UE5 target characters (two
+sharing the Manny chain layout, one without finger chains), then builds every retargeter
+one call (and one save) per pair, and with auto_ikrs_to_rtgs, which fuzzy maps chains once
+per topology pair. Prints recorded calls, simulated editor seconds and fuzzy mappings,
+checks both paths map the same chains, then re-runs the matrix to check unchanged pairs
+are skipped and only the pairs of a changed target are rebuilt, and that sources sharing a
+retargeter name (SKM_ meshes) fail after the first instead of overwriting it.
+
+    python Benchmark/bench_rtg_matrix.py --sources 50 --targets 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Unreal")]
+
+import unreal
+from automate_asset import auto_ikr_to_rtg, auto_ikrs_to_rtgs, auto_skms_to_ikrs, find_ik_rigs
+from bench_ikr_batch import LIBRARY_PATH, make_library, summary
+
+TARGET_PATH = "/Game/Characters"
+FINGER_CHAINS = [f"{side}{finger}" for side in ("Left", "Right")
+                 for finger in ("MiddleMetacarpal", "Middle", "PinkyMetacarpal", "Pinky", "RingMetacarpal", "Ring",
+                                "IndexMetacarpal", "Index", "Thumb")]
+MANNY_CHAINS = ["Root", "Spine", "Head", "Neck", "LeftClavicle", "RightClavicle", "LeftArm", "RightArm", "LeftLeg",
+                "RightLeg", "LeftIKArm", "RightIKArm", "LeftIKLeg", "RightIKLeg"]
+
+
+def make_target(name, chains):
+    """
+    UE5 Target Character Mesh and IK Rig with the given Retarget Chains
+    """
+    bone_names = ["root", "pelvis"] + [f"bone_{index:03d}" for index in range(88)]
+    skm = unreal.add_skeletal_mesh(f"{TARGET_PATH}/{name}/SKM_{name}", bone_names)
+    ikr = unreal.AssetToolsHelpers.get_asset_tools().create_asset(f"IKR_{name}", f"{TARGET_PATH}/{name}/Rigs",
+                                                                  unreal.IKRigDefinition, unreal.IKRigDefinitionFactory())
+    controller = unreal.IKRigController.get_controller(ikr)
+    controller.set_skeletal_mesh(skm)
+    controller.set_retarget_root("pelvis")
+    for chain in chains:
+        controller.add_retarget_chain(chain, "root", "root", "")
+    return ikr
+
+
+def make_scene(source_count, target_count, source_dir, mesh_prefix=""):
+    make_library(source_count, source_dir, mesh_prefix)
+    auto_skms_to_ikrs(LIBRARY_PATH)
+    layouts = [MANNY_CHAINS + FINGER_CHAINS, MANNY_CHAINS + FINGER_CHAINS, MANNY_CHAINS]
+    for index in range(target_count):
+        make_target(f"Target{index:02d}", layouts[index % len(layouts)])
+    unreal.reset_stats()
+    return find_ik_rigs(LIBRARY_PATH), find_ik_rigs(TARGET_PATH)
+
+
+def chain_maps():
+    return {path: dict(asset._chain_map) for path, asset in unreal._assets.items()
+            if isinstance(asset, unreal.IKRetargeter)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", type=int, default=50)
+    parser.add_argument("--targets", type=int, default=3)
+    args = parser.parse_args()
+    rotator_source, rotator_target = unreal.Rotator(0, 0, 0), unreal.Rotator(0, 0, 90)
+    pair_count = args.sources * args.targets
+
+    with tempfile.TemporaryDirectory() as source_dir:
+        sources, targets = make_scene(args.sources, args.targets, source_dir)
+        start = time.perf_counter()
+        for ikr_source in sources:
+            for ikr_target in targets:
+                auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target)
+        per_pair_simulated = summary("per pair", time.perf_counter() - start)
+        per_pair_fuzzy = unreal.stats.calls["IKRetargeterController.auto_map_chains"]
+        per_pair_maps = chain_maps()
+
+        sources, targets = make_scene(args.sources, args.targets, source_dir)
+        start = time.perf_counter()
+        report = auto_ikrs_to_rtgs(LIBRARY_PATH, TARGET_PATH, rotator_source, rotator_target)
+        matrix_simulated = summary("matrix", time.perf_counter() - start)
+        matrix_fuzzy = unreal.stats.calls["IKRetargeterController.auto_map_chains"]
+        matrix_maps = chain_maps()
+
+        unreal.reset_stats()
+        start = time.perf_counter()
+        rerun = auto_ikrs_to_rtgs(LIBRARY_PATH, TARGET_PATH, rotator_source, rotator_target)
+        summary("matrix (rerun)", time.perf_counter() - start)
+        rerun_loads = unreal.stats.calls["EditorAssetLibrary.load_asset"]
+
+        # One Target Character Gains a Chain
+        unreal.IKRigController.get_controller(targets[0]).add_retarget_chain("Tail", "root", "root", "")
+        unreal.reset_stats()
+        start = time.perf_counter()
+        changed = auto_ikrs_to_rtgs(LIBRARY_PATH, TARGET_PATH, rotator_source, rotator_target)
+        summary("matrix (changed)", time.perf_counter() - start)
+
+        # IK Rigs of SKM_<Actor> Meshes all Name the Retargeter RTG_SKM-<Target>: the First Pair is Built
+        make_scene(3, 1, source_dir, mesh_prefix="SKM_")
+        shared = auto_ikrs_to_rtgs(LIBRARY_PATH, TARGET_PATH, rotator_source, rotator_target)
+        shared_ok = (shared["built"] == [f"{LIBRARY_PATH}/Batch00/Rigs/Retargets/RTG_SKM-Target00"]
+                     and shared["failed"] == shared["built"] * 2)
+
+    timings = sorted(report["timings"].values())
+    print(f"Fuzzy Mappings: {per_pair_fuzzy} per pair, {matrix_fuzzy} matrix for {pair_count} retargeters; "
+          f"per-Retargeter median {timings[len(timings) // 2] * 1000:.2f} ms, max {timings[-1] * 1000:.2f} ms wall")
+    ok = (per_pair_maps == matrix_maps and len(matrix_maps) == pair_count and len(report["built"]) == pair_count
+          and matrix_fuzzy == report["chain_mappings_computed"] == min(args.targets, 2)
+          and not rerun["built"] and len(rerun["skipped"]) == pair_count and rerun_loads == 0
+          and len(changed["built"]) == args.sources and changed["chain_mappings_computed"] == 1
+          and all(rtg_path.endswith("-Target00") for rtg_path in changed["built"]) and shared_ok)
+    print(f"Retargeters Loaded on Rerun: {rerun_loads}; Shared Retargeter Name: {len(shared['built'])} built, {len(shared['failed'])} failed")
+    print(f"{per_pair_simulated / matrix_simulated:.1f}x less simulated editor time; "
+          f"Same Chain Maps, Unchanged Skipped, Changed Target Rebuilt, Shared Name not Overwritten: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
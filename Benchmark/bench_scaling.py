@@ -0,0 +1,254 @@
+"""
+Scalability Benchmark of both Pipeline Stages against a Stored Baseline (Mocked bpy and unreal)
+
+Runs SkeletalMeshPreparation.run on synthetic armatures of 20 to 5000 bones (per build and
+output mode), and auto_skm_to_ikr and auto_ikr_to_rtg (one call per asset, and their batch
+counterparts) on performer libraries of 1 to 1000 meshes. Prints the scaling curves of wall
+time, calls per bone and calls per asset with the fitted growth exponent of each curve, then
+compares every point with the baseline and fails on regressions beyond the thresholds.
+Call counts and simulated editor seconds are deterministic; wall times only fail past the
+(looser) wall threshold and a few milliseconds, as they depend on the machine.
+
+    python Benchmark/bench_scaling.py                      # Compare with the Baseline
+    python Benchmark/bench_scaling.py --quick              # Smaller Sizes, Compared where the Baseline has them
+    python Benchmark/bench_scaling.py --update-baseline    # Store this Run as the Baseline
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender"),
+                os.path.join(BENCH_DIR, "..", "Unreal")]
+
+import bpy
+import unreal
+import synthetic
+from automate_asset import (auto_ikr_to_rtg, auto_ikrs_to_rtgs, auto_skm_to_ikr, auto_skms_to_ikrs, find_ik_rigs,
+                            find_skeletal_meshes)
+from bench_ikr_batch import LIBRARY_PATH, make_library
+from bench_rtg_matrix import FINGER_CHAINS, MANNY_CHAINS, TARGET_PATH, make_target
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baselines", "scaling.json")
+
+BONE_COUNTS = [20, 100, 500, 1000, 2000, 5000]
+LIBRARY_SIZES = [1, 10, 100, 1000]
+QUICK_BONE_COUNTS = [20, 100, 500]
+QUICK_LIBRARY_SIZES = [1, 10, 100]
+
+# SkeletalMeshPreparation Options per Curve, and the Largest Armature each is Run on
+# (Operator Placement Grows Quadratically: every select_all Visits every Object)
+SMP_CURVES = {
+    "smp.DATA": ({"build_mode": "DATA"}, 5000),
+    "smp.DATA.SKINNED": ({"build_mode": "DATA", "output_mode": "SKINNED"}, 5000),
+    "smp.OPERATOR": ({"build_mode": "OPERATOR"}, 1000),
+}
+
+# Machine-Dependent Metrics, Compared with the Looser Wall Threshold (every Metric is Lower-is-Better)
+WALL_METRICS = ("seconds",)
+
+
+def best_of(measure, *args, repeat=3, budget=2.0):
+    """
+    Run a Measurement of {Curve: Metrics} up to Repeat Times (Fewer once the Budget in Seconds
+    is Spent), Keeping each Curve's Fastest Run
+    """
+    best, spent = {}, 0.0
+    for _ in range(repeat):
+        gc.collect()
+        for name, metrics in measure(*args).items():
+            spent += metrics["seconds"]
+            if name not in best or metrics["seconds"] < best[name]["seconds"]:
+                best[name] = metrics
+        if spent > budget:
+            break
+    return best
+
+
+def measure_smp(name, prep_options, bone_count):
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    bpy.reset_stats()
+    smp = SkeletalMeshPreparation(mesh_size=2.0, **prep_options)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    return {name: {
+        "seconds": time.perf_counter() - start,
+        "calls_per_bone": bpy.stats.op_calls / bone_count,
+        "updates_per_bone": bpy.stats.updates / bone_count,
+    }}
+
+
+def asset_metrics(seconds, asset_count):
+    return {
+        "seconds": seconds,
+        "calls_per_asset": unreal.stats.call_count / asset_count,
+        "simulated_seconds_per_asset": unreal.stats.simulated_seconds / asset_count,
+    }
+
+
+def make_scene(mesh_count, source_dir):
+    make_library(mesh_count, source_dir, mesh_prefix="")
+    ikr_target = make_target("Manny", MANNY_CHAINS + FINGER_CHAINS)
+    unreal.reset_stats()
+    return ikr_target
+
+
+def measure_library(mesh_count, source_dir, rotator_source, rotator_target):
+    """
+    IK Rigs then Retargeters to one Target, one Call per Asset, then in Batch from a New Library
+    """
+    points = {}
+    ikr_target = make_scene(mesh_count, source_dir)
+    skms = find_skeletal_meshes(LIBRARY_PATH)
+    unreal.reset_stats()
+    start = time.perf_counter()
+    for skm in skms:
+        auto_skm_to_ikr(skm)
+    points["unreal.auto_skm_to_ikr"] = asset_metrics(time.perf_counter() - start, mesh_count)
+
+    ikr_sources = find_ik_rigs(LIBRARY_PATH)
+    unreal.reset_stats()
+    start = time.perf_counter()
+    for ikr_source in ikr_sources:
+        auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target)
+    points["unreal.auto_ikr_to_rtg"] = asset_metrics(time.perf_counter() - start, mesh_count)
+
+    make_scene(mesh_count, source_dir)
+    start = time.perf_counter()
+    auto_skms_to_ikrs(LIBRARY_PATH)
+    points["unreal.auto_skms_to_ikrs"] = asset_metrics(time.perf_counter() - start, mesh_count)
+
+    unreal.reset_stats()
+    start = time.perf_counter()
+    auto_ikrs_to_rtgs(LIBRARY_PATH, TARGET_PATH, rotator_source, rotator_target)
+    points["unreal.auto_ikrs_to_rtgs"] = asset_metrics(time.perf_counter() - start, mesh_count)
+    return points
+
+
+def run_suite(bone_counts, library_sizes, repeat):
+    """
+    Scaling Curves by Name: {Size: Metrics}
+    """
+    curves = {}
+    for name, (prep_options, max_bones) in SMP_CURVES.items():
+        curves[name] = {}
+        for bone_count in bone_counts:
+            if bone_count <= max_bones:
+                points = best_of(measure_smp, name, prep_options, bone_count, repeat=repeat)
+                curves[name][str(bone_count)] = points[name]
+
+    rotator_source, rotator_target = unreal.Rotator(0, 0, 0), unreal.Rotator(0, 0, 90)
+    with tempfile.TemporaryDirectory() as source_dir:
+        for mesh_count in library_sizes:
+            points = best_of(measure_library, mesh_count, source_dir, rotator_source, rotator_target, repeat=repeat)
+            for name, metrics in points.items():
+                curves.setdefault(name, {})[str(mesh_count)] = metrics
+    return curves
+
+
+def growth_exponent(points):
+    """
+    Least-Squares Slope of log(Wall Time) over log(Size): ~1 Linear, ~2 Quadratic
+    """
+    samples = [(math.log(int(size)), math.log(metrics["seconds"])) for size, metrics in points.items()
+               if metrics["seconds"] > 1e-3]
+    if len(samples) < 2:
+        return None
+    mean_x = sum(x for x, _ in samples) / len(samples)
+    mean_y = sum(y for _, y in samples) / len(samples)
+    variance = sum((x - mean_x) ** 2 for x, _ in samples)
+    return sum((x - mean_x) * (y - mean_y) for x, y in samples) / variance if variance else None
+
+
+def print_curves(curves):
+    for name, points in curves.items():
+        unit = "bones" if name.startswith("smp.") else "meshes"
+        exponent = growth_exponent(points)
+        print(f"{name} (wall time ~ {unit}^{exponent:.2f})" if exponent is not None else name)
+        for size, metrics in points.items():
+            per_unit = ", ".join(f"{metric} {value:.3f}" for metric, value in metrics.items() if metric != "seconds")
+            print(f"  {int(size):5d} {unit:<6}: {metrics['seconds'] * 1000:9.1f} ms wall, {per_unit}")
+
+
+def compare_with_baseline(curves, baseline, threshold, wall_threshold, wall_floor):
+    """
+    Regressions of every Point and Metric also in the Baseline, as Messages
+    """
+    regressions = []
+    for name, points in curves.items():
+        for size, metrics in points.items():
+            baseline_metrics = baseline.get(name, {}).get(size)
+            if baseline_metrics is None:
+                continue
+            for metric, value in metrics.items():
+                reference = baseline_metrics.get(metric)
+                if reference is None:
+                    continue
+                if metric in WALL_METRICS:
+                    regressed = value > reference * (1 + wall_threshold) and value - reference > wall_floor
+                else:
+                    regressed = value > reference * (1 + threshold) + 1e-9
+                if regressed:
+                    regressions.append(f"{name} @ {size}: {metric} {value:.4f} vs baseline {reference:.4f} "
+                                       f"({(value / reference - 1) * 100 if reference else math.inf:+.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="Run the Smaller Sizes only")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Store this Run as the Baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed Increase of Call Counts and Simulated Seconds (Fraction)")
+    parser.add_argument("--wall-threshold", type=float, default=1.0,
+                        help="Allowed Increase of Wall Time (Fraction, Machine Dependent)")
+    parser.add_argument("--wall-floor", type=float, default=0.005,
+                        help="Wall Time Increases below this many Seconds are Noise")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per Point (Fewer for Slow Points), Fastest Kept")
+    parser.add_argument("--output", default=None, help="Write the Curves of this Run as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    curves = run_suite(QUICK_BONE_COUNTS if args.quick else BONE_COUNTS,
+                       QUICK_LIBRARY_SIZES if args.quick else LIBRARY_SIZES, args.repeat)
+    print_curves(curves)
+    print(f"Suite ran in {time.perf_counter() - start:.1f}s")
+
+    result = {"python": platform.python_version(), "machine": platform.machine(), "curves": curves}
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(result, output_file, indent=2)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(result, baseline_file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No Baseline at {args.baseline} (Store one with --update-baseline)")
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)["curves"]
+    regressions = compare_with_baseline(curves, baseline, args.threshold, args.wall_threshold, args.wall_floor)
+    for regression in regressions:
+        print("REGRESSION " + regression)
+    print(f"{len(regressions)} Regressions against the Baseline "
+          f"(Threshold {args.threshold * 100:.0f}%, Wall Time {args.wall_threshold * 100:.0f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark the Single Skinned-Mesh Output against per-Bone Placeholder Objects on a Mocked bpy
+
+Checks that the skinned mesh, deformed by its armature, matches the placeholder objects
+and reports object, mesh section (draw call) and vertex counts for both outputs.
+
+    python Benchmark/bench_skinned.py --bones 50
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender")]
+
+import numpy as np
+
+import bpy
+import synthetic
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+
+def world_vertices(obj):
+    matrix = np.asarray(obj.matrix_world)
+    return obj.data.co @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def deformed_vertices(obj, armature):
+    """
+    Apply the Armature Modifier (Rigid 1.0 Weights) and the Armature's World Matrix
+    """
+    co = obj.data.co.copy()
+    armature_world = np.asarray(armature.matrix_world)
+    for group in obj.vertex_groups:
+        pose_bone = next(pb for pb in armature.pose.bones if pb.name == group.name)
+        deform = armature_world @ np.asarray(pose_bone.matrix) @ np.linalg.inv(np.asarray(pose_bone.bone.matrix_local))
+        indices = np.fromiter(group.weights.keys(), dtype=int)
+        co[indices] = obj.data.co[indices] @ deform[:3, :3].T + deform[:3, 3]
+    return co
+
+
+def run(output_mode, bone_count, mesh_primitive):
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    smp = SkeletalMeshPreparation(mesh_primitive=mesh_primitive, mesh_size=2.0,
+                                  build_mode="DATA", output_mode=output_mode)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    elapsed = time.perf_counter() - start
+
+    objects = [obj for obj in bpy.data.objects if obj.type == "MESH"]
+    if output_mode == "SKINNED":
+        vertices = deformed_vertices(objects[0], armature)
+    else:
+        vertices = np.vstack([world_vertices(obj) for obj in objects])
+    return {
+        "objects": len(objects),
+        "sections": sum(len(obj.data.materials) for obj in objects),
+        "vertices": len(vertices),
+        "seconds": elapsed,
+    }, vertices
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=50)
+    parser.add_argument("--primitive", default="CUBE", choices=["CUBE", "SPHERE"])
+    args = parser.parse_args()
+
+    results = {output_mode: run(output_mode, args.bones, args.primitive) for output_mode in ("OBJECTS", "SKINNED")}
+    for output_mode, (result, _) in results.items():
+        print(f"{output_mode:>7}: {result['objects']} objects, {result['sections']} mesh sections, "
+              f"{result['vertices']} vertices, {result['seconds'] * 1000:.1f} ms")
+    matching = np.allclose(results["OBJECTS"][1], results["SKINNED"][1], atol=1e-4)
+    print(f"Deformed Skinned Mesh matches Placeholders: {matching}")
+    return 0 if matching else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Benchmark the Tracing Overhead on both Stages (Mocked bpy and unreal)
+
+Times a span, a counter and a counted call with tracing disabled, then runs
+SkeletalMeshPreparation (operator build mode) on a synthetic rig and auto_skms_to_ikrs on a
+performer library with tracing disabled and enabled, printing wall times and the events
+written. Checks the trace has one span per bone and per mesh, that the counted
+bpy.ops and IK Rig controller calls match the calls the fakes recorded, that the
+merged Chrome trace loads as JSON, that spans ended on many threads at once reach the
+file in the order each thread ended them, that both stages still run from source pasted
+without a file (Blender's Text Editor, the Unreal console) where Common can't be imported, and
+that reloading the stages and the batch entry point leaves sys.path as it was.
+
+    python Benchmark/bench_trace.py --bones 200 --meshes 100
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCH_DIR, os.path.join(BENCH_DIR, "fakes"), os.path.join(BENCH_DIR, "..", "Blender"),
+                os.path.join(BENCH_DIR, "..", "Unreal"), os.path.join(BENCH_DIR, "..", "Common")]
+
+import bpy
+import unreal
+import pipeline_trace
+import synthetic
+from automate_asset import auto_skms_to_ikrs
+from bench_ikr_batch import LIBRARY_PATH, make_library
+from skeletal_mesh_preparation import SkeletalMeshPreparation
+
+
+def run_smp(bone_count):
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    bpy.reset_stats()
+    smp = SkeletalMeshPreparation(mesh_size=2.0, build_mode="OPERATOR")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+    return time.perf_counter() - start
+
+
+def run_ikrs(mesh_count, source_dir):
+    make_library(mesh_count, source_dir)
+    unreal.reset_stats()
+    start = time.perf_counter()
+    auto_skms_to_ikrs(LIBRARY_PATH)
+    return time.perf_counter() - start
+
+
+def traced(trace_path, run, *args):
+    pipeline_trace.enable(trace_path, process_name=run.__name__)
+    seconds = run(*args)
+    pipeline_trace.disable()
+    return seconds
+
+
+def write_from_threads(trace_path, thread_count=8, span_count=2000):
+    """
+    End Spans on many Threads at once: whether every Span was Written, each Thread's in Order
+    """
+    def end_spans(thread_index):
+        for index in range(span_count):
+            with pipeline_trace.span("ordered", thread=thread_index, index=index):
+                pass
+    pipeline_trace.enable(trace_path, buffer_size=200)
+    # Switch Threads as often as Possible, so a Writer Racing another is Likely
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=end_spans, args=(thread_index,)) for thread_index in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sys.setswitchinterval(switch_interval)
+    pipeline_trace.disable()
+    indices = [[] for _ in range(thread_count)]
+    for event in pipeline_trace.read_trace(trace_path):
+        indices[event["args"]["thread"]].append(event["args"]["index"])
+    return all(thread_indices == list(range(span_count)) for thread_indices in indices)
+
+
+def run_without_common(bone_count, mesh_count, source_dir):
+    """
+    Run both Stages from Source Executed without a File and with pipeline_trace not Importable:
+    Returns the bpy.ops Calls of the Preparation and the IK Rigs Built
+    """
+    namespaces = {}
+    trace_module, sys.modules["pipeline_trace"] = sys.modules["pipeline_trace"], None
+    try:
+        for module_name, folder in (("skeletal_mesh_preparation", "Blender"), ("automate_asset", "Unreal")):
+            namespaces[module_name] = {"__name__": "console"}
+            with open(os.path.join(BENCH_DIR, "..", folder, module_name + ".py")) as source_file:
+                exec(compile(source_file.read(), "<console>", "exec"), namespaces[module_name])
+    finally:
+        sys.modules["pipeline_trace"] = trace_module
+
+    bpy.reset_data()
+    armature = synthetic.make_armature(bpy, bone_count)
+    bpy.reset_stats()
+    smp = namespaces["skeletal_mesh_preparation"]["SkeletalMeshPreparation"](mesh_size=2.0, build_mode="OPERATOR")
+    make_library(mesh_count, source_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        smp.run(selected_armature=armature)
+        report = namespaces["automate_asset"]["auto_skms_to_ikrs"](LIBRARY_PATH, force=True)
+    return bpy.stats.op_calls, len(report["built"])
+
+
+def reload_stages(times=3):
+    """
+    Reload both Stages and the Batch Entry Point (which Puts Common on sys.path): Whether sys.path is Unchanged
+    """
+    import automate_asset
+    import batch_prepare
+    import skeletal_mesh_preparation
+    before = list(sys.path)
+    for _ in range(times):
+        for module in (automate_asset, skeletal_mesh_preparation, batch_prepare):
+            importlib.reload(module)
+    return sys.path == before
+
+
+def disabled_overhead(number=200000):
+    """
+    Nanoseconds per Span, Counter and Counted Call with Tracing Disabled, over an Empty Statement
+    """
+    pipeline_trace.disable()
+    base = timeit.timeit("pass", number=number)
+    statements = {
+        "span": "with pipeline_trace.span('place_bone', bone='Hips'): pass",
+        "count": "pipeline_trace.count('calls')",
+        "counted call": "pipeline_trace.counted(ops, 'ops').select_all()",
+    }
+    namespace = {"pipeline_trace": pipeline_trace, "ops": type("Ops", (), {"select_all": staticmethod(lambda: None)})}
+    return {label: (timeit.timeit(statement, number=number, globals=namespace) - base) / number * 1e9
+            for label, statement in statements.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bones", type=int, default=200)
+    parser.add_argument("--meshes", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        smp_path, ikr_path = os.path.join(temp_dir, "smp.jsonl"), os.path.join(temp_dir, "ikr.jsonl")
+
+        smp_disabled = min(run_smp(args.bones) for _ in range(3))
+        smp_enabled = min(traced(smp_path + str(index), run_smp, args.bones) for index in range(3))
+        os.replace(smp_path + "2", smp_path)
+        smp_ops = bpy.stats.op_calls
+        ikr_disabled = min(run_ikrs(args.meshes, temp_dir) for _ in range(3))
+        ikr_enabled = min(traced(ikr_path + str(index), run_ikrs, args.meshes, temp_dir) for index in range(3))
+        os.replace(ikr_path + "2", ikr_path)
+        ikr_controller_calls = sum(count for name, count in unreal.stats.calls.items()
+                                   if name.startswith("IKRigController.") and name != "IKRigController.get_controller")
+
+        chrome_path = os.path.join(temp_dir, "trace.json")
+        summary = pipeline_trace.export_chrome_trace([smp_path, ikr_path], chrome_path)
+        with open(chrome_path) as chrome_file:
+            event_count = len(json.load(chrome_file)["traceEvents"])
+
+        fileless_ops, fileless_rigs = run_without_common(args.bones, args.meshes, temp_dir)
+        ordered = write_from_threads(os.path.join(temp_dir, "threads.jsonl"))
+        path_kept = reload_stages()
+
+    spans, counters = summary["spans"], summary["counters"]
+    print("Disabled: " + ", ".join(f"{label} {nanoseconds:.0f} ns" for label, nanoseconds in disabled_overhead().items()))
+    for label, disabled, enabled in (("SMP run", smp_disabled, smp_enabled), ("IK Rig batch", ikr_disabled, ikr_enabled)):
+        print(f"{label:>12}: {disabled * 1000:8.1f} ms disabled, {enabled * 1000:8.1f} ms traced "
+              f"({(enabled / disabled - 1) * 100:+.1f}%)")
+    print(f"{event_count} trace events; slowest spans: " + ", ".join(
+        f"{name} {totals['seconds'] * 1000:.1f} ms/{totals['count']}" for name, totals in list(spans.items())[:5]))
+
+    counted_ops = sum(count for name, count in counters.items() if name.startswith("bpy.ops.") and not name.endswith(".poll"))
+    counted_controller_calls = sum(count for name, count in counters.items() if name.startswith("IKRigController."))
+    ok = (spans["place_bone"]["count"] == args.bones and spans["skm_to_ikr"]["count"] == args.meshes
+          and spans["SkeletalMeshPreparation.run"]["count"] == 1 and counted_ops == smp_ops
+          and counted_controller_calls == ikr_controller_calls)
+    print(f"Counted {counted_ops} bpy.ops and {counted_controller_calls} IK Rig controller calls; "
+          f"Spans per Bone and Mesh, Counters Match the Recorded Calls: {ok}")
+    fileless_ok = fileless_ops == smp_ops and fileless_rigs == args.meshes
+    print(f"Without a file or Common: {fileless_ops} bpy.ops, {fileless_rigs} IK Rigs built: {fileless_ok}")
+    print(f"Spans of 8 threads written in order: {ordered}; sys.path unchanged by reloads: {path_kept}")
+    ok &= fileless_ok and ordered and path_kept
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
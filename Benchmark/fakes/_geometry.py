@@ -0,0 +1,39 @@
+"""
+Primitive Geometry shared by the Fake Operators and the Fake bmesh (Benchmark Use Only)
+"""
+import numpy as np
+
+
+def cube(size):
+    half = size / 2.0
+    verts = np.array([(x, y, z) for x in (-half, half) for y in (-half, half) for z in (-half, half)])
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return verts, faces
+
+
+def uv_sphere(radius, segments, rings):
+    theta = np.linspace(0.0, np.pi, rings + 1)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    ring = np.stack([
+        np.outer(np.sin(theta), np.cos(phi)).ravel(),
+        np.outer(np.sin(theta), np.sin(phi)).ravel(),
+        np.repeat(np.cos(theta), segments),
+    ], axis=1)
+    verts = np.vstack([(0.0, 0.0, 1.0), ring, (0.0, 0.0, -1.0)]) * radius
+
+    faces = []
+    bottom = len(verts) - 1
+    for s in range(segments):
+        n = (s + 1) % segments
+        faces.append((0, 1 + s, 1 + n))
+        for r in range(rings - 2):
+            a, b = 1 + r * segments, 1 + (r + 1) * segments
+            faces.append((a + s, b + s, b + n, a + n))
+        last = 1 + (rings - 2) * segments
+        faces.append((last + s, bottom, last + n))
+    return verts, faces
+
+
+def transform(verts, matrix):
+    mat = np.asarray(matrix, dtype=float)
+    return verts @ mat[:3, :3].T + mat[:3, 3]
@@ -0,0 +1,61 @@
+"""
+Minimal Stand-in for Blender's bmesh (Benchmark Use Only)
+"""
+import types
+
+import numpy as np
+
+import _geometry
+
+
+class _Layers:
+
+    def __init__(self):
+        self.names = []
+
+    def new(self, name="UVMap"):
+        self.names.append(name)
+        return name
+
+
+class BMesh:
+
+    def __init__(self):
+        self.verts = np.zeros((0, 3))
+        self.faces = []
+        self.loops = types.SimpleNamespace(layers=types.SimpleNamespace(uv=_Layers()))
+
+    def _extend(self, verts, faces):
+        offset = len(self.verts)
+        self.verts = np.vstack([self.verts, verts])
+        self.faces.extend(tuple(i + offset for i in face) for face in faces)
+
+    def to_mesh(self, mesh):
+        mesh.from_pydata(self.verts, [], self.faces)
+        for name in self.loops.layers.uv.names:
+            mesh.uv_layers.new(name=name)
+
+    def free(self):
+        self.verts = None
+        self.faces = None
+
+
+def new():
+    return BMesh()
+
+
+def _create_cube(bm, size=2.0, matrix=None, calc_uvs=False):
+    verts, faces = _geometry.cube(size)
+    if matrix is not None:
+        verts = _geometry.transform(verts, matrix)
+    bm._extend(verts, faces)
+
+
+def _create_uvsphere(bm, u_segments=32, v_segments=16, radius=1.0, matrix=None, calc_uvs=False):
+    verts, faces = _geometry.uv_sphere(radius, u_segments, v_segments)
+    if matrix is not None:
+        verts = _geometry.transform(verts, matrix)
+    bm._extend(verts, faces)
+
+
+ops = types.SimpleNamespace(create_cube=_create_cube, create_uvsphere=_create_uvsphere)
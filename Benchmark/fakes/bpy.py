@@ -0,0 +1,836 @@
+"""
+Minimal Stand-in for Blender's bpy that Records Operator Calls and Scene Updates (Benchmark Use Only)
+
+Every ``bpy.ops`` call counts as one operator call and one depsgraph/view layer update,
+and adds ``op_cost`` simulated seconds to ``stats``.
+"""
+import collections
+import json as _json
+import types as _types
+
+import numpy as np
+from mathutils import Matrix, Vector
+
+import _geometry
+
+op_cost = 0.0
+
+
+class _Stats:
+
+    def __init__(self):
+        self.ops = collections.Counter()
+        self.updates = 0
+        self.tags = 0
+        self.simulated_seconds = 0.0
+
+    @property
+    def op_calls(self):
+        return sum(self.ops.values())
+
+
+stats = _Stats()
+
+
+def reset_stats():
+    global stats
+    stats = _Stats()
+
+
+def _scene_update():
+    stats.updates += 1
+    stats.simulated_seconds += op_cost
+
+
+#region DATA
+class ID:
+
+    def __init__(self, name):
+        self._name = name
+        self._owner = None
+        self._props = {}
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        if self._owner is not None:
+            self._owner._rename(self, value)
+        else:
+            self._name = value
+
+    def as_pointer(self):
+        return id(self)
+
+    def update_tag(self, refresh=None):
+        stats.tags += 1
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def __delitem__(self, key):
+        del self._props[key]
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+
+class _IDCollection:
+
+    def __init__(self, factory):
+        self._items = {}
+        self._factory = factory
+
+    def _unique(self, name):
+        if name not in self._items:
+            return name
+        index = 1
+        while f"{name}.{index:03d}" in self._items:
+            index += 1
+        return f"{name}.{index:03d}"
+
+    def _add(self, item):
+        item._name = self._unique(item._name)
+        item._owner = self
+        self._items[item._name] = item
+        return item
+
+    def _rename(self, item, value):
+        del self._items[item._name]
+        item._name = self._unique(value)
+        self._items[item._name] = item
+
+    def new(self, name, *args, **kwargs):
+        return self._add(self._factory(name, *args, **kwargs))
+
+    def remove(self, item, do_unlink=True):
+        del self._items[item._name]
+        item._owner = None
+        if isinstance(item, Object):
+            item.data = None
+            for collection in [context.scene.collection] + list(data.collections):
+                if item in collection.objects:
+                    collection.objects.unlink(item)
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+
+class _MaterialSlots(list):
+
+    def append(self, material):
+        super().append(material)
+
+
+class _AttributeCollection:
+    """
+    Element Collection with NumPy-backed Attributes supporting foreach_get/foreach_set
+    """
+
+    def __init__(self, widths):
+        self._widths = widths
+        self._arrays = {name: np.zeros((0, width)) for name, width in widths.items()}
+
+    def __len__(self):
+        return len(next(iter(self._arrays.values())))
+
+    def add(self, count):
+        for name, width in self._widths.items():
+            self._arrays[name] = np.vstack([self._arrays[name], np.zeros((count, width))])
+
+    def foreach_set(self, attr, seq):
+        self._arrays[attr] = np.asarray(seq, dtype=float).reshape(len(self), self._widths[attr]).copy()
+
+    def foreach_get(self, attr, seq):
+        seq[:] = self._arrays[attr].ravel().astype(seq.dtype) if hasattr(seq, "dtype") else self._arrays[attr].ravel()
+
+
+class _UVLayer(ID):
+
+    def __init__(self, name, mesh):
+        super().__init__(name)
+        self.data = _AttributeCollection({"uv": 2})
+        self.data.add(len(mesh.loops))
+
+
+class Mesh(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.vertices = _AttributeCollection({"co": 3})
+        self.loops = _AttributeCollection({"vertex_index": 1})
+        self.polygons = _AttributeCollection({"loop_start": 1, "loop_total": 1, "material_index": 1})
+        self.materials = _MaterialSlots()
+        self.uv_layers = _IDCollection(lambda name: _UVLayer(name, self))
+        self.color_attributes = _IDCollection(lambda name, type, domain: _ColorAttribute(name, type, domain, self))
+        self.users = 0
+
+    @property
+    def co(self):
+        return self.vertices._arrays["co"]
+
+    @co.setter
+    def co(self, value):
+        self.vertices._arrays["co"] = np.asarray(value, dtype=float).reshape(-1, 3)
+
+    @property
+    def faces(self):
+        starts = self.polygons._arrays["loop_start"][:, 0].astype(int)
+        totals = self.polygons._arrays["loop_total"][:, 0].astype(int)
+        indices = self.loops._arrays["vertex_index"][:, 0].astype(int)
+        return [tuple(indices[start:start + total]) for start, total in zip(starts, totals)]
+
+    def from_pydata(self, vertices, edges, faces):
+        self.co = vertices
+        totals = [len(face) for face in faces]
+        self.loops._arrays["vertex_index"] = np.array([i for face in faces for i in face], dtype=float).reshape(-1, 1)
+        self.polygons._arrays = {
+            "loop_start": np.cumsum([0] + totals[:-1], dtype=float).reshape(-1, 1) if faces else np.zeros((0, 1)),
+            "loop_total": np.array(totals, dtype=float).reshape(-1, 1),
+            "material_index": np.zeros((len(faces), 1)),
+        }
+
+    def update(self, calc_edges=False):
+        # Blender 4.x derives Polygon Sizes from the Loop Starts
+        starts = self.polygons._arrays["loop_start"][:, 0]
+        self.polygons._arrays["loop_total"] = np.diff(np.append(starts, len(self.loops))).reshape(-1, 1)
+
+
+class _Nodes(dict):
+
+    def new(self, type):
+        node = _types.SimpleNamespace(type=type, name=type, image=None, interpolation="Linear",
+                                      inputs={}, outputs={"Color": _types.SimpleNamespace(node=None)})
+        node.outputs["Color"].node = node
+        self[f"{type}.{len(self):03d}"] = node
+        return node
+
+    def get(self, name, default=None):
+        return next((node for node in self.values() if node.name == name), default)
+
+
+class _Links(list):
+
+    def new(self, output, input):
+        link = _types.SimpleNamespace(from_socket=output, to_socket=input)
+        self.append(link)
+        return link
+
+
+class Material(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.use_nodes = False
+        self.diffuse_color = (0.8, 0.8, 0.8, 1.0)
+        bsdf = _types.SimpleNamespace(name="Principled BSDF",
+                                      inputs={"Base Color": _types.SimpleNamespace(default_value=None)})
+        self.node_tree = _types.SimpleNamespace(nodes=_Nodes({"Principled BSDF": bsdf}), links=_Links())
+
+
+class _Pixels:
+
+    def __init__(self, count):
+        self.values = np.zeros(count, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.values)
+
+    def foreach_set(self, seq):
+        self.values = np.asarray(seq, dtype=np.float32).reshape(self.values.shape).copy()
+
+    def foreach_get(self, seq):
+        seq[:] = self.values
+
+
+class Image(ID):
+
+    def __init__(self, name, width, height, alpha=False):
+        super().__init__(name)
+        self.size = (width, height)
+        self.pixels = _Pixels(width * height * 4)
+        self.colorspace_settings = _types.SimpleNamespace(name="sRGB")
+        self.packed_file = None
+
+    def scale(self, width, height):
+        self.size = (width, height)
+        self.pixels = _Pixels(width * height * 4)
+
+    def pack(self):
+        self.packed_file = _types.SimpleNamespace(size=len(self.pixels))
+
+
+class _ColorAttribute(ID):
+
+    def __init__(self, name, type, domain, mesh):
+        super().__init__(name)
+        self.data_type = type
+        self.domain = domain
+        self.data = _AttributeCollection({"color": 4, "color_srgb": 4})
+        self.data.add(len(mesh.loops) if domain == "CORNER" else len(mesh.vertices))
+
+
+class Bone:
+
+    def __init__(self, name, parent=None, head=(0, 0, 0), length=0.1):
+        self.name = name
+        self.parent = parent
+        self.length = length
+        self.matrix_local = Matrix.Translation(head)
+
+
+class _PropCollection(list):
+    """
+    List of Structs supporting foreach_get (Matrices are Flattened Column-Major like Blender)
+    """
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return next(item for item in self if item.name == key)
+        return super().__getitem__(key)
+
+    def foreach_get(self, attr, seq):
+        values = []
+        for item in self:
+            value = getattr(item, attr)
+            if isinstance(value, Matrix):
+                values.extend(np.asarray(value).T.ravel())
+            elif isinstance(value, (int, float)):
+                values.append(value)
+            else:
+                values.extend(value)
+        seq[:] = values
+
+    def foreach_set(self, attr, seq):
+        seq = np.asarray(seq, dtype=float).reshape(len(self), -1)
+        for item, value in zip(self, seq):
+            if isinstance(getattr(item, attr), Matrix):
+                setattr(item, attr, Matrix(value.reshape(4, 4).T))
+            else:
+                setattr(item, attr, value if len(value) > 1 else float(value[0]))
+
+
+class Armature(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.bones = _PropCollection()
+        self.pose_position = "POSE"
+
+
+class PoseBone:
+
+    def __init__(self, bone):
+        self.bone = bone
+        self.matrix = bone.matrix_local.copy()
+        self.matrix_basis = Matrix.Identity(4)
+        self.rotation_mode = "QUATERNION"
+
+    @property
+    def name(self):
+        return self.bone.name
+
+    @name.setter
+    def name(self, value):
+        self.bone.name = value
+
+    @property
+    def parent(self):
+        return self.bone.parent
+
+
+class _Constraints(list):
+
+    def new(self, type):
+        constraint = _types.SimpleNamespace(type=type, name=f"{type.title().replace('_', ' ')}",
+                                            target=None, subtarget="", inverse_matrix=Matrix.Identity(4))
+        self.append(constraint)
+        return constraint
+
+    def get(self, name):
+        return next((constraint for constraint in self if constraint.name == name), None)
+
+
+class _VertexGroup:
+
+    def __init__(self, name, index):
+        self.name = name
+        self.index = index
+        self.weights = {}
+
+    def add(self, index, weight, type):
+        for vertex in index:
+            self.weights[vertex] = weight
+
+
+class _VertexGroups(list):
+
+    def new(self, name="Group"):
+        group = _VertexGroup(name, len(self))
+        self.append(group)
+        return group
+
+    def get(self, name):
+        return next((group for group in self if group.name == name), None)
+
+
+class _Modifiers(list):
+
+    def new(self, name, type):
+        modifier = _types.SimpleNamespace(name=name, type=type, object=None)
+        self.append(modifier)
+        return modifier
+
+
+class Object(ID):
+
+    def __init__(self, name, object_data=None):
+        super().__init__(name)
+        self._data = None
+        self.data = object_data
+        if isinstance(object_data, Mesh):
+            self.type = "MESH"
+        elif isinstance(object_data, Armature):
+            self.type = "ARMATURE"
+            self.pose = _types.SimpleNamespace(bones=_PropCollection(PoseBone(bone) for bone in object_data.bones))
+        else:
+            self.type = "EMPTY"
+        self.parent = None
+        self.parent_type = "OBJECT"
+        self.parent_bone = ""
+        self.matrix_basis = Matrix.Identity(4)
+        self.matrix_parent_inverse = Matrix.Identity(4)
+        self.constraints = _Constraints()
+        self.vertex_groups = _VertexGroups()
+        self.modifiers = _Modifiers()
+        self.animation_data = None
+        self._selected = False
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        if isinstance(self._data, Mesh):
+            self._data.users -= 1
+        if isinstance(value, Mesh):
+            value.users += 1
+        self._data = value
+
+    @property
+    def children(self):
+        return tuple(obj for obj in data.objects if obj.parent is self)
+
+    def _parent_matrix(self):
+        if self.parent is None:
+            return Matrix.Identity(4)
+        parent_matrix = self.parent.matrix_world
+        if self.parent_type == "BONE":
+            pose_bone = next(pb for pb in self.parent.pose.bones if pb.name == self.parent_bone)
+            parent_matrix = parent_matrix @ pose_bone.matrix @ Matrix.Translation((0, pose_bone.bone.length, 0))
+        return parent_matrix @ self.matrix_parent_inverse
+
+    def _evaluated_matrix(self):
+        world = self._parent_matrix() @ self.matrix_basis
+        for constraint in self.constraints:
+            if constraint.type == "CHILD_OF" and constraint.target is not None:
+                world = _bone_world(constraint.target, constraint.subtarget) @ constraint.inverse_matrix @ world
+        return world
+
+    @property
+    def matrix_world(self):
+        return self._evaluated_matrix()
+
+    @matrix_world.setter
+    def matrix_world(self, value):
+        self.matrix_basis = self._parent_matrix().inverted() @ value
+
+    @property
+    def scale(self):
+        return self.matrix_basis.to_scale()
+
+    @scale.setter
+    def scale(self, value):
+        location, rotation, _ = self.matrix_basis.decompose()
+        self.matrix_basis = Matrix.LocRotScale(location, rotation, value)
+
+    def animation_data_create(self):
+        self.animation_data = _types.SimpleNamespace(action=None, action_slot=None)
+        return self.animation_data
+
+    def select_set(self, state):
+        self._selected = state
+
+    def select_get(self):
+        return self._selected
+
+
+def _bone_world(armature, bone_name):
+    pose_bone = next(pb for pb in armature.pose.bones if pb.name == bone_name)
+    return armature.matrix_world @ pose_bone.matrix
+
+
+class _CollectionObjects(list):
+
+    def link(self, obj):
+        self.append(obj)
+
+    def unlink(self, obj):
+        self.remove(obj)
+
+
+class _KeyframePoints:
+    """
+    Keyframes Stored as Column Arrays (co as (N, 2), interpolation as (N,))
+    """
+
+    def __init__(self):
+        self.co = np.empty((0, 2), dtype=np.float32)
+        self.interpolation = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.co)
+
+    def clear(self):
+        self.co = self.co[:0]
+        self.interpolation = self.interpolation[:0]
+
+    def add(self, count):
+        self.co = np.concatenate([self.co, np.zeros((count, 2), dtype=np.float32)])
+        self.interpolation = np.concatenate([self.interpolation, np.full(count, 2, dtype=np.int32)])
+
+    def foreach_set(self, attr, seq):
+        current = getattr(self, attr)
+        setattr(self, attr, np.asarray(seq, dtype=current.dtype).reshape(current.shape))
+
+    def foreach_get(self, attr, seq):
+        seq[:] = getattr(self, attr).ravel()
+
+
+class FCurve:
+
+    def __init__(self, data_path, index=0, action_group=""):
+        self.data_path = data_path
+        self.array_index = index
+        self.group = action_group
+        self.keyframe_points = _KeyframePoints()
+
+    def update(self):
+        order = np.argsort(self.keyframe_points.co[:, 0], kind="stable")
+        self.keyframe_points.co = self.keyframe_points.co[order]
+
+    def evaluate(self, frame):
+        co = self.keyframe_points.co
+        return float(np.interp(frame, co[:, 0], co[:, 1]))
+
+
+class _FCurves(list):
+
+    def new(self, data_path, index=0, action_group=""):
+        if self.find(data_path, index=index) is not None:
+            raise RuntimeError(f"F-Curve '{data_path}[{index}]' already exists")
+        fcurve = FCurve(data_path, index, action_group)
+        self.append(fcurve)
+        return fcurve
+
+    def find(self, data_path, index=0):
+        return next((fcurve for fcurve in self
+                     if fcurve.data_path == data_path and fcurve.array_index == index), None)
+
+
+class Action(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = _FCurves()
+
+
+class Collection(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = _CollectionObjects()
+
+
+data = _types.SimpleNamespace(
+    objects=_IDCollection(Object),
+    meshes=_IDCollection(Mesh),
+    materials=_IDCollection(Material),
+    armatures=_IDCollection(Armature),
+    collections=_IDCollection(Collection),
+    actions=_IDCollection(Action),
+    images=_IDCollection(Image),
+)
+
+types = _types.SimpleNamespace(ID=ID, Object=Object, Mesh=Mesh, Material=Material, Armature=Armature, Action=Action)
+#endregion
+
+#region CONTEXT
+class _ViewLayerObjects:
+
+    def __init__(self):
+        self.active = None
+
+
+class _Context:
+
+    def __init__(self):
+        self.mode = "OBJECT"
+        self.scene = _types.SimpleNamespace(collection=Collection("Scene Collection"), frame_start=1, frame_end=250,
+                                            render=_types.SimpleNamespace(fps=24, fps_base=1.0))
+        self.view_layer = _types.SimpleNamespace(
+            objects=_ViewLayerObjects(),
+            active_layer_collection=_types.SimpleNamespace(collection=self.scene.collection),
+            update=_scene_update,
+        )
+
+    @property
+    def collection(self):
+        return self.view_layer.active_layer_collection.collection
+
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+
+    @property
+    def selected_objects(self):
+        return [obj for obj in self.scene.collection.objects if obj.select_get()]
+
+
+context = _Context()
+
+class _Timers:
+    """
+    Registered Timer Functions, Run by the Caller (there is no Event Loop) with run_timers.
+    Like Blender, Functions are Found by Identity (a new Bound Method is not the Registered one)
+    """
+
+    def __init__(self):
+        self.functions = []
+
+    def find(self, function):
+        return next((entry for entry in self.functions if entry[0] is function), None)
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.functions.append([function, first_interval])
+
+    def unregister(self, function):
+        entry = self.find(function)
+        if entry is None:
+            raise ValueError("Error: function is not registered")
+        self.functions.remove(entry)
+
+    def is_registered(self, function):
+        return self.find(function) is not None
+
+
+app = _types.SimpleNamespace(version=(4, 2, 0), timers=_Timers())
+
+
+def run_timers():
+    """
+    Call every Registered Timer once, Unregistering those Returning None
+    """
+    for entry in list(app.timers.functions):
+        interval = entry[0]()
+        if interval is None:
+            app.timers.unregister(entry[0])
+        else:
+            entry[1] = interval
+
+
+def reset_data():
+    """
+    Clear All Fake Datablocks and the Scene
+    """
+    global context
+    for collection in vars(data).values():
+        collection._items.clear()
+    context = _Context()
+    reset_stats()
+#endregion
+
+#region OPERATORS
+class _Operator:
+
+    def __init__(self, idname, func):
+        self.idname = idname
+        self.func = func
+
+    def __call__(self, *args, **kwargs):
+        stats.ops[self.idname] += 1
+        _scene_update()
+        self.func(*args, **kwargs)
+        return {"FINISHED"}
+
+    def poll(self):
+        return True
+
+
+def _mode_set(mode="OBJECT"):
+    context.mode = mode
+
+
+def _select_all(action="TOGGLE"):
+    for obj in context.scene.collection.objects:
+        obj.select_set(action == "SELECT")
+
+
+def _add_primitive(name, verts, faces, location):
+    mesh = data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.uv_layers.new(name="UVMap")
+    obj = data.objects.new(name, mesh)
+    obj.matrix_basis = Matrix.Translation(location)
+    context.collection.objects.link(obj)
+    _select_all(action="DESELECT")
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+
+def _primitive_cube_add(size=2.0, location=(0, 0, 0)):
+    _add_primitive("Cube", *_geometry.cube(size), location)
+
+
+def _primitive_uv_sphere_add(radius=1.0, location=(0, 0, 0), segments=32, ring_count=16):
+    _add_primitive("Sphere", *_geometry.uv_sphere(radius, segments, ring_count), location)
+
+
+def _transform_apply(location=True, rotation=True, scale=True):
+    for obj in context.selected_objects:
+        if scale and obj.type == "MESH":
+            obj.data.co = obj.data.co * np.asarray(obj.scale)
+            obj.scale = (1.0, 1.0, 1.0)
+
+
+def _childof_set_inverse(constraint="", owner="OBJECT"):
+    con = context.active_object.constraints.get(constraint)
+    con.inverse_matrix = _bone_world(con.target, con.subtarget).inverted()
+
+
+def _constraint_apply(constraint="", owner="OBJECT"):
+    obj = context.active_object
+    world = obj.matrix_world
+    obj.constraints.remove(obj.constraints.get(constraint))
+    obj.matrix_world = world
+
+
+def _read_factory_settings(use_empty=False):
+    global context
+    for collection in vars(data).values():
+        collection._items.clear()
+    context = _Context()
+
+
+def _import_fbx(filepath=""):
+    if fbx_importer is None:
+        raise RuntimeError("No fake FBX importer set (assign bpy.fbx_importer)")
+    fbx_importer(filepath)
+
+
+def _simplified_samples(values, factor):
+    """
+    Kept Samples of the FBX Exporter's Simplification of a Curve Re-Sampled on every Frame (io_scene_fbx):
+    a Sample Differing from the Previous one by more than factor * 1e-3 * (|a| + |b|) is Kept with the
+    Previous one, else it is Kept once it Differs as much from the Last Kept one (the Ends Always Kept)
+    """
+    kept = np.ones(len(values), dtype=bool)
+    if factor == 0.0 or len(values) < 3:
+        return kept
+    kept[1:-1] = False
+    min_reldiff = factor * 1.0e-3
+    values = values.tolist()
+    previous = kept_value = values[0]
+    for index, value in enumerate(values):
+        if value != previous:
+            if abs(value - previous) > min_reldiff * max(abs(value) + abs(previous), 0.1):
+                kept[index] = kept[index - 1] = True
+                kept_value = value
+            elif abs(value - kept_value) > min_reldiff * max(abs(value) + abs(kept_value), 0.1):
+                kept[index] = True
+                kept_value = value
+        previous = value
+    return kept
+
+
+def _export_fbx(filepath="", **kwargs):
+    """
+    Write the Exported Objects and Options as JSON in Place of the FBX, with any Baked Animation
+    Re-Sampled on every Frame and Simplified as the Exporter does
+    """
+    global last_export
+    last_export = dict(kwargs, filepath=filepath)
+    exported = {
+        "objects": sorted(obj.name for obj in data.objects if obj.type in kwargs.get("object_types", {obj.type})),
+        "options": {key: sorted(value) if isinstance(value, set) else value for key, value in kwargs.items()},
+    }
+    if kwargs.get("bake_anim"):
+        exported["animation"] = {}
+        for obj in data.objects:
+            action = obj.animation_data.action if obj.animation_data is not None else None
+            for fcurve in action.fcurves if action is not None else []:
+                co = fcurve.keyframe_points.co
+                if not len(co):
+                    continue
+                frames = np.arange(np.ceil(co[0, 0]), np.floor(co[-1, 0]) + 1)
+                values = np.interp(frames, co[:, 0], co[:, 1])
+                kept = _simplified_samples(values, kwargs.get("bake_anim_simplify_factor", 1.0))
+                exported["animation"][f"{obj.name}:{fcurve.data_path}[{fcurve.array_index}]"] = \
+                    np.round(np.stack([frames[kept], values[kept]], axis=-1), 6).tolist()
+    with open(filepath, "w") as fbx_file:
+        _json.dump(exported, fbx_file)
+
+
+# Called with the File Path by import_scene.fbx to Build the Imported Scene (Set by Benchmarks)
+fbx_importer = None
+# Keyword Arguments of the Last export_scene.fbx Call
+last_export = None
+
+ops = _types.SimpleNamespace(
+    wm=_types.SimpleNamespace(
+        read_factory_settings=_Operator("wm.read_factory_settings", _read_factory_settings),
+    ),
+    import_scene=_types.SimpleNamespace(
+        fbx=_Operator("import_scene.fbx", _import_fbx),
+    ),
+    export_scene=_types.SimpleNamespace(
+        fbx=_Operator("export_scene.fbx", _export_fbx),
+    ),
+    object=_types.SimpleNamespace(
+        mode_set=_Operator("object.mode_set", _mode_set),
+        select_all=_Operator("object.select_all", _select_all),
+        transform_apply=_Operator("object.transform_apply", _transform_apply),
+    ),
+    mesh=_types.SimpleNamespace(
+        primitive_cube_add=_Operator("mesh.primitive_cube_add", _primitive_cube_add),
+        primitive_uv_sphere_add=_Operator("mesh.primitive_uv_sphere_add", _primitive_uv_sphere_add),
+    ),
+    constraint=_types.SimpleNamespace(
+        childof_set_inverse=_Operator("constraint.childof_set_inverse", _childof_set_inverse),
+        apply=_Operator("constraint.apply", _constraint_apply),
+    ),
+)
+#endregion
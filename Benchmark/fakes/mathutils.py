@@ -0,0 +1,184 @@
+"""
+Minimal NumPy-backed stand-in for Blender's mathutils (Benchmark Use Only)
+"""
+import math
+
+import numpy as np
+
+
+class Vector:
+
+    def __init__(self, values=(0.0, 0.0, 0.0)):
+        self._v = np.array(values, dtype=float)
+
+    def __len__(self):
+        return len(self._v)
+
+    def __iter__(self):
+        return iter(self._v.tolist())
+
+    def __getitem__(self, index):
+        return float(self._v[index])
+
+    def __setitem__(self, index, value):
+        self._v[index] = value
+
+    def __add__(self, other):
+        return Vector(self._v + np.asarray(other, dtype=float))
+
+    def __sub__(self, other):
+        return Vector(self._v - np.asarray(other, dtype=float))
+
+    def __mul__(self, scalar):
+        return Vector(self._v * scalar)
+
+    def __array__(self, dtype=None, copy=None):
+        return self._v.astype(dtype) if dtype else self._v
+
+    def __repr__(self):
+        return f"Vector({tuple(self._v.tolist())})"
+
+    @property
+    def x(self):
+        return float(self._v[0])
+
+    @property
+    def y(self):
+        return float(self._v[1])
+
+    @property
+    def z(self):
+        return float(self._v[2])
+
+    @property
+    def length(self):
+        return float(np.linalg.norm(self._v))
+
+    def copy(self):
+        return Vector(self._v.copy())
+
+    def to_tuple(self):
+        return tuple(self._v.tolist())
+
+
+class Quaternion:
+
+    def __init__(self, values=(1.0, 0.0, 0.0, 0.0)):
+        self._q = np.array(values, dtype=float)
+
+    def __iter__(self):
+        return iter(self._q.tolist())
+
+    def __getitem__(self, index):
+        return float(self._q[index])
+
+    def __array__(self, dtype=None, copy=None):
+        return self._q.astype(dtype) if dtype else self._q
+
+    def to_matrix(self):
+        w, x, y, z = self._q / np.linalg.norm(self._q)
+        return Matrix((
+            (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+            (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+            (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)),
+        ))
+
+
+def _matrix_to_quaternion(m):
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+    if trace > 0:
+        s = math.sqrt(trace + 1.0) * 2
+        return (0.25 * s, (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s)
+    if m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+        s = math.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2
+        return ((m[2, 1] - m[1, 2]) / s, 0.25 * s, (m[0, 1] + m[1, 0]) / s, (m[0, 2] + m[2, 0]) / s)
+    if m[1, 1] > m[2, 2]:
+        s = math.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2
+        return ((m[0, 2] - m[2, 0]) / s, (m[0, 1] + m[1, 0]) / s, 0.25 * s, (m[1, 2] + m[2, 1]) / s)
+    s = math.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2
+    return ((m[1, 0] - m[0, 1]) / s, (m[0, 2] + m[2, 0]) / s, (m[1, 2] + m[2, 1]) / s, 0.25 * s)
+
+
+class Matrix:
+
+    def __init__(self, rows=None):
+        self._m = np.identity(4) if rows is None else np.array(rows, dtype=float)
+
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            return Matrix(self._m @ other._m)
+        vec = np.asarray(other, dtype=float)
+        if len(vec) == 3 and self._m.shape[0] == 4:
+            return Vector((self._m @ np.append(vec, 1.0))[:3])
+        return Vector(self._m @ vec)
+
+    def __getitem__(self, index):
+        return Vector(self._m[index])
+
+    def __iter__(self):
+        return (Vector(row) for row in self._m)
+
+    def __len__(self):
+        return self._m.shape[0]
+
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and np.array_equal(self._m, other._m)
+
+    def __array__(self, dtype=None, copy=None):
+        return self._m.astype(dtype) if dtype else self._m
+
+    def __repr__(self):
+        return f"Matrix({self._m.tolist()})"
+
+    @classmethod
+    def Identity(cls, size):
+        return cls(np.identity(size))
+
+    @classmethod
+    def Scale(cls, factor, size, axis=None):
+        mat = np.identity(size)
+        mat[:3, :3] *= factor
+        return cls(mat)
+
+    @classmethod
+    def Translation(cls, vector):
+        mat = np.identity(4)
+        mat[:3, 3] = np.asarray(vector, dtype=float)
+        return cls(mat)
+
+    @classmethod
+    def LocRotScale(cls, location, rotation, scale):
+        mat = np.identity(4)
+        if rotation is not None:
+            rot = rotation.to_matrix()._m if isinstance(rotation, Quaternion) else np.asarray(rotation)[:3, :3]
+            mat[:3, :3] = rot
+        if scale is not None:
+            mat[:3, :3] = mat[:3, :3] * np.asarray(scale, dtype=float)
+        if location is not None:
+            mat[:3, 3] = np.asarray(location, dtype=float)
+        return cls(mat)
+
+    def copy(self):
+        return Matrix(self._m.copy())
+
+    def inverted(self):
+        return Matrix(np.linalg.inv(self._m))
+
+    def transposed(self):
+        return Matrix(self._m.T)
+
+    def to_translation(self):
+        return Vector(self._m[:3, 3])
+
+    def to_scale(self):
+        return Vector(np.linalg.norm(self._m[:3, :3], axis=0))
+
+    def to_3x3(self):
+        return Matrix(self._m[:3, :3])
+
+    def to_quaternion(self):
+        rot = self._m[:3, :3] / np.linalg.norm(self._m[:3, :3], axis=0)
+        return Quaternion(_matrix_to_quaternion(rot))
+
+    def decompose(self):
+        return self.to_translation(), self.to_quaternion(), self.to_scale()
@@ -0,0 +1,973 @@
+"""
+Minimal Stand-in for Unreal's Python API that Records Editor Calls, Transactions and Saves (Benchmark Use Only)
+
+Every recorded call adds ``call_cost`` simulated seconds to ``stats``. An asset edit made
+outside a ``ScopedEditorTransaction`` opens (and records) its own undo transaction, as the
+editor's controllers do, adding ``transaction_cost``. Each save call adds ``save_call_cost``
+(package flush, source control and content browser refresh) plus ``package_save_cost`` per
+package written, and creating an asset adds ``create_asset_cost``. Fuzzy chain mapping adds
+``fuzzy_map_cost`` per source and target chain pair compared, and auto aligning bones adds
+``align_bone_cost`` per aligned bone. Retargeting an animation sequence adds
+``retarget_sequence_cost`` and a garbage collection ``garbage_collection_cost``. Each
+``import_asset_tasks`` call adds ``import_call_cost`` plus ``import_file_cost`` per file.
+Fake FBX files hold JSON: {"bones": [...]}.
+
+Loaded assets count their ``_bytes`` towards the simulated editor memory in
+``loaded_bytes()`` and ``stats.peak_loaded_bytes``, until their package is unloaded and
+garbage is collected.
+"""
+import collections
+import difflib
+import fnmatch
+import json
+import math
+import os
+import tempfile
+
+call_cost = 0.002
+transaction_cost = 0.01
+create_asset_cost = 0.05
+save_call_cost = 0.25
+package_save_cost = 0.03
+fuzzy_map_cost = 0.0005
+align_bone_cost = 0.002
+retarget_sequence_cost = 0.15
+garbage_collection_cost = 0.5
+import_call_cost = 2.0
+import_file_cost = 1.5
+asset_bytes = 64 * 1024
+
+# Called with each Sequence's AssetData before it is Retargeted (e.g. to Simulate an Editor Crash)
+on_retarget = None
+project_dir = os.path.join(tempfile.gettempdir(), "UnrealProject")
+project_saved_dir = os.path.join(project_dir, "Saved")
+
+
+class _Stats:
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.transactions = 0
+        self.save_calls = 0
+        self.packages_saved = 0
+        self.assets_created = 0
+        self.progress_frames = 0
+        self.garbage_collections = 0
+        self.peak_loaded_bytes = _loaded_bytes
+        self.simulated_seconds = 0.0
+        self.log = []
+
+    @property
+    def call_count(self):
+        return sum(self.calls.values())
+
+
+_assets = {}
+_transaction_depth = 0
+_loaded_bytes = 0
+stats = _Stats()
+
+
+def reset_stats():
+    global stats
+    stats = _Stats()
+
+
+def reset_data():
+    global _transaction_depth, _loaded_bytes, on_retarget
+    _assets.clear()
+    _transaction_depth = 0
+    _loaded_bytes = 0
+    on_retarget = None
+    reset_stats()
+
+
+def loaded_bytes():
+    return _loaded_bytes
+
+
+def restart_editor():
+    """
+    Simulate an Editor Crash and Restart: Unsaved Assets are Lost and Nothing is Loaded
+    """
+    global _transaction_depth, _loaded_bytes
+    for path, asset in list(_assets.items()):
+        if not asset._saved:
+            del _assets[path]
+        asset._loaded, asset._unloaded, asset._dirty = False, False, False
+    _transaction_depth = 0
+    _loaded_bytes = 0
+    reset_stats()
+
+
+def _load(asset):
+    global _loaded_bytes
+    if not asset._loaded:
+        asset._loaded = True
+        _loaded_bytes += asset._bytes
+        stats.peak_loaded_bytes = max(stats.peak_loaded_bytes, _loaded_bytes)
+    asset._unloaded = False
+    return asset
+
+
+def _record(name, cost=None):
+    stats.calls[name] += 1
+    stats.simulated_seconds += call_cost if cost is None else cost
+
+
+def _edit(asset, name):
+    _record(name)
+    if _transaction_depth == 0:
+        stats.transactions += 1
+        stats.simulated_seconds += transaction_cost
+    asset._dirty = True
+
+
+def _object_path(path):
+    path = str(path)
+    name = path.rsplit("/", 1)[-1]
+    return path if "." in name else f"{path}.{name}"
+
+
+def log(message):
+    stats.log.append(("LOG", str(message)))
+
+
+def log_warning(message):
+    stats.log.append(("WARNING", str(message)))
+
+
+def log_error(message):
+    stats.log.append(("ERROR", str(message)))
+
+
+#region MATH
+class Vector:
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __repr__(self):
+        return f"Vector({self.x}, {self.y}, {self.z})"
+
+
+class Quat:
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=1.0):
+        self.x, self.y, self.z, self.w = x, y, z, w
+
+    def __repr__(self):
+        return f"Quat({self.x:.6f}, {self.y:.6f}, {self.z:.6f}, {self.w:.6f})"
+
+
+class Rotator:
+
+    def __init__(self, roll=0.0, pitch=0.0, yaw=0.0):
+        self.roll, self.pitch, self.yaw = roll, pitch, yaw
+
+    def __repr__(self):
+        return f"Rotator({self.roll}, {self.pitch}, {self.yaw})"
+
+    def quaternion(self):
+        # Unreal's FRotator to FQuat (Degrees, Roll about X, Pitch about Y, Yaw about Z)
+        sr, cr = math.sin(math.radians(self.roll) / 2), math.cos(math.radians(self.roll) / 2)
+        sp, cp = math.sin(math.radians(self.pitch) / 2), math.cos(math.radians(self.pitch) / 2)
+        sy, cy = math.sin(math.radians(self.yaw) / 2), math.cos(math.radians(self.yaw) / 2)
+        return Quat(cr * sp * sy - sr * cp * cy, -cr * sp * cy - sr * cp * sy,
+                    cr * cp * sy - sr * sp * cy, cr * cp * cy + sr * sp * sy)
+#endregion
+
+
+#region OBJECTS
+class Object:
+
+    def __init__(self, path=""):
+        self._path = _object_path(path) if path else ""
+        self._properties = {}
+
+    def get_name(self):
+        return self._path.rsplit(".", 1)[-1]
+
+    def get_fname(self):
+        return self.get_name()
+
+    def get_path_name(self):
+        return self._path
+
+    def get_editor_property(self, name):
+        return self._properties.get(name)
+
+    def set_editor_property(self, name, value):
+        self._properties[name] = value
+
+
+class Package(Object):
+
+    def __init__(self, asset):
+        super().__init__(asset.get_path_name().split(".")[0])
+        self._asset = asset
+
+
+class _Asset(Object):
+
+    def __init__(self, path, size=None):
+        super().__init__(path)
+        self._metadata = {}
+        # Metadata Tags the Asset Registry Holds: those of the Last Save
+        self._registry_tags = {}
+        self._dirty = True
+        self._saved = False
+        self._bytes = asset_bytes if size is None else size
+        self._loaded = self._unloaded = False
+        _load(self)
+
+    def get_outermost(self):
+        return Package(self)
+
+
+class Skeleton(_Asset):
+
+    def __init__(self, path, bone_names):
+        super().__init__(path)
+        self._bone_names = list(bone_names)
+
+
+class AssetImportData(Object):
+
+    def __init__(self, filenames=()):
+        super().__init__()
+        self._filenames = list(filenames)
+
+    def extract_filenames(self):
+        _record("AssetImportData.extract_filenames")
+        return list(self._filenames)
+
+
+class SkeletalMesh(_Asset):
+
+    def __init__(self, path, bone_names, source_files=()):
+        super().__init__(path)
+        self._bone_names = list(bone_names)
+        self.skeleton = Skeleton(path + "_Skeleton", bone_names)
+        self._properties["skeleton"] = self.skeleton
+        self._properties["asset_import_data"] = AssetImportData(source_files)
+
+
+class AnimPose:
+
+    def __init__(self, bone_names):
+        self._bone_names = list(bone_names)
+
+
+class AnimPoseExtensions:
+
+    @staticmethod
+    def get_reference_pose(skeleton):
+        _record("AnimPoseExtensions.get_reference_pose")
+        return AnimPose(skeleton._bone_names)
+
+    @staticmethod
+    def get_bone_names(pose):
+        _record("AnimPoseExtensions.get_bone_names")
+        return list(pose._bone_names)
+
+
+def add_skeletal_mesh(path, bone_names, source_files=()):
+    """
+    Register a Skeletal Mesh (and its Skeleton) as if Imported and Saved
+    """
+    skm = SkeletalMesh(path, bone_names, source_files)
+    for asset in (skm, skm.skeleton):
+        asset._dirty, asset._saved = False, True
+        _assets[asset.get_path_name()] = asset
+    return skm
+#endregion
+
+
+#region IK RIG
+class IKRigFBIKSolver:
+
+    def __init__(self):
+        self.root_behavior = None
+        self.allow_stretch = False
+        self.root_bone = None
+
+
+class PBIKRootBehavior:
+    PRE_PULL = "PRE_PULL"
+    PIN_TO_INPUT = "PIN_TO_INPUT"
+    FREE = "FREE"
+
+
+class IKRigFBIKBoneSettings:
+
+    def __init__(self, bone):
+        self.bone = bone
+        self.rotation_stiffness = 0.0
+        self.use_preferred_angles = False
+        self.preferred_angles = Vector()
+
+
+class IKRigEffectorGoal:
+
+    def __init__(self, goal_name, bone_name):
+        self.goal_name = goal_name
+        self.bone_name = bone_name
+
+
+class BoneChain:
+
+    def __init__(self, chain_name, start_bone, end_bone, ik_goal_name):
+        self.chain_name = chain_name
+        self.start_bone = start_bone
+        self.end_bone = end_bone
+        self.ik_goal_name = ik_goal_name
+
+
+class IKRigDefinition(_Asset):
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._skeletal_mesh = None
+        self._solvers = []
+        self._bone_settings = []
+        self._goals = {}
+        self._chains = {}
+        self._retarget_root = None
+
+    def _copy_to(self, other):
+        other._skeletal_mesh = self._skeletal_mesh
+        for solver, settings in zip(self._solvers, self._bone_settings):
+            copy = type(solver)()
+            copy.__dict__.update(solver.__dict__)
+            other._solvers.append(copy)
+            other._bone_settings.append({bone: _copy_settings(setting) for bone, setting in settings.items()})
+        other._goals = {name: IKRigEffectorGoal(goal.goal_name, goal.bone_name) for name, goal in self._goals.items()}
+        other._chains = {name: BoneChain(chain.chain_name, chain.start_bone, chain.end_bone, chain.ik_goal_name)
+                         for name, chain in self._chains.items()}
+        other._retarget_root = self._retarget_root
+
+
+def _copy_settings(setting):
+    copy = IKRigFBIKBoneSettings(setting.bone)
+    copy.__dict__.update(setting.__dict__)
+    return copy
+
+
+class IKRigDefinitionFactory:
+    pass
+
+
+class IKRigController:
+
+    def __init__(self, ikr):
+        self._ikr = ikr
+
+    @staticmethod
+    def get_controller(ikr):
+        _record("IKRigController.get_controller")
+        return IKRigController(ikr)
+
+    def _has_bone(self, bone):
+        skm = self._ikr._skeletal_mesh
+        return skm is not None and bone in skm._bone_names
+
+    def set_skeletal_mesh(self, skm):
+        _edit(self._ikr, "IKRigController.set_skeletal_mesh")
+        self._ikr._skeletal_mesh = skm
+        return True
+
+    def get_skeletal_mesh(self):
+        _record("IKRigController.get_skeletal_mesh")
+        return self._ikr._skeletal_mesh
+
+    def add_solver(self, solver_class):
+        _edit(self._ikr, "IKRigController.add_solver")
+        self._ikr._solvers.append(solver_class())
+        self._ikr._bone_settings.append({})
+        return len(self._ikr._solvers) - 1
+
+    def get_num_solvers(self):
+        _record("IKRigController.get_num_solvers")
+        return len(self._ikr._solvers)
+
+    def remove_solver(self, solver_index):
+        _edit(self._ikr, "IKRigController.remove_solver")
+        if not 0 <= solver_index < len(self._ikr._solvers):
+            return False
+        del self._ikr._solvers[solver_index], self._ikr._bone_settings[solver_index]
+        return True
+
+    def get_solver_at_index(self, solver_index):
+        _record("IKRigController.get_solver_at_index")
+        return self._ikr._solvers[solver_index]
+
+    def set_root_bone(self, root_bone_name, solver_index):
+        _edit(self._ikr, "IKRigController.set_root_bone")
+        if not self._has_bone(root_bone_name):
+            return False
+        self._ikr._solvers[solver_index].root_bone = root_bone_name
+        return True
+
+    def add_new_goal(self, goal_name, bone_name):
+        _edit(self._ikr, "IKRigController.add_new_goal")
+        if goal_name in self._ikr._goals or not self._has_bone(bone_name):
+            return None
+        self._ikr._goals[goal_name] = IKRigEffectorGoal(goal_name, bone_name)
+        return goal_name
+
+    def remove_goal(self, goal_name):
+        _edit(self._ikr, "IKRigController.remove_goal")
+        return self._ikr._goals.pop(goal_name, None) is not None
+
+    def get_all_goals(self):
+        _record("IKRigController.get_all_goals")
+        return list(self._ikr._goals.values())
+
+    def add_bone_setting(self, bone_name, solver_index):
+        _edit(self._ikr, "IKRigController.add_bone_setting")
+        if not self._has_bone(bone_name):
+            return False
+        self._ikr._bone_settings[solver_index].setdefault(bone_name, IKRigFBIKBoneSettings(bone_name))
+        return True
+
+    def get_bone_settings(self, bone_name, solver_index):
+        _record("IKRigController.get_bone_settings")
+        return self._ikr._bone_settings[solver_index].get(bone_name)
+
+    def set_retarget_root(self, root_bone_name):
+        _edit(self._ikr, "IKRigController.set_retarget_root")
+        if not self._has_bone(root_bone_name):
+            return False
+        self._ikr._retarget_root = root_bone_name
+        return True
+
+    def get_retarget_root(self):
+        _record("IKRigController.get_retarget_root")
+        return self._ikr._retarget_root
+
+    def add_retarget_chain(self, chain_name, start_bone_name, end_bone_name, goal_name):
+        _edit(self._ikr, "IKRigController.add_retarget_chain")
+        if chain_name in self._ikr._chains:
+            return None
+        self._ikr._chains[chain_name] = BoneChain(chain_name, start_bone_name, end_bone_name, goal_name)
+        return chain_name
+
+    def remove_retarget_chain(self, chain_name):
+        _edit(self._ikr, "IKRigController.remove_retarget_chain")
+        return self._ikr._chains.pop(chain_name, None) is not None
+
+    def get_retarget_chains(self):
+        _record("IKRigController.get_retarget_chains")
+        return list(self._ikr._chains.values())
+#endregion
+
+
+#region IK RETARGETER
+class RetargetSourceOrTarget:
+    SOURCE = "SOURCE"
+    TARGET = "TARGET"
+
+
+class AutoMapChainType:
+    EXACT = "EXACT"
+    FUZZY = "FUZZY"
+    CLEAR = "CLEAR"
+
+
+class RootMotionSource:
+    COPY_FROM_SOURCE_ROOT = "COPY_FROM_SOURCE_ROOT"
+    GENERATE_FROM_TARGET_PELVIS = "GENERATE_FROM_TARGET_PELVIS"
+
+
+class RootMotionHeightSource:
+    COPY_HEIGHT_FROM_SOURCE = "COPY_HEIGHT_FROM_SOURCE"
+    SNAP_TO_GROUND = "SNAP_TO_GROUND"
+
+
+class PinBoneType:
+    FULL_TRANSFORM = "FULL_TRANSFORM"
+    TRANSLATE_ONLY = "TRANSLATE_ONLY"
+    ROTATE_ONLY = "ROTATE_ONLY"
+
+
+class PinBoneData(Object):
+    pass
+
+
+class RootMotionGeneratorOp(Object):
+    pass
+
+
+class PinBoneOp(Object):
+    pass
+
+
+class IKRetargeter(_Asset):
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._ik_rigs = {RetargetSourceOrTarget.SOURCE: None, RetargetSourceOrTarget.TARGET: None}
+        self._chain_map = {}
+        self._rotation_offsets = {}
+        self._aligned = set()
+        self._ops = []
+
+
+class IKRetargetFactory:
+    pass
+
+
+class IKRetargeterController:
+
+    def __init__(self, rtg):
+        self._rtg = rtg
+
+    @staticmethod
+    def get_controller(rtg):
+        _record("IKRetargeterController.get_controller")
+        return IKRetargeterController(rtg)
+
+    def _chain_names(self, source_or_target):
+        ikr = self._rtg._ik_rigs[source_or_target]
+        return list(ikr._chains) if ikr is not None else []
+
+    def set_ik_rig(self, source_or_target, ik_rig):
+        _edit(self._rtg, "IKRetargeterController.set_ik_rig")
+        self._rtg._ik_rigs[source_or_target] = ik_rig
+        # Chains Missing from either Rig Map to None
+        source_chains = self._chain_names(RetargetSourceOrTarget.SOURCE)
+        self._rtg._chain_map = {target_chain: self._rtg._chain_map.get(target_chain)
+                                if self._rtg._chain_map.get(target_chain) in source_chains else None
+                                for target_chain in self._chain_names(RetargetSourceOrTarget.TARGET)}
+
+    def get_ik_rig(self, source_or_target):
+        _record("IKRetargeterController.get_ik_rig")
+        return self._rtg._ik_rigs[source_or_target]
+
+    def auto_map_chains(self, auto_map_type, force_remap):
+        source_chains = self._chain_names(RetargetSourceOrTarget.SOURCE)
+        target_chains = self._chain_names(RetargetSourceOrTarget.TARGET)
+        _edit(self._rtg, "IKRetargeterController.auto_map_chains")
+        stats.simulated_seconds += fuzzy_map_cost * len(source_chains) * len(target_chains)
+        for target_chain in target_chains:
+            if self._rtg._chain_map.get(target_chain) and not force_remap:
+                continue
+            if auto_map_type == AutoMapChainType.CLEAR:
+                match = None
+            elif auto_map_type == AutoMapChainType.EXACT:
+                match = target_chain if target_chain in source_chains else None
+            else:
+                scores = [(difflib.SequenceMatcher(None, target_chain.lower(), source_chain.lower()).ratio(),
+                           source_chain) for source_chain in source_chains]
+                score, match = max(scores, default=(0.0, None))
+                match = match if score >= 0.5 else None
+            self._rtg._chain_map[target_chain] = match
+
+    def set_source_chain(self, source_chain_name, target_chain_name):
+        _edit(self._rtg, "IKRetargeterController.set_source_chain")
+        if target_chain_name not in self._rtg._chain_map:
+            return False
+        source_chain_name = str(source_chain_name)
+        if source_chain_name == "None":
+            self._rtg._chain_map[target_chain_name] = None
+        elif source_chain_name in self._chain_names(RetargetSourceOrTarget.SOURCE):
+            self._rtg._chain_map[target_chain_name] = source_chain_name
+        else:
+            return False
+        return True
+
+    def get_source_chain(self, target_chain_name):
+        _record("IKRetargeterController.get_source_chain")
+        return self._rtg._chain_map.get(target_chain_name) or "None"
+
+    def set_rotation_offset_for_retarget_pose_bone(self, bone_name, rotation_offset, source_or_target):
+        _edit(self._rtg, "IKRetargeterController.set_rotation_offset_for_retarget_pose_bone")
+        self._rtg._rotation_offsets[(source_or_target, bone_name)] = repr(rotation_offset)
+
+    def auto_align_all_bones(self, source_or_target):
+        _edit(self._rtg, "IKRetargeterController.auto_align_all_bones")
+        ikr = self._rtg._ik_rigs[source_or_target]
+        skm = ikr._skeletal_mesh if ikr is not None else None
+        stats.simulated_seconds += align_bone_cost * (len(skm._bone_names) if skm is not None else 0)
+        self._rtg._aligned.add(source_or_target)
+
+    def add_retarget_op(self, retarget_op_class):
+        _edit(self._rtg, "IKRetargeterController.add_retarget_op")
+        self._rtg._ops.append(retarget_op_class())
+        return len(self._rtg._ops) - 1
+
+    def get_retarget_op_at_index(self, index):
+        _record("IKRetargeterController.get_retarget_op_at_index")
+        return self._rtg._ops[index]
+
+    def get_num_retarget_ops(self):
+        _record("IKRetargeterController.get_num_retarget_ops")
+        return len(self._rtg._ops)
+
+    def remove_all_ops(self):
+        _edit(self._rtg, "IKRetargeterController.remove_all_ops")
+        self._rtg._ops.clear()
+#endregion
+
+
+#region ANIMATION
+class AnimSequence(_Asset):
+
+    def __init__(self, path, skeleton_path="", frame_count=0, bone_count=0):
+        # Raw Keys: Float Position and Quaternion per Bone and Frame
+        super().__init__(path, size=frame_count * bone_count * 28 or None)
+        self._skeleton_path = skeleton_path
+        self._frame_count = frame_count
+        self._bone_count = bone_count
+
+
+def add_anim_sequence(path, skeleton, frame_count, bone_count):
+    """
+    Register an Animation Sequence as if Imported, Saved and not Loaded
+    """
+    global _loaded_bytes
+    sequence = AnimSequence(path, skeleton.get_path_name(), frame_count, bone_count)
+    sequence._dirty, sequence._saved = False, True
+    sequence._loaded = False
+    _loaded_bytes -= sequence._bytes
+    _assets[sequence.get_path_name()] = sequence
+    return sequence
+
+
+class IKRetargetBatchOperation:
+
+    @staticmethod
+    def duplicate_and_retarget(assets_to_retarget, source_mesh, target_mesh, ik_retarget_asset, search="",
+                               replace="", prefix="", suffix="", remap_referenced_assets=True):
+        _record("IKRetargetBatchOperation.duplicate_and_retarget")
+        target_skeleton = target_mesh.get_editor_property("skeleton")
+        retargeted = []
+        for asset_data in assets_to_retarget:
+            if on_retarget is not None:
+                on_retarget(asset_data)
+            source = _load(asset_data._asset)
+            name = prefix + (source.get_name().replace(search, replace) if search else source.get_name()) + suffix
+            path = _object_path(f"{asset_data.package_path}/{name}")
+            if path in _assets:
+                continue
+            stats.simulated_seconds += retarget_sequence_cost
+            sequence = AnimSequence(path, target_skeleton.get_path_name(), source._frame_count,
+                                    len(target_mesh._bone_names))
+            _assets[path] = sequence
+            stats.assets_created += 1
+            retargeted.append(AssetData(sequence))
+        return retargeted
+
+
+def find_package(name):
+    asset = _assets.get(_object_path(name))
+    return Package(asset) if asset is not None and asset._loaded and not asset._unloaded else None
+
+
+class EditorLoadingAndSavingUtils:
+
+    @staticmethod
+    def unload_packages(packages_to_unload):
+        _record("EditorLoadingAndSavingUtils.unload_packages")
+        for package in packages_to_unload:
+            if package._asset._dirty:
+                log_warning(f"Not Unloading Dirty Package {package.get_path_name()}")
+                continue
+            package._asset._unloaded = True
+
+
+class SystemLibrary:
+
+    @staticmethod
+    def collect_garbage():
+        global _loaded_bytes
+        _record("SystemLibrary.collect_garbage", garbage_collection_cost)
+        stats.garbage_collections += 1
+        for asset in _assets.values():
+            if asset._loaded and asset._unloaded:
+                asset._loaded = False
+                _loaded_bytes -= asset._bytes
+
+
+class Paths:
+
+    @staticmethod
+    def project_dir():
+        return project_dir + os.sep
+
+    @staticmethod
+    def project_saved_dir():
+        return project_saved_dir + os.sep
+#endregion
+
+
+#region EDITOR
+class ScopedEditorTransaction:
+
+    def __init__(self, description):
+        self.description = description
+
+    def __enter__(self):
+        global _transaction_depth
+        if _transaction_depth == 0:
+            stats.transactions += 1
+            stats.simulated_seconds += transaction_cost
+        _transaction_depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        global _transaction_depth
+        _transaction_depth -= 1
+        return False
+
+
+class ScopedSlowTask:
+
+    def __init__(self, work, desc="", enabled=True):
+        self.work = work
+        self.desc = desc
+        self.completed_work = 0.0
+        self.cancel_after = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def make_dialog(self, can_cancel=False, allow_in_pie=False):
+        _record("ScopedSlowTask.make_dialog")
+
+    def enter_progress_frame(self, work=1.0, desc=""):
+        stats.progress_frames += 1
+        self.completed_work += work
+
+    def should_cancel(self):
+        return self.cancel_after is not None and self.completed_work >= self.cancel_after
+
+
+class AssetTools:
+
+    def import_asset_tasks(self, import_tasks):
+        _record("AssetTools.import_asset_tasks", import_call_cost)
+        for task in import_tasks:
+            if not task.get_editor_property("automated"):
+                # The Editor would Open an Options Dialog per File
+                log_warning(f"Import of {task.get_editor_property('filename')} is not Automated")
+            stats.simulated_seconds += import_file_cost
+            _import_fbx(task)
+
+    def create_asset(self, asset_name, package_path, asset_class, factory):
+        _record("AssetTools.create_asset", create_asset_cost)
+        path = _object_path(f"{package_path}/{asset_name}")
+        if path in _assets:
+            # The Editor would Prompt to Overwrite; Unattended it Refuses
+            log_warning(f"Asset {path} Already Exists")
+            return None
+        asset = asset_class(path)
+        _assets[path] = asset
+        stats.assets_created += 1
+        return asset
+
+
+class FBXImportType:
+    FBXIT_STATIC_MESH = "FBXIT_STATIC_MESH"
+    FBXIT_SKELETAL_MESH = "FBXIT_SKELETAL_MESH"
+    FBXIT_ANIMATION = "FBXIT_ANIMATION"
+
+
+class FbxImportUI(Object):
+    pass
+
+
+class AssetImportTask(Object):
+
+    def __init__(self):
+        super().__init__()
+        self._objects = []
+
+    def get_objects(self):
+        return list(self._objects)
+
+
+def _import_fbx(task):
+    filename = task.get_editor_property("filename")
+    try:
+        with open(filename) as fbx_file:
+            bone_names = json.load(fbx_file)["bones"]
+    except (OSError, ValueError, KeyError):
+        log_error(f"Failed to Import {filename}")
+        return
+    name = os.path.splitext(os.path.basename(filename))[0].replace(" ", "_").replace(".", "_")
+    path = _object_path(f"{task.get_editor_property('destination_path')}/{name}")
+    skm = _assets.get(path)
+    if skm is not None and not task.get_editor_property("replace_existing"):
+        return
+    if skm is None:
+        skm = SkeletalMesh(path, bone_names, [filename])
+        _assets[path] = skm
+        _assets[skm.skeleton.get_path_name()] = skm.skeleton
+        stats.assets_created += 2
+    else:
+        _load(skm)
+        skm._bone_names = skm.skeleton._bone_names = list(bone_names)
+    skm._dirty = skm.skeleton._dirty = True
+    task._objects = [skm, skm.skeleton]
+
+
+class AssetToolsHelpers:
+
+    @staticmethod
+    def get_asset_tools():
+        return AssetTools()
+
+
+def _save(assets, only_if_is_dirty):
+    # Saving only Clean Packages Writes Nothing
+    assets = [asset for asset in assets if asset._dirty or not only_if_is_dirty]
+    if assets:
+        stats.save_calls += 1
+        stats.simulated_seconds += save_call_cost
+    for asset in assets:
+        asset._dirty, asset._saved = False, True
+        asset._registry_tags = dict(asset._metadata)
+        stats.packages_saved += 1
+        stats.simulated_seconds += package_save_cost
+    return True
+
+
+class EditorAssetLibrary:
+
+    @staticmethod
+    def get_fname(asset):
+        _record("EditorAssetLibrary.get_fname")
+        return asset.get_fname()
+
+    @staticmethod
+    def get_path_name(asset):
+        _record("EditorAssetLibrary.get_path_name")
+        return asset.get_path_name()
+
+    @staticmethod
+    def does_asset_exist(asset_path):
+        _record("EditorAssetLibrary.does_asset_exist")
+        return _object_path(asset_path) in _assets
+
+    @staticmethod
+    def load_asset(asset_path):
+        _record("EditorAssetLibrary.load_asset")
+        asset = _assets.get(_object_path(asset_path))
+        return _load(asset) if asset is not None else None
+
+    @staticmethod
+    def duplicate_asset(source_asset_path, destination_asset_path):
+        _record("EditorAssetLibrary.duplicate_asset", create_asset_cost)
+        source = _assets.get(_object_path(source_asset_path))
+        path = _object_path(destination_asset_path)
+        if source is None or path in _assets:
+            return None
+        asset = type(source)(path)
+        source._copy_to(asset)
+        asset._metadata = dict(source._metadata)
+        _assets[path] = asset
+        stats.assets_created += 1
+        return asset
+
+    @staticmethod
+    def save_asset(asset_to_save, only_if_is_dirty=True):
+        _record("EditorAssetLibrary.save_asset", 0.0)
+        asset = _assets.get(_object_path(asset_to_save))
+        return asset is not None and _save([asset], only_if_is_dirty)
+
+    @staticmethod
+    def save_loaded_assets(assets_to_save, only_if_is_dirty=True):
+        _record("EditorAssetLibrary.save_loaded_assets", 0.0)
+        return _save(assets_to_save, only_if_is_dirty)
+
+    @staticmethod
+    def get_metadata_tag(obj, tag):
+        _record("EditorAssetLibrary.get_metadata_tag")
+        return obj._metadata.get(str(tag), "")
+
+    @staticmethod
+    def set_metadata_tag(obj, tag, value):
+        _edit(obj, "EditorAssetLibrary.set_metadata_tag")
+        obj._metadata[str(tag)] = str(value)
+#endregion
+
+
+#region ASSET REGISTRY
+class TopLevelAssetPath:
+
+    def __init__(self, package_name="", asset_name=""):
+        self.package_name = package_name
+        self.asset_name = asset_name
+
+
+class ARFilter:
+
+    def __init__(self, package_names=(), package_paths=(), class_paths=(), recursive_paths=False,
+                 recursive_classes=False):
+        self.package_names = list(package_names)
+        self.package_paths = list(package_paths)
+        self.class_paths = list(class_paths)
+        self.recursive_paths = recursive_paths
+
+
+class AssetData:
+
+    def __init__(self, asset):
+        package_name = asset.get_path_name().split(".")[0]
+        self.package_name = package_name
+        self.package_path = package_name.rsplit("/", 1)[0]
+        self.asset_name = asset.get_name()
+        self.asset_class_path = TopLevelAssetPath("/Script/Engine", type(asset).__name__)
+        self._asset = asset
+
+    def get_asset(self):
+        _record("AssetData.get_asset")
+        return _load(self._asset)
+
+    def get_tag_value(self, tag):
+        skeleton_path = getattr(self._asset, "_skeleton_path", None)
+        if tag == "Skeleton" and skeleton_path:
+            return f"/Script/Engine.Skeleton'{skeleton_path}'"
+        return self._asset._registry_tags.get(str(tag))
+
+
+class AssetRegistry:
+
+    def get_assets(self, ar_filter):
+        _record("AssetRegistry.get_assets")
+        class_names = {class_path.asset_name for class_path in ar_filter.class_paths}
+        found = []
+        # Package Names are Indexed by the Registry: Look them up rather than Scanning every Asset
+        if ar_filter.package_names:
+            assets = [_assets[_object_path(name)] for name in ar_filter.package_names if _object_path(name) in _assets]
+        else:
+            assets = list(_assets.values())
+        for asset in assets:
+            data = AssetData(asset)
+            if class_names and data.asset_class_path.asset_name not in class_names:
+                continue
+            if ar_filter.package_names and data.package_name not in ar_filter.package_names:
+                continue
+            if ar_filter.package_paths and not any(
+                    data.package_path == path or (ar_filter.recursive_paths and
+                                                  fnmatch.fnmatchcase(data.package_path, path.rstrip("/") + "/*"))
+                    for path in ar_filter.package_paths):
+                continue
+            found.append(data)
+        return found
+
+
+class AssetRegistryHelpers:
+
+    @staticmethod
+    def get_asset_registry():
+        return AssetRegistry()
+#endregion
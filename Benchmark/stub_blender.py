@@ -0,0 +1,78 @@
+"""
+Stand-in for a Background Blender Worker, for Testing batch_prepare.py without Blender
+
+Accepts Blender's ``--background --python <script> -- <worker args>`` command line,
+sleeps for ``STUB_BLENDER_SECONDS`` (default 0.05), copies the input to the output
+and prints the worker's result line. With a ``cache_dir`` option it uses the first
+``STUB_SKELETON_BYTES`` (default 4096) of the input as the skeleton, like batch_worker.py
+uses the imported skeleton. Input file names select failure modes:
+
+    *hang*    never finishes (exercises per-file timeouts)
+    *broken*  always exits with an error
+    *flaky*   fails on its first attempt only (exercises retries)
+
+    python Blender/batch_prepare.py in out --blender "python Benchmark/stub_blender.py"
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BENCH_DIR, "..", "Blender"))
+
+from prep_cache import PrepCache, cache_key
+
+RESULT_PREFIX = "OPTISKEL_RESULT "
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="stub_blender.py")
+    parser.add_argument("--input", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--options", default="{}")
+    args, _ = parser.parse_known_args(argv)
+
+    name = os.path.basename(args.input)
+    if "hang" in name:
+        time.sleep(3600)
+    if "broken" in name:
+        print("Stub worker: broken input", file=sys.stderr)
+        return 1
+    if "flaky" in name:
+        marker = args.output + ".attempted"
+        if not os.path.exists(marker):
+            open(marker, "w").close()
+            print("Stub worker: flaky first attempt", file=sys.stderr)
+            return 1
+        os.remove(marker)
+
+    result = {"armatures": 1, "bones": 21, "timings": {}}
+    options = json.loads(args.options)
+    if options.get("cache_dir") and not options.get("with_animation"):
+        with open(args.input, "rb") as input_file:
+            skeleton = input_file.read(int(os.environ.get("STUB_SKELETON_BYTES", "4096")))
+        prep_cache = PrepCache(options["cache_dir"])
+        result["cache_key"] = cache_key(hashlib.sha256(skeleton).hexdigest(), options)
+        if prep_cache.fetch(result["cache_key"], args.output):
+            result["cache"] = "HIT"
+            print(RESULT_PREFIX + json.dumps(result))
+            return 0
+        result["cache"] = "MISS"
+
+    seconds = float(os.environ.get("STUB_BLENDER_SECONDS", "0.05"))
+    time.sleep(seconds)
+    shutil.copyfile(args.input, args.output)
+    if result.get("cache") == "MISS":
+        prep_cache.store(result["cache_key"], args.output)
+    result["timings"]["prepare"] = seconds
+    print(RESULT_PREFIX + json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
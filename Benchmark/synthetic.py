@@ -0,0 +1,53 @@
+"""
+Synthetic OptiTrack Motive Rigs for the Benchmarks
+"""
+import math
+import random
+
+MOTIVE_BONES = [
+    ("Hips", None), ("Spine", "Hips"), ("Spine1", "Spine"), ("Neck", "Spine1"), ("Head", "Neck"),
+    ("LeftShoulder", "Spine1"), ("LeftArm", "LeftShoulder"), ("LeftForeArm", "LeftArm"), ("LeftHand", "LeftForeArm"),
+    ("RightShoulder", "Spine1"), ("RightArm", "RightShoulder"), ("RightForeArm", "RightArm"), ("RightHand", "RightForeArm"),
+    ("LeftUpLeg", "Hips"), ("LeftLeg", "LeftUpLeg"), ("LeftFoot", "LeftLeg"), ("LeftToeBase", "LeftFoot"),
+    ("RightUpLeg", "Hips"), ("RightLeg", "RightUpLeg"), ("RightFoot", "RightLeg"), ("RightToeBase", "RightFoot"),
+]
+
+
+def bone_names(bone_count, prefix="Skeleton"):
+    """
+    Motive Bone Names padded with Finger/Prop Bones up to the Requested Count
+    """
+    names = [(name, parent) for name, parent in MOTIVE_BONES[:bone_count]]
+    hands = ("LeftHand", "RightHand")
+    for index in range(len(names), bone_count):
+        hand = hands[index % 2]
+        names.append((f"{hand}Finger{index:04d}", hand))
+    return [(f"{prefix}_{name}", f"{prefix}_{parent}" if parent else None) for name, parent in names]
+
+
+def make_armature(bpy, bone_count, name="Skeleton", seed=0):
+    """
+    Build a Fake Armature Object with Deterministic Rest and Pose Matrices
+    """
+    from mathutils import Matrix, Quaternion
+
+    rng = random.Random(seed)
+    armature = bpy.data.armatures.new(name)
+    bones = {}
+    for bone_name, parent_name in bone_names(bone_count, prefix=name):
+        head = (rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0, 2))
+        bone = bpy.Bone(bone_name, parent=bones.get(parent_name), head=head, length=rng.uniform(0.05, 0.4))
+        bones[bone_name] = bone
+        armature.bones.append(bone)
+
+    obj = bpy.data.objects.new(name, armature)
+    obj.matrix_basis = Matrix.Translation((rng.uniform(-5, 5), rng.uniform(-5, 5), 0.0))
+    for pose_bone in obj.pose.bones:
+        angle = rng.uniform(-math.pi, math.pi)
+        axis = [rng.uniform(-1, 1) for _ in range(3)]
+        norm = math.sqrt(sum(a * a for a in axis)) or 1.0
+        quat = Quaternion([math.cos(angle / 2)] + [math.sin(angle / 2) * a / norm for a in axis])
+        pose_bone.matrix = pose_bone.bone.matrix_local @ Matrix.LocRotScale(None, quat, None)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
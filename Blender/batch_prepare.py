@@ -0,0 +1,360 @@
+"""
+Headless Batch Preparation of OptiTrack Motive FBX Exports
+
+Fans a folder of FBX files out across a pool of ``blender --background`` workers
+(see batch_worker.py). Each worker imports one file, runs SkeletalMeshPreparation on
+every armature and exports a UE5-ready FBX. Runs outside Blender:
+
+    python batch_prepare.py ./Motive ./Prepared --blender /path/to/blender --workers 8
+
+Any executable accepting Blender's ``--background --python <script> -- <args>`` command
+line can stand in for Blender, e.g. ``--blender "python ../Benchmark/stub_blender.py"``.
+"""
+import argparse
+import glob
+import json
+import os
+import queue
+import shlex
+import subprocess
+import sys
+import threading
+import time
+
+from prep_cache import PrepCache, file_digest
+
+COMMON_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Common"))
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
+import pipeline_trace
+
+PROGRAM_NAME = "OptiSkelUE5Pipe-BatchPrep"
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_worker.py")
+
+# Workers Print their Result as a single Line with this Prefix
+RESULT_PREFIX = "OPTISKEL_RESULT "
+
+
+class BatchJob:
+
+    def __init__(self, input_path: str, output_path: str):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.attempts = 0
+        self.status = "PENDING"
+        self.seconds = 0.0
+        self.error = ""
+        self.result = {}
+        self.input_digest = None
+
+
+def find_jobs(input_dir: str, output_dir: str, recursive: bool = False) -> list:
+    """
+    Create a Job for every FBX File in the Input Folder (Mirroring Sub-Folders in the Output)
+    """
+    pattern = os.path.join(input_dir, "**", "*.fbx") if recursive else os.path.join(input_dir, "*.fbx")
+    jobs = []
+    for input_path in sorted(glob.glob(pattern, recursive=recursive)):
+        relative_path = os.path.relpath(input_path, input_dir)
+        jobs.append(BatchJob(input_path, os.path.join(output_dir, relative_path)))
+    return jobs
+
+
+def build_worker_command(blender: str, job: BatchJob, worker_options: dict) -> list:
+    """
+    Build the Background Blender Command Line for a Job
+    """
+    return shlex.split(blender) + [
+        "--background", "--factory-startup", "--python-exit-code", "1",
+        "--python", WORKER_SCRIPT, "--",
+        "--input", job.input_path,
+        "--output", job.output_path,
+        "--options", json.dumps(worker_options),
+    ]
+
+
+def parse_worker_result(stdout: str) -> dict:
+    """
+    Find the Worker's Result Line in its Output
+    """
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return None
+
+
+def run_job(job: BatchJob, blender: str, worker_options: dict, timeout: float) -> bool:
+    """
+    Run one Attempt of a Job in a Worker Process
+    """
+    job.attempts += 1
+    os.makedirs(os.path.dirname(job.output_path) or ".", exist_ok=True)
+    command = build_worker_command(blender, job, worker_options)
+
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        job.seconds += time.perf_counter() - start
+        job.error = f"Timed out after {timeout:g}s"
+        return False
+    except OSError as error:
+        job.seconds += time.perf_counter() - start
+        job.error = str(error)
+        return False
+    job.seconds += time.perf_counter() - start
+
+    result = parse_worker_result(completed.stdout)
+    if completed.returncode != 0 or result is None:
+        stderr_tail = completed.stderr.strip().splitlines()[-1:] if completed.stderr else []
+        job.error = f"Exit code {completed.returncode}" + (f": {stderr_tail[0]}" if stderr_tail else "")
+        return False
+    job.result = result
+    job.error = ""
+    return True
+
+
+def run_batch(jobs: list, blender: str, worker_options: dict, workers: int = None,
+              timeout: float = 600.0, retries: int = 1, prep_cache: PrepCache = None) -> dict:
+    """
+    Run All Jobs from a Shared Queue on a Pool of Worker Processes and Report the Throughput.
+    Failed or Timed Out Jobs go back to the End of the Queue until their Retries run out.
+    With a Cache, Inputs Prepared Before are Served without Starting a Worker.
+    """
+    start = time.perf_counter()
+    if prep_cache is not None:
+        prefetch_cached_jobs(jobs, prep_cache, worker_options)
+
+    pending_jobs = [job for job in jobs if job.status == "PENDING"]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending_jobs) or 1))
+    job_queue = queue.Queue()
+    for job in pending_jobs:
+        job_queue.put(job)
+    print_lock = threading.Lock()
+
+    def worker_loop():
+        while True:
+            try:
+                job = job_queue.get_nowait()
+            except queue.Empty:
+                return
+            with pipeline_trace.span("job", file=job.input_path, attempt=job.attempts + 1) as job_span:
+                succeeded = run_job(job, blender, worker_options, timeout)
+                job_span.set(succeeded=succeeded)
+            if succeeded:
+                job.status = "SUCCEEDED"
+            elif job.attempts <= retries:
+                job.status = "RETRYING"
+                job_queue.put(job)
+            else:
+                job.status = "FAILED"
+            with print_lock:
+                print(PROGRAM_NAME + f": [{job.status}] {os.path.basename(job.input_path)} "
+                      f"(attempt {job.attempts}, {job.seconds:.2f}s){' ' + job.error if job.error else ''}")
+
+    threads = [threading.Thread(target=worker_loop, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cache_stats = update_cache(jobs, prep_cache, worker_options) if prep_cache is not None else None
+    report = build_report(jobs, workers, time.perf_counter() - start)
+    if cache_stats is not None:
+        report["cache"] = cache_stats
+    return report
+
+
+def prefetch_cached_jobs(jobs: list, prep_cache: PrepCache, worker_options: dict) -> int:
+    """
+    Complete Jobs whose Byte-Identical Input was Prepared Before, without Starting Blender
+    """
+    prefetched = 0
+    for job in jobs:
+        job.input_digest = file_digest(job.input_path)
+        key = prep_cache.lookup_input(job.input_digest, worker_options)
+        if key is not None and prep_cache.fetch(key, job.output_path):
+            job.status = "SUCCEEDED"
+            job.result = {"cache": "INPUT_HIT", "cache_key": key}
+            prefetched += 1
+    return prefetched
+
+
+def update_cache(jobs: list, prep_cache: PrepCache, worker_options: dict) -> dict:
+    """
+    Memoize the Inputs' Cache Keys, Evict over the Limits and Record the Hit/Miss Statistics
+    """
+    for job in jobs:
+        if job.status == "SUCCEEDED" and job.result.get("cache") in ("HIT", "MISS"):
+            prep_cache.store_input(job.input_digest, worker_options, job.result["cache_key"])
+
+    outcomes = [job.result.get("cache") for job in jobs]
+    batch_stats = {
+        "hits": outcomes.count("HIT"),
+        "misses": outcomes.count("MISS"),
+        "input_hits": outcomes.count("INPUT_HIT"),
+        "evictions": prep_cache.evict(),
+    }
+    return {"batch": batch_stats, "lifetime": prep_cache.record_stats(**batch_stats)}
+
+
+def build_report(jobs: list, workers: int, wall_seconds: float) -> dict:
+    """
+    Aggregate the Jobs into a Throughput Report
+    """
+    succeeded = [job for job in jobs if job.status == "SUCCEEDED"]
+    worker_seconds = sum(job.seconds for job in jobs)
+    input_bytes = sum(os.path.getsize(job.input_path) for job in succeeded)
+    decimations = [stats for job in succeeded for stats in (job.result or {}).get("decimation", [])]
+    decimated_jobs = [job for job in succeeded if "fbx_bytes_before" in (job.result or {})]
+    report = {
+        "files": len(jobs),
+        "succeeded": len(succeeded),
+        "failed": [{"file": job.input_path, "attempts": job.attempts, "error": job.error}
+                   for job in jobs if job.status != "SUCCEEDED"],
+        "retries": sum(max(job.attempts - 1, 0) for job in jobs),
+        "workers": workers,
+        "wall_seconds": wall_seconds,
+        "worker_seconds": worker_seconds,
+        "files_per_minute": len(succeeded) * 60.0 / wall_seconds if wall_seconds else 0.0,
+        "input_megabytes_per_second": input_bytes / 1e6 / wall_seconds if wall_seconds else 0.0,
+        "parallel_efficiency": worker_seconds / (wall_seconds * workers) if wall_seconds else 0.0,
+        "jobs": [{"file": job.input_path, "status": job.status, "attempts": job.attempts,
+                  "seconds": job.seconds, "result": job.result} for job in jobs],
+    }
+    if decimations:
+        report["decimation"] = {
+            "actions": len(decimations),
+            "keys_before": sum(stats["keys_before"] for stats in decimations),
+            "keys_after": sum(stats["keys_after"] for stats in decimations),
+            "seconds": sum(stats["seconds"] for stats in decimations),
+            "fbx_bytes_before": sum(job.result["fbx_bytes_before"] for job in decimated_jobs),
+            "fbx_bytes_after": sum(job.result["output_bytes"] for job in decimated_jobs),
+        }
+    return report
+
+
+def print_report(report: dict):
+    print(PROGRAM_NAME + f": {report['succeeded']}/{report['files']} files prepared "
+          f"in {report['wall_seconds']:.2f}s on {report['workers']} workers "
+          f"({report['retries']} retries)")
+    print(PROGRAM_NAME + f": {report['files_per_minute']:.1f} files/min, "
+          f"{report['input_megabytes_per_second']:.2f} MB/s input, "
+          f"{report['parallel_efficiency'] * 100:.0f}% worker utilisation")
+    if "cache" in report:
+        batch_stats, lifetime_stats = report["cache"]["batch"], report["cache"]["lifetime"]
+        lookups = batch_stats["hits"] + batch_stats["misses"] + batch_stats["input_hits"]
+        hit_rate = (batch_stats["hits"] + batch_stats["input_hits"]) / lookups if lookups else 0.0
+        print(PROGRAM_NAME + f": cache {batch_stats['input_hits']} input hits, {batch_stats['hits']} skeleton hits, "
+              f"{batch_stats['misses']} misses ({hit_rate * 100:.0f}% hit rate), "
+              f"{batch_stats['evictions']} evicted, {lifetime_stats['entries']} entries "
+              f"({lifetime_stats['bytes'] / 1e6:.1f} MB)")
+    if "decimation" in report:
+        decimation = report["decimation"]
+        ratio = decimation["keys_after"] / decimation["keys_before"] if decimation["keys_before"] else 1.0
+        print(PROGRAM_NAME + f": decimated {decimation['actions']} actions {decimation['keys_before']} -> "
+              f"{decimation['keys_after']} keys ({ratio * 100:.1f}%) in {decimation['seconds']:.2f}s, FBX "
+              f"{decimation['fbx_bytes_before'] / 1e6:.1f} -> {decimation['fbx_bytes_after'] / 1e6:.1f} MB")
+    if "trace" in report:
+        spans = list(report["trace"]["summary"]["spans"].items())[:8]
+        print(PROGRAM_NAME + f": trace written to {report['trace']['path']}; slowest spans: " + ", ".join(
+            f"{name} {totals['seconds']:.2f}s/{totals['count']}" for name, totals in spans))
+    for failure in report["failed"]:
+        print(PROGRAM_NAME + f": FAILED {failure['file']} after {failure['attempts']} attempts: {failure['error']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input_dir", help="Folder of OptiTrack Motive FBX Exports")
+    parser.add_argument("output_dir", help="Folder for the UE5-Ready FBX Files")
+    parser.add_argument("--blender", default="blender", help="Blender Executable (or a Stand-in Command)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker Processes (Default: CPU Cores)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds per File Attempt")
+    parser.add_argument("--retries", type=int, default=1, help="Retries per File after a Failure or Timeout")
+    parser.add_argument("--recursive", action="store_true", help="Include FBX Files in Sub-Folders")
+    parser.add_argument("--report", default=None, help="Write the Throughput Report as JSON")
+    parser.add_argument("--with-animation", action="store_true",
+                        help="Export the Baked Animation as well (Disables the Cache)")
+    parser.add_argument("--decimate", action="store_true",
+                        help="Reduce the Baked Keys within the Tolerances below and Export them Simplified within the same "
+                             "Tolerances (with --with-animation), Reporting Key Counts and the FBX Size before "
+                             "and after (Measured by an Extra Unreduced Export per File)")
+    parser.add_argument("--location-tolerance", type=float, default=0.001,
+                        help="Largest Location Error of Reduced Keys (Armature Units)")
+    parser.add_argument("--rotation-tolerance", type=float, default=0.5,
+                        help="Largest Rotation Error of Reduced Keys (Degrees)")
+    parser.add_argument("--cache-dir", default=None, help="Reuse Prepared Outputs from this Cache Folder")
+    parser.add_argument("--cache-max-gb", type=float, default=10.0, help="Evict Least Recently Used above this Size")
+    parser.add_argument("--cache-max-entries", type=int, default=None, help="Evict Least Recently Used above this Count")
+    parser.add_argument("--trace", default=None,
+                        help="Trace the Batch and every Worker, Merged into this Chrome Trace (JSON) File")
+
+    prep = parser.add_argument_group("SkeletalMeshPreparation")
+    prep.add_argument("--mesh-primitive", default="CUBE", choices=["CUBE", "SPHERE"])
+    prep.add_argument("--mesh-size", type=float, default=2.0)
+    prep.add_argument("--mesh-color-method", default="CHAIN")
+    prep.add_argument("--build-mode", default="DATA", choices=["OPERATOR", "DATA"])
+    prep.add_argument("--output-mode", default="OBJECTS", choices=["OBJECTS", "SKINNED"])
+    prep.add_argument("--mesh-instancing", action="store_true")
+    prep.add_argument("--chain-table", default="OPTITRACK")
+    prep.add_argument("--no-armature-rename", dest="armature_rename", action="store_false")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    worker_options = {
+        "prep_options": {
+            "mesh_primitive": args.mesh_primitive,
+            "mesh_size": args.mesh_size,
+            "mesh_color_method": args.mesh_color_method,
+            "armature_rename": args.armature_rename,
+            "build_mode": args.build_mode,
+            "mesh_instancing": args.mesh_instancing,
+            "output_mode": args.output_mode,
+            "chain_table": args.chain_table,
+        },
+        "with_animation": args.with_animation,
+    }
+    if args.decimate and args.with_animation:
+        worker_options["decimate"] = {
+            "location_tolerance": args.location_tolerance,
+            "rotation_tolerance": args.rotation_tolerance,
+        }
+
+    jobs = find_jobs(args.input_dir, args.output_dir, recursive=args.recursive)
+    if not jobs:
+        print(PROGRAM_NAME + f": No FBX files found in {args.input_dir}.")
+        return 1
+
+    prep_cache = None
+    if args.cache_dir and not args.with_animation:
+        prep_cache = PrepCache(args.cache_dir, max_bytes=int(args.cache_max_gb * 1e9),
+                               max_entries=args.cache_max_entries)
+        worker_options["cache_dir"] = os.path.abspath(args.cache_dir)
+
+    # Every Process Traces to its own JSON-Lines File, Merged once the Batch is Done
+    if args.trace:
+        trace_dir = os.path.abspath(args.trace) + ".parts"
+        os.makedirs(trace_dir, exist_ok=True)
+        for stale_path in glob.glob(os.path.join(trace_dir, "*.jsonl")):
+            os.remove(stale_path)
+        worker_options["trace_dir"] = trace_dir
+        pipeline_trace.enable(os.path.join(trace_dir, "batch.jsonl"), process_name="Batch")
+
+    with pipeline_trace.span("batch", files=len(jobs)):
+        report = run_batch(jobs, args.blender, worker_options, workers=args.workers,
+                           timeout=args.timeout, retries=args.retries, prep_cache=prep_cache)
+    if args.trace:
+        pipeline_trace.disable()
+        summary = pipeline_trace.export_chrome_trace(sorted(glob.glob(os.path.join(trace_dir, "*.jsonl"))), args.trace)
+        report["trace"] = {"path": args.trace, "summary": summary}
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+    return 0 if not report["failed"] else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Background Blender Worker for batch_prepare.py (One Motive FBX per Process)
+
+    blender --background --factory-startup --python batch_worker.py -- --input take.fbx --output out.fbx --options '{...}'
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+
+for source_dir in (os.path.dirname(os.path.abspath(__file__)),
+                   os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Common"))):
+    if source_dir not in sys.path:
+        sys.path.append(source_dir)
+import pipeline_trace
+from batch_prepare import RESULT_PREFIX
+from keyframe_reduction import decimate_action
+from prep_cache import PrepCache, cache_key
+from skeletal_mesh_preparation import PROGRAM_NAME, SkeletalMeshPreparation
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="batch_worker.py")
+    parser.add_argument("--input", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--options", default="{}")
+    return parser.parse_args(argv)
+
+
+def import_motive_fbx(input_path: str):
+    """
+    Import a Motive FBX into an Empty Scene
+    """
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.ops.import_scene.fbx(filepath=input_path)
+
+
+def export_ue5_fbx(output_path: str, with_animation: bool = False, simplify_factor: float = 1.0):
+    """
+    Export the Prepared Armatures and Placeholders as a UE5-Ready FBX
+    (Baked Animation Simplified by the Exporter's Factor, 1.0 its Default)
+    """
+    bpy.ops.export_scene.fbx(
+        filepath=output_path,
+        use_selection=False,
+        object_types={"ARMATURE", "MESH"},
+        mesh_smooth_type="FACE",
+        add_leaf_bones=False,
+        # Embed Generated Textures (the PALETTE Coloring) so they Import with the Materials
+        path_mode="COPY",
+        embed_textures=True,
+        bake_anim=with_animation,
+        bake_anim_simplify_factor=simplify_factor,
+    )
+
+
+def skeleton_digest(armatures: list) -> str:
+    """
+    Hash the Imported Skeletons (Bone Names, Parents, Rest Matrices and Lengths) and the Geometry of any
+    other Exported Meshes, as Imported (before any Preparation)
+    """
+    digest = hashlib.sha256()
+    for armature in sorted(armatures, key=lambda obj: obj.name):
+        bones = armature.data.bones
+        digest.update(armature.name.encode())
+        digest.update(armature.data.name.encode())
+        digest.update(np.asarray(armature.matrix_world, dtype=np.float32).tobytes())
+        for bone in bones:
+            digest.update(f"{bone.name}\0{bone.parent.name if bone.parent else ''}\0".encode())
+        rest_matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix_local", rest_matrices)
+        bone_lengths = np.empty(len(bones), dtype=np.float32)
+        bones.foreach_get("length", bone_lengths)
+        digest.update((np.round(rest_matrices, 5) + 0.0).tobytes())
+        digest.update((np.round(bone_lengths, 5) + 0.0).tobytes())
+    for obj in sorted((obj for obj in bpy.data.objects if obj.type == "MESH"), key=lambda obj: obj.name):
+        mesh = obj.data
+        vertex_co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", vertex_co)
+        loop_vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertex_index)
+        digest.update(f"{obj.name}:{len(vertex_co) // 3}:{len(loop_vertex_index)}".encode())
+        digest.update((np.round(vertex_co, 5) + 0.0).tobytes())
+        digest.update(loop_vertex_index.tobytes())
+    return digest.hexdigest()
+
+
+def prepare_file(input_path: str, output_path: str, options: dict) -> dict:
+    """
+    Import, Prepare every Armature and Export one File.
+    Mesh-Only Outputs are Prepared in the Rest Pose and Reused from the Cache (if Given),
+    Animated Outputs have their Actions Reduced first (if Tolerances are Given) and are Exported Simplified
+    within the same Tolerances, the FBX Size without Reduction Measured by a Reference Export.
+    """
+    timings = {}
+    result = {}
+    with_animation = options.get("with_animation", False)
+
+    start = time.perf_counter()
+    with pipeline_trace.span("import", file=input_path):
+        import_motive_fbx(input_path)
+    timings["import"] = time.perf_counter() - start
+
+    armatures = [obj for obj in bpy.data.objects if obj.type == "ARMATURE"]
+    smp = SkeletalMeshPreparation(**options.get("prep_options", {}))
+    if not with_animation:
+        for armature in armatures:
+            armature.data.pose_position = "REST"
+        bpy.context.view_layer.update()
+
+    # Reuse a Prepared Output of the same Skeleton, Options and Scripts
+    prep_cache = None
+    if options.get("cache_dir") and not with_animation:
+        start = time.perf_counter()
+        with pipeline_trace.span("cache") as cache_span:
+            prep_cache = PrepCache(options["cache_dir"])
+            result["cache_key"] = cache_key(skeleton_digest(armatures), options)
+            cache_hit = prep_cache.fetch(result["cache_key"], output_path)
+            result["cache"] = "HIT" if cache_hit else "MISS"
+            cache_span.set(outcome=result["cache"])
+        timings["cache"] = time.perf_counter() - start
+
+    if result.get("cache") != "HIT":
+        start = time.perf_counter()
+        with pipeline_trace.span("prepare", armatures=len(armatures)):
+            for armature in armatures:
+                smp.run(selected_armature=armature)
+        timings["prepare"] = time.perf_counter() - start
+
+        simplify_factor = 1.0
+        if with_animation and options.get("decimate"):
+            start = time.perf_counter()
+            reference_path = os.path.splitext(output_path)[0] + ".unreduced.fbx"
+            with pipeline_trace.span("export_unreduced", file=reference_path):
+                export_ue5_fbx(reference_path, with_animation=True)
+            result["fbx_bytes_before"] = os.path.getsize(reference_path)
+            os.remove(reference_path)
+            timings["export_unreduced"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with pipeline_trace.span("decimate"):
+                result["decimation"] = [
+                    decimate_action(armature.animation_data.action,
+                                    slot=getattr(armature.animation_data, "action_slot", None), **options["decimate"])
+                    for armature in armatures if armature.animation_data and armature.animation_data.action
+                ]
+            simplify_factor = min((stats["fbx_simplify_factor"] for stats in result["decimation"]), default=1.0)
+            timings["decimate"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with pipeline_trace.span("export", file=output_path):
+            export_ue5_fbx(output_path, with_animation=with_animation, simplify_factor=simplify_factor)
+        timings["export"] = time.perf_counter() - start
+
+        if prep_cache is not None:
+            prep_cache.store(result["cache_key"], output_path)
+
+    result.update({
+        "armatures": len(armatures),
+        "bones": sum(len(armature.pose.bones) for armature in armatures),
+        "output_bytes": os.path.getsize(output_path),
+        "timings": timings,
+    })
+    return result
+
+
+def main():
+    args = parse_args()
+    options = json.loads(args.options)
+    # One Trace File per Worker Process, Merged by batch_prepare.py
+    if options.get("trace_dir"):
+        pipeline_trace.enable(os.path.join(options["trace_dir"], f"worker-{os.getpid()}.jsonl"),
+                              process_name=f"Worker {os.path.basename(args.input)}")
+    with pipeline_trace.span("prepare_file", file=args.input):
+        result = prepare_file(args.input, args.output, options)
+    pipeline_trace.disable()
+    print(PROGRAM_NAME + f": Prepared {result['armatures']} armatures from {args.input}.")
+    print(RESULT_PREFIX + json.dumps(result))
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Error-Bounded Keyframe Reduction of Baked Actions
+
+Motive bakes a key on every frame. This stage keeps only the keys needed to stay within
+a positional, rotational and generic tolerance of the baked curves under linear
+interpolation, by iterative worst-error insertion (Ramer-Douglas-Peucker) run for every
+channel group of the action at once in NumPy. Channels of one property (the X/Y/Z of a
+location, the W/X/Y/Z of a quaternion) share their kept frames, so errors are measured
+on the whole vector: distance for locations, angle for quaternions.
+
+    from keyframe_reduction import decimate_action
+    stats = decimate_action(armature.animation_data.action, location_tolerance=0.001, rotation_tolerance=0.5,
+                            slot=armature.animation_data.action_slot)
+
+The FBX exporter re-samples baked animation on every frame, then drops the samples that
+stay close to the last kept one. Exporting with bake_anim_simplify_factor set to the
+returned stats["fbx_simplify_factor"] keeps that drop within the same tolerances. The
+reduced curves are smooth where the capture jittered, so far fewer samples get kept.
+"""
+import collections
+import time
+
+import bpy
+import numpy as np
+
+PROGRAM_NAME = "OptiSkelUE5Pipe-KeyframeReduction"
+
+KEYFRAME_INTERPOLATION_LINEAR = 1
+
+# Segments over Tolerance Longer than this are also Split at their Midpoint (under 1% more Keys)
+MIDPOINT_SPLIT_FRAMES = 256
+
+# FBX Exporter Simplification (io_scene_fbx): a Re-Sampled Value is Dropped until it Drifts from the
+# Last Kept one by more than factor * FBX_SIMPLIFY_RELATIVE * (|Value| + |Kept Value|)
+FBX_SIMPLIFY_RELATIVE = 1.0e-3
+# Largest Exported Rotation Value: Euler Degrees
+FBX_ROTATION_MAGNITUDE = 180.0
+
+
+def fcurve_metric(data_path: str) -> str:
+    """
+    Error Metric of an F-Curve's Property: LOCATION, ROTATION (Quaternion) or VALUE
+    """
+    if data_path.endswith("location"):
+        return "LOCATION"
+    if data_path.endswith("rotation_quaternion"):
+        return "ROTATION"
+    return "VALUE"
+
+
+def quaternion_angles(quaternions: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Rotation Angle in Degrees between (..., 4) Unit Quaternions (Stable for Small Angles, unlike arccos)
+    """
+    others = others * np.where(np.sum(quaternions * others, axis=-1, keepdims=True) < 0, -1.0, 1.0)
+    differences = np.linalg.norm(quaternions - others, axis=-1)
+    return np.degrees(4.0 * np.arctan2(differences, np.linalg.norm(quaternions + others, axis=-1)))
+
+
+def interpolation_errors(frames: np.ndarray, values: np.ndarray, positions: np.ndarray,
+                         previous_kept: np.ndarray, next_kept: np.ndarray, metric: str) -> np.ndarray:
+    """
+    Error at the Flat Positions of Linearly Interpolating (N, C) Values between their Kept Neighbours
+    """
+    start_frames, end_frames = frames[previous_kept], frames[next_kept]
+    factors = ((frames[positions] - start_frames) / (end_frames - start_frames))[:, None]
+    interpolated = values[previous_kept] * (1.0 - factors) + values[next_kept] * factors
+    originals = values[positions]
+
+    if metric == "ROTATION":
+        # Pose Evaluation Normalizes the Interpolated Quaternion: Angle to the (Unit) Original
+        dots = np.abs(np.einsum("ij,ij->i", interpolated, originals))
+        squared_norms = np.einsum("ij,ij->i", interpolated, interpolated)
+        return np.degrees(2.0 * np.arctan2(np.sqrt(np.maximum(squared_norms - dots * dots, 0.0)), dots))
+    if metric == "LOCATION":
+        differences = interpolated - originals
+        return np.sqrt(np.einsum("ij,ij->i", differences, differences))
+    return np.abs(interpolated - originals).max(axis=-1)
+
+
+def decimate_channels(frames: np.ndarray, values: np.ndarray, tolerance: float, metric: str) -> np.ndarray:
+    """
+    Kept-Key Mask (G, F) for (G, F) Frames and (G, F, C) Values: Starting from the End Keys, every
+    Segment whose Worst Frame Exceeds the Tolerance is Split there (and Halved when Longer than
+    MIDPOINT_SPLIT_FRAMES), for all Groups per Iteration. Only Frames of Segments Split in the
+    Previous Iteration are Evaluated again.
+    """
+    group_count, frame_count = frames.shape
+    frames = frames.ravel()
+    values = values.reshape(group_count * frame_count, -1)
+    if metric == "ROTATION":
+        values = values / np.linalg.norm(values, axis=-1, keepdims=True)
+    kept = np.zeros(group_count * frame_count, dtype=bool)
+    kept[0::frame_count] = kept[frame_count - 1::frame_count] = True
+    active = np.flatnonzero(~kept)
+    while len(active):
+        # Kept Neighbours (Groups Never Share a Segment, as their End Keys are Kept)
+        kept_positions = np.flatnonzero(kept)
+        segments = np.searchsorted(kept_positions, active)
+        errors = interpolation_errors(frames, values, active, kept_positions[segments - 1],
+                                      kept_positions[segments], metric)
+        over = errors > tolerance
+        if not over.any():
+            break
+
+        # Worst Frame per Segment over Tolerance (Active Frames are Sorted, so Segments are Contiguous Runs)
+        run_starts = np.flatnonzero(np.diff(segments, prepend=-1))
+        run_ids = np.cumsum(np.diff(segments, prepend=-1) != 0) - 1
+        run_max = np.maximum.reduceat(errors, run_starts)
+        run_over = run_max > tolerance
+        worst = np.flatnonzero((errors == run_max[run_ids]) & over)
+        first = np.diff(run_ids[worst], prepend=-1) != 0
+        kept[active[worst[first]]] = True
+
+        # Noisy Takes Split Long Segments Unevenly, so these are Halved as well to Bound the Iterations
+        over_segments = segments[run_starts[run_over]]
+        segment_lengths = kept_positions[over_segments] - kept_positions[over_segments - 1]
+        long_segments = over_segments[segment_lengths > MIDPOINT_SPLIT_FRAMES]
+        kept[(kept_positions[long_segments] + kept_positions[long_segments - 1]) // 2] = True
+
+        # Frames of Segments within Tolerance are Final
+        active = active[run_over[run_ids] & ~kept[active]]
+    return kept.reshape(group_count, frame_count)
+
+
+def read_fcurve_keys(fcurve) -> np.ndarray:
+    """
+    (N, 2) Frame/Value Keys of an F-Curve
+    """
+    co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get("co", co)
+    return co.reshape(-1, 2)
+
+
+def write_fcurve_keys(fcurve, keys: np.ndarray):
+    """
+    Replace an F-Curve's Keys by (N, 2) Frame/Value Keys with Linear Interpolation
+    """
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(len(keys))
+    fcurve.keyframe_points.foreach_set("co", keys.astype(np.float32).ravel())
+    fcurve.keyframe_points.foreach_set("interpolation",
+                                       np.full(len(keys), KEYFRAME_INTERPOLATION_LINEAR, dtype=np.int32))
+    fcurve.update()
+
+
+def collect_channel_groups(fcurves) -> dict:
+    """
+    F-Curves Grouped by Property, then Bucketed by (Metric, Key Count, Channel Count) for Batching.
+    Channels of a Property with Differing Key Frames are Reduced one by one.
+    """
+    properties = collections.defaultdict(list)
+    for fcurve in fcurves:
+        properties[fcurve.data_path].append(fcurve)
+
+    buckets = collections.defaultdict(list)
+    for data_path, property_fcurves in properties.items():
+        property_fcurves.sort(key=lambda fcurve: fcurve.array_index)
+        keys = [read_fcurve_keys(fcurve) for fcurve in property_fcurves]
+        metric = fcurve_metric(data_path)
+        shared_frames = all(len(channel_keys) == len(keys[0]) and np.array_equal(channel_keys[:, 0], keys[0][:, 0])
+                            for channel_keys in keys)
+        if not shared_frames:
+            property_fcurves, keys = [[fcurve] for fcurve in property_fcurves], [[k] for k in keys]
+            metric = "VALUE" if metric == "ROTATION" else metric
+        else:
+            property_fcurves, keys = [property_fcurves], [keys]
+        for group_fcurves, group_keys in zip(property_fcurves, keys):
+            if len(group_keys[0]) > 2:
+                buckets[(metric, len(group_keys[0]), len(group_keys))].append((group_fcurves, group_keys))
+    return buckets
+
+
+def action_fcurves(action, slot=None):
+    """
+    F-Curves of the Action's Channelbag for the Slot (Slotted Actions from Blender 4.4, the First Slot
+    when None is Given), or the Legacy F-Curve Collection before
+    """
+    if bpy.app.version >= (4, 4, 0):
+        from bpy_extras.anim_utils import action_get_channelbag_for_slot
+        if slot is None:
+            slot = action.slots[0] if len(action.slots) else None
+        channelbag = action_get_channelbag_for_slot(action, slot) if slot is not None else None
+        return channelbag.fcurves if channelbag is not None else []
+    return action.fcurves
+
+
+def fbx_simplify_factor(location_tolerance: float, rotation_tolerance: float, location_magnitude: float) -> float:
+    """
+    bake_anim_simplify_factor Keeping the FBX Exporter's Simplification within the Tolerances,
+    for Locations up to the Magnitude (Scene Units) and Rotations up to FBX_ROTATION_MAGNITUDE
+    """
+    # Values near Zero are Compared against at least 0.1 (|Value| + |Kept Value|)
+    return min(location_tolerance / (2.0 * FBX_SIMPLIFY_RELATIVE * max(location_magnitude, 0.05)),
+               rotation_tolerance / (2.0 * FBX_SIMPLIFY_RELATIVE * FBX_ROTATION_MAGNITUDE))
+
+
+def decimate_action(action, location_tolerance: float = 0.001, rotation_tolerance: float = 0.5,
+                    value_tolerance: float = 0.001, fcurves=None, slot=None) -> dict:
+    """
+    Reduce every F-Curve of the Action (of the Slot's Channelbag) in Place and Return Key-Count and Timing Statistics,
+    and the FBX Exporter Simplify Factor Keeping the Exported Curves within the same Tolerances.
+    Tolerances: Location in Scene Units, Rotation in Degrees, other Properties in their own Units.
+    """
+    start = time.perf_counter()
+    fcurves = action_fcurves(action, slot) if fcurves is None else fcurves
+    tolerances = {"LOCATION": location_tolerance, "ROTATION": rotation_tolerance, "VALUE": value_tolerance}
+    keys_before = sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+    location_magnitude = 0.0
+
+    for (metric, _, _), groups in collect_channel_groups(fcurves).items():
+        frames = np.stack([group_keys[0][:, 0] for _, group_keys in groups]).astype(np.float64)
+        values = np.stack([np.stack([channel_keys[:, 1] for channel_keys in group_keys], axis=-1)
+                           for _, group_keys in groups]).astype(np.float64)
+        if metric == "LOCATION":
+            location_magnitude = max(location_magnitude, float(np.abs(values).max()))
+        kept = decimate_channels(frames, values, tolerances[metric], metric)
+        for (group_fcurves, group_keys), group_kept in zip(groups, kept):
+            if group_kept.all():
+                continue
+            for fcurve, channel_keys in zip(group_fcurves, group_keys):
+                write_fcurve_keys(fcurve, channel_keys[group_kept])
+
+    keys_after = sum(len(fcurve.keyframe_points) for fcurve in fcurves)
+    stats = {
+        "action": action.name,
+        "fcurves": len(fcurves),
+        "keys_before": keys_before,
+        "keys_after": keys_after,
+        "key_ratio": keys_after / keys_before if keys_before else 1.0,
+        "fbx_simplify_factor": fbx_simplify_factor(location_tolerance, rotation_tolerance, location_magnitude),
+        "seconds": time.perf_counter() - start,
+    }
+    print(PROGRAM_NAME + f": {action.name} {keys_before} -> {keys_after} keys "
+          f"({stats['key_ratio'] * 100:.1f}%) in {stats['seconds']:.2f}s.")
+    return stats
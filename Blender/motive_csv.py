@@ -0,0 +1,411 @@
+"""
+Streaming OptiTrack Motive CSV Take Ingestion with Bulk Keyframe Baking
+
+Reads a Motive CSV export of skeleton bone transforms in fixed-size chunks of frames
+into NumPy arrays (memory stays bounded by the chunk plus the baked result), converts
+the Motive world transforms to pose-bone basis transforms of the armature prepared by
+SkeletalMeshPreparation, and bakes them onto an Action with ``keyframe_points.add`` and
+``foreach_set`` (never per-frame ``keyframe_insert``).
+
+Motive bone rotations are taken relative to an identity rest orientation (Motive's
+calibration pose), so each bone's Blender rest orientation is composed onto them.
+"""
+import io
+import itertools
+import re
+import time
+
+import numpy as np
+
+try:
+    import bpy
+except ImportError:
+    # The Reader and Conversion also Run outside Blender (e.g. the Replay Server)
+    bpy = None
+
+PROGRAM_NAME = "OptiSkelUE5Pipe-MotiveCSV"
+
+#region DATA
+# Motive Skeleton Segment Names to the Bone Names of Motive's FBX Export
+MOTIVE_CSV_BONE_MAP = {
+    "Hip": "Hips", "Ab": "Spine", "Chest": "Spine1", "Neck": "Neck", "Head": "Head",
+    "LShoulder": "LeftShoulder", "LUArm": "LeftArm", "LFArm": "LeftForeArm", "LHand": "LeftHand",
+    "RShoulder": "RightShoulder", "RUArm": "RightArm", "RFArm": "RightForeArm", "RHand": "RightHand",
+    "LThigh": "LeftUpLeg", "LShin": "LeftLeg", "LFoot": "LeftFoot", "LToe": "LeftToeBase",
+    "RThigh": "RightUpLeg", "RShin": "RightLeg", "RFoot": "RightFoot", "RToe": "RightToeBase",
+}
+
+MOTIVE_LENGTH_UNITS = {"Meters": 1.0, "Centimeters": 0.01, "Millimeters": 0.001}
+
+# Motive is Y-Up, Blender is Z-Up: (x, y, z) -> (x, -z, y), as the FBX Importer Converts
+MOTIVE_TO_BLENDER_AXES = np.array([
+    [1.0, 0.0, 0.0],
+    [0.0, 0.0, -1.0],
+    [0.0, 1.0, 0.0],
+])
+
+KEYFRAME_INTERPOLATION_LINEAR = 1
+#endregion
+
+_EMPTY_FIELD = re.compile(r",(?=,|\r?\n|$)")
+
+
+#region READER
+def read_motive_header(path: str) -> dict:
+    """
+    Parse the Motive CSV Header: Take Metadata, Data Start Line and the Bone Columns
+    """
+    metadata = {}
+    label_rows = {}
+    property_row = None
+    with open(path, "r", newline="") as csv_file:
+        for line_index, line in enumerate(csv_file):
+            cells = line.rstrip("\r\n").split(",")
+            if line_index == 0:
+                metadata = dict(zip(cells[0::2], cells[1::2]))
+            elif cells[0] == "Frame":
+                component_row = cells
+                data_line = line_index + 1
+                break
+            elif len(cells) > 1 and cells[1]:
+                label_rows[cells[1]] = cells
+            elif any(cell in ("Rotation", "Position") for cell in cells):
+                property_row = cells
+        else:
+            raise ValueError(f"{path} has no 'Frame' header row; is it a Motive CSV export?")
+
+    if metadata.get("Rotation Type", "Quaternion") != "Quaternion":
+        raise ValueError(f"{path} uses {metadata['Rotation Type']} rotations; export Quaternions from Motive.")
+
+    # Bone Columns: {name: {"Rotation": {"X": column, ...}, "Position": {...}}}
+    types, names = label_rows.get("Type", []), label_rows.get("Name", [])
+    bones = {}
+    for column in range(2, len(component_row)):
+        if column >= len(types) or types[column] != "Bone" or property_row is None:
+            continue
+        transform = bones.setdefault(names[column], {"Rotation": {}, "Position": {}})
+        transform.setdefault(property_row[column], {})[component_row[column]] = column
+
+    bones = {name: transform for name, transform in bones.items()
+             if len(transform["Rotation"]) == 4 and len(transform["Position"]) == 3}
+    return {
+        "metadata": metadata,
+        "data_line": data_line,
+        "bones": bones,
+        "frame_rate": float(metadata.get("Export Frame Rate", metadata.get("Capture Frame Rate", 120.0))),
+        "total_frames": int(metadata["Total Exported Frames"]) if metadata.get("Total Exported Frames") else None,
+        "unit_scale": MOTIVE_LENGTH_UNITS.get(metadata.get("Length Units", "Meters"), 1.0),
+        "coordinate_space": metadata.get("Coordinate Space", "Global"),
+    }
+
+
+def bone_columns(header: dict, bone_names: list) -> list:
+    """
+    Column Indices per Bone in Motive Order: Rotation X, Y, Z, W then Position X, Y, Z
+    """
+    columns = []
+    for name in bone_names:
+        transform = header["bones"][name]
+        columns.extend(transform["Rotation"][axis] for axis in "XYZW")
+        columns.extend(transform["Position"][axis] for axis in "XYZ")
+    return columns
+
+
+def iter_motive_chunks(path: str, header: dict, bone_names: list, chunk_frames: int = 4096):
+    """
+    Stream the Take in Chunks of Frames as (times (F,), rotations (F, B, 4) XYZW, positions (F, B, 3)).
+    Empty Fields (Occluded Bones) are NaN.
+    """
+    usecols = [1] + bone_columns(header, bone_names)
+    with open(path, "r", newline="") as csv_file:
+        for _ in range(header["data_line"]):
+            next(csv_file)
+        while True:
+            lines = list(itertools.islice(csv_file, chunk_frames))
+            if not lines:
+                return
+            text = "".join(lines)
+            if ",," in text or ",\n" in text or ",\r" in text:
+                text = _EMPTY_FIELD.sub(",nan", text)
+            values = np.loadtxt(io.StringIO(text), delimiter=",", usecols=usecols, ndmin=2)
+            transforms = values[:, 1:].reshape(len(values), len(bone_names), 7)
+            yield values[:, 0], transforms[:, :, :4], transforms[:, :, 4:]
+
+
+def count_frames(path: str, header: dict) -> int:
+    """
+    Count the Data Rows when the Header doesn't Carry the Exported Frame Count
+    """
+    with open(path, "rb") as csv_file:
+        return sum(chunk.count(b"\n") for chunk in iter(lambda: csv_file.read(1 << 24), b"")) - header["data_line"]
+#endregion
+
+#region CONVERSION
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """
+    (..., 4) WXYZ Quaternions to (..., 3, 3) Rotation Matrices
+    """
+    quaternions = quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+    w, x, y, z = np.moveaxis(quaternions, -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=-1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=-1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=-1),
+    ], axis=-2)
+
+
+def matrices_to_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """
+    (..., 3, 3) Rotation Matrices to (..., 4) WXYZ Quaternions (Branch-Free over the Batch)
+    """
+    m = matrices
+    trace = m[..., 0, 0] + m[..., 1, 1] + m[..., 2, 2]
+    candidates = np.stack([
+        np.stack([1 + trace, m[..., 2, 1] - m[..., 1, 2], m[..., 0, 2] - m[..., 2, 0], m[..., 1, 0] - m[..., 0, 1]], -1),
+        np.stack([m[..., 2, 1] - m[..., 1, 2], 1 + m[..., 0, 0] - m[..., 1, 1] - m[..., 2, 2],
+                  m[..., 0, 1] + m[..., 1, 0], m[..., 0, 2] + m[..., 2, 0]], -1),
+        np.stack([m[..., 0, 2] - m[..., 2, 0], m[..., 0, 1] + m[..., 1, 0],
+                  1 + m[..., 1, 1] - m[..., 0, 0] - m[..., 2, 2], m[..., 1, 2] + m[..., 2, 1]], -1),
+        np.stack([m[..., 1, 0] - m[..., 0, 1], m[..., 0, 2] + m[..., 2, 0],
+                  m[..., 1, 2] + m[..., 2, 1], 1 + m[..., 2, 2] - m[..., 0, 0] - m[..., 1, 1]], -1),
+    ], axis=-2)
+    # Use the Numerically Largest Candidate per Matrix
+    pivots = np.stack([trace, m[..., 0, 0], m[..., 1, 1], m[..., 2, 2]], -1).argmax(-1)
+    quaternions = np.take_along_axis(candidates, pivots[..., None, None], axis=-2)[..., 0, :]
+    return quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+
+def make_quaternions_continuous(quaternions: np.ndarray, previous: np.ndarray = None) -> np.ndarray:
+    """
+    Flip (F, B, 4) Quaternions onto the Hemisphere of the Previous Frame so Curves don't Jump
+    """
+    reference = quaternions[:-1] if previous is None else np.concatenate([previous[None], quaternions[:-1]])
+    flips = np.sum(quaternions[1 if previous is None else 0:] * reference, axis=-1) < 0
+    if previous is None:
+        flips = np.concatenate([np.zeros((1,) + flips.shape[1:], dtype=bool), flips])
+    signs = np.where(np.cumsum(flips, axis=0) % 2 == 1, -1.0, 1.0)
+    return quaternions * signs[..., None]
+
+
+def forward_fill(values: np.ndarray, previous: np.ndarray = None) -> np.ndarray:
+    """
+    Replace NaN Frames of (F, B, C) Values by the Last Valid Frame per Bone (Carrying a Previous Chunk)
+    """
+    if previous is not None:
+        values = np.concatenate([previous[None], values])
+    valid = ~np.isnan(values).any(axis=-1)
+    indices = np.where(valid, np.arange(len(values))[:, None], 0)
+    np.maximum.accumulate(indices, axis=0, out=indices)
+    filled = np.take_along_axis(values, indices[..., None], axis=0)
+    return filled[1:] if previous is not None else filled
+
+
+def motive_to_pose_basis(rotations: np.ndarray, positions: np.ndarray, rest_matrices: np.ndarray,
+                         parent_indices: np.ndarray, armature_matrix_world: np.ndarray,
+                         unit_scale: float = 1.0) -> tuple:
+    """
+    Convert Motive World Transforms (F, B, 4) XYZW / (F, B, 3) to Pose-Bone Basis
+    Locations (F, B, 3) and WXYZ Quaternions (F, B, 4), Batched over Frames and Bones.
+    Rest Matrices are the Bones' Armature-Space matrix_local, Roots have Parent Index -1.
+    """
+    axes = MOTIVE_TO_BLENDER_AXES
+
+    # Rest Orientation in World Space (Scale Removed)
+    rest_world = armature_matrix_world @ rest_matrices
+    rest_world_rotations = rest_world[:, :3, :3] / np.linalg.norm(rest_world[:, :3, :3], axis=1, keepdims=True)
+
+    # Motive World to Blender World (Rigid, so Inverses are Transposes)
+    world_rotations = axes @ quaternions_to_matrices(rotations[..., [3, 0, 1, 2]]) @ axes.T @ rest_world_rotations
+    world_locations = (positions * unit_scale) @ axes.T
+
+    # Parent-Relative Pose: Children Relative to their Parent's World Transform, Roots to the Armature
+    is_root = parent_indices < 0
+    safe_parents = np.where(is_root, 0, parent_indices)
+    parent_rotations = world_rotations[:, safe_parents]
+    local_rotations = parent_rotations.swapaxes(-1, -2) @ world_rotations
+    local_locations = ((world_locations - world_locations[:, safe_parents])[..., None, :] @ parent_rotations)[..., 0, :]
+    armature_inverse = np.linalg.inv(armature_matrix_world)
+    local_rotations[:, is_root] = armature_inverse[:3, :3] @ world_rotations[:, is_root]
+    local_locations[:, is_root] = world_locations[:, is_root] @ armature_inverse[:3, :3].T + armature_inverse[:3, 3]
+
+    # Against the Parent-Relative Rest
+    parent_rest = np.where(is_root[:, None, None], np.eye(4), rest_matrices[safe_parents])
+    rest_relative_inverse = np.linalg.inv(np.linalg.inv(parent_rest) @ rest_matrices)
+    basis_rotations = rest_relative_inverse[:, :3, :3] @ local_rotations
+    basis_locations = (rest_relative_inverse[:, :3, :3] @ local_locations[..., None])[..., 0] + rest_relative_inverse[:, :3, 3]
+
+    basis_rotations /= np.linalg.norm(basis_rotations, axis=-2, keepdims=True)
+    return basis_locations, matrices_to_quaternions(basis_rotations)
+#endregion
+
+#region BLENDER
+def match_bones(header: dict, selected_armature, bone_map: dict = None) -> list:
+    """
+    Pair Motive CSV Bones with Armature Bones as (CSV Name, Pose Bone Name), Ignoring Prefixes
+    """
+    bone_map = MOTIVE_CSV_BONE_MAP if bone_map is None else bone_map
+    armature_bones = {pose_bone.name.split("_")[-1]: pose_bone.name for pose_bone in selected_armature.pose.bones}
+    pairs = []
+    for csv_name in header["bones"]:
+        segment = csv_name.split(":")[-1]
+        armature_name = armature_bones.get(bone_map.get(segment, segment)) or armature_bones.get(segment)
+        if armature_name is not None:
+            pairs.append((csv_name, armature_name))
+    return pairs
+
+
+def read_rest_pose(selected_armature, bone_names: list) -> tuple:
+    """
+    Armature-Space Rest Matrices (B, 4, 4) and Parent Indices (B,) of the Given Bones
+    """
+    bones = selected_armature.data.bones
+    all_rest = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get("matrix_local", all_rest)
+    all_rest = all_rest.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    bone_indices = {bone.name: index for index, bone in enumerate(bones)}
+
+    rest_matrices = all_rest[[bone_indices[name] for name in bone_names]]
+    rest_parents = []
+    for name in bone_names:
+        parent = bones[name].parent
+        # Parents outside the Take are Skipped to the Nearest Baked Ancestor
+        while parent is not None and parent.name not in bone_names:
+            parent = parent.parent
+        rest_parents.append(bone_names.index(parent.name) if parent is not None else -1)
+    return rest_matrices, np.array(rest_parents)
+
+
+def read_motive_csv(path: str, selected_armature, chunk_frames: int = 4096, bone_map: dict = None) -> dict:
+    """
+    Stream a Motive CSV Take into Preallocated Pose-Bone Basis Arrays for the Armature
+    """
+    header = read_motive_header(path)
+    if header["coordinate_space"] != "Global":
+        raise ValueError(f"{path} uses {header['coordinate_space']} coordinates; export Global from Motive.")
+
+    pairs = match_bones(header, selected_armature, bone_map)
+    csv_names = [csv_name for csv_name, _ in pairs]
+    armature_names = [armature_name for _, armature_name in pairs]
+    rest_matrices, parent_indices = read_rest_pose(selected_armature, armature_names)
+    armature_matrix_world = np.asarray(selected_armature.matrix_world, dtype=np.float64)
+
+    # Preallocate for the Whole Take, so Memory is the Result plus one Chunk
+    frame_count = header["total_frames"] or count_frames(path, header)
+    times = np.empty(frame_count, dtype=np.float64)
+    locations = np.empty((len(pairs), frame_count, 3), dtype=np.float32)
+    quaternions = np.empty((len(pairs), frame_count, 4), dtype=np.float32)
+
+    filled = 0
+    last_location = last_quaternion = None
+    for chunk_times, rotations, positions in iter_motive_chunks(path, header, csv_names, chunk_frames):
+        chunk_locations, chunk_quaternions = motive_to_pose_basis(
+            rotations, positions, rest_matrices, parent_indices, armature_matrix_world, header["unit_scale"])
+        chunk_locations = forward_fill(chunk_locations, last_location)
+        chunk_quaternions = make_quaternions_continuous(forward_fill(chunk_quaternions, last_quaternion),
+                                                        last_quaternion)
+        last_location, last_quaternion = chunk_locations[-1], chunk_quaternions[-1]
+
+        end = filled + len(chunk_times)
+        if end > frame_count:
+            frame_count = max(end, frame_count * 2)
+            times = np.resize(times, frame_count)
+            locations = np.resize(locations, (len(pairs), frame_count, 3))
+            quaternions = np.resize(quaternions, (len(pairs), frame_count, 4))
+        times[filled:end] = chunk_times
+        locations[:, filled:end] = chunk_locations.transpose(1, 0, 2)
+        quaternions[:, filled:end] = chunk_quaternions.transpose(1, 0, 2)
+        filled = end
+
+    # Bones Missing from the Start of the Take Stay at Rest
+    locations = np.nan_to_num(locations[:, :filled], nan=0.0)
+    quaternions = quaternions[:, :filled]
+    quaternions[np.isnan(quaternions).any(axis=-1)] = (1.0, 0.0, 0.0, 0.0)
+    return {
+        "header": header,
+        "bone_names": armature_names,
+        "times": times[:filled],
+        "locations": locations,
+        "quaternions": quaternions,
+    }
+
+
+def ensure_action_fcurves(selected_armature, action):
+    """
+    Assign the Action and Return its F-Curve Collection (Slotted Actions from Blender 4.4)
+    """
+    if selected_armature.animation_data is None:
+        selected_armature.animation_data_create()
+    selected_armature.animation_data.action = action
+    if bpy.app.version >= (4, 4, 0):
+        from bpy_extras.anim_utils import action_ensure_channelbag_for_slot
+        if selected_armature.animation_data.action_slot is None:
+            selected_armature.animation_data.action_slot = action.slots.new(
+                id_type="OBJECT", name=selected_armature.name)
+        return action_ensure_channelbag_for_slot(action, selected_armature.animation_data.action_slot).fcurves
+    return action.fcurves
+
+
+def bake_channels(fcurves, data_path: str, group_name: str, key_frames: np.ndarray, channels: np.ndarray):
+    """
+    Bake (F, C) Values as C Linear F-Curves in Bulk (keyframe_points.add + foreach_set)
+    """
+    frame_count = len(key_frames)
+    co = np.empty(frame_count * 2, dtype=np.float32)
+    co[0::2] = key_frames
+    interpolation = np.full(frame_count, KEYFRAME_INTERPOLATION_LINEAR, dtype=np.int32)
+    for index in range(channels.shape[1]):
+        fcurve = fcurves.find(data_path, index=index)
+        if fcurve is not None:
+            fcurves.remove(fcurve)
+        if bpy.app.version >= (4, 4, 0):
+            fcurve = fcurves.new(data_path, index=index)
+        else:
+            fcurve = fcurves.new(data_path, index=index, action_group=group_name)
+        co[1::2] = channels[:, index]
+        fcurve.keyframe_points.add(frame_count)
+        fcurve.keyframe_points.foreach_set("co", co)
+        fcurve.keyframe_points.foreach_set("interpolation", interpolation)
+        fcurve.update()
+
+
+def bake_motive_csv(path: str, selected_armature, action_name: str = None, frame_start: int = 1,
+                    chunk_frames: int = 4096, bone_map: dict = None, set_scene_fps: bool = True) -> dict:
+    """
+    Bake a Motive CSV Take onto the Armature as one Action and Return Throughput Statistics
+    """
+    start = time.perf_counter()
+    take = read_motive_csv(path, selected_armature, chunk_frames=chunk_frames, bone_map=bone_map)
+    read_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scene = bpy.context.scene
+    frame_rate = take["header"]["frame_rate"]
+    if set_scene_fps and float(frame_rate).is_integer():
+        scene.render.fps, scene.render.fps_base = int(frame_rate), 1.0
+    key_frames = frame_start + (take["times"] - take["times"][0]) * scene.render.fps / scene.render.fps_base
+
+    action = bpy.data.actions.new(action_name or take["header"]["metadata"].get("Take Name") or "MotiveTake")
+    fcurves = ensure_action_fcurves(selected_armature, action)
+    for bone_index, bone_name in enumerate(take["bone_names"]):
+        pose_bone = selected_armature.pose.bones[bone_name]
+        pose_bone.rotation_mode = "QUATERNION"
+        data_path = f'pose.bones["{bone_name}"]'
+        bake_channels(fcurves, data_path + ".location", bone_name, key_frames, take["locations"][bone_index])
+        bake_channels(fcurves, data_path + ".rotation_quaternion", bone_name, key_frames,
+                      take["quaternions"][bone_index])
+    scene.frame_start, scene.frame_end = frame_start, int(np.ceil(key_frames[-1]))
+    bake_seconds = time.perf_counter() - start
+
+    frame_count = len(take["times"])
+    stats = {
+        "action": action.name,
+        "frames": frame_count,
+        "bones": len(take["bone_names"]),
+        "read_seconds": read_seconds,
+        "bake_seconds": bake_seconds,
+        "frames_per_second": frame_count / (read_seconds + bake_seconds),
+    }
+    print(PROGRAM_NAME + f": Baked {frame_count} frames of {stats['bones']} bones onto {selected_armature.name} "
+          f"({stats['frames_per_second']:.0f} frames/s).")
+    return stats
+#endregion
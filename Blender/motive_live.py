@@ -0,0 +1,503 @@
+"""
+Live Preview of a Motive Skeleton Stream on the Prepared Armature
+
+Receives skeleton frames over UDP in a NatNet-like packet format with an asyncio receiver
+(on its own thread) into a bounded ring buffer. A Blender timer takes the newest frame,
+drops the older ones (and frames older than the latency bound), converts it with the
+motive_csv conversion and sets the pose-bone basis matrices of the armature prepared by
+SkeletalMeshPreparation in one ``foreach_set``. Latency and dropped frames are tracked.
+
+The replay server streams a recorded Motive CSV take at its frame rate, so the preview
+and its statistics can be tested offline:
+
+    python motive_live.py replay take.csv --port 1511 --loop              # Stream a Take
+    python motive_live.py monitor --port 1511 --seconds 10                # Receive and Report (no Blender)
+    python motive_live.py offline take.csv --fps 60 --apply-ms 5          # Both in one Process
+
+In Blender, run this script with the prepared armature active to preview port 1511.
+
+Packets (little-endian): uint16 message id, uint16 payload bytes, then the payload.
+    MODEL_DEF (5):      bone names, NUL-separated UTF-8 (a bone's id is its index)
+    FRAME_OF_DATA (7):  uint32 frame number, float64 take time (s), float64 send time (Unix s),
+                        uint16 bone count, then per bone: uint16 id, float32 x y z (m), float32 qx qy qz qw
+"""
+import argparse
+import asyncio
+import collections
+import os
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+try:
+    import bpy
+except ImportError:
+    # The Receiver, Monitor and Replay Server also Run outside Blender
+    bpy = None
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from motive_csv import (iter_motive_chunks, match_bones, motive_to_pose_basis, quaternions_to_matrices,
+                        read_motive_header, read_rest_pose)
+
+PROGRAM_NAME = "OptiSkelUE5Pipe-MotiveLive"
+
+#region DATA
+DEFAULT_PORT = 1511
+
+MESSAGE_MODEL_DEF = 5
+MESSAGE_FRAME_OF_DATA = 7
+
+PACKET_HEADER = struct.Struct("<HH")
+FRAME_HEADER = struct.Struct("<IddH")
+BONE_DTYPE = np.dtype([("id", "<u2"), ("position", "<f4", 3), ("rotation", "<f4", 4)])
+
+# Largest Skeleton a Frame Packet Carries (the Payload Size is a uint16)
+MAX_STREAM_BONES = (0xFFFF - FRAME_HEADER.size) // BONE_DTYPE.itemsize
+
+# The Replay Server Re-Sends the Bone Names this often, for Receivers Started Late
+MODEL_DEF_INTERVAL = 1.0
+
+MotiveFrame = collections.namedtuple("MotiveFrame", "frame_number timestamp sent received bone_ids positions rotations")
+#endregion
+
+#region PACKETS
+def encode_model_def(bone_names: list) -> bytes:
+    payload = "\0".join(bone_names).encode()
+    return PACKET_HEADER.pack(MESSAGE_MODEL_DEF, len(payload)) + payload
+
+
+def encode_frame(frame_number: int, timestamp: float, positions: np.ndarray, rotations: np.ndarray,
+                 sent: float = None) -> bytes:
+    """
+    Frame of (B, 3) Positions (m) and (B, 4) XYZW Rotations, Bone Ids in Order (NaN Bones are Left Out)
+    """
+    valid = ~(np.isnan(positions).any(axis=-1) | np.isnan(rotations).any(axis=-1))
+    bones = np.empty(int(valid.sum()), dtype=BONE_DTYPE)
+    bones["id"] = np.flatnonzero(valid)
+    bones["position"] = positions[valid]
+    bones["rotation"] = rotations[valid]
+    payload = FRAME_HEADER.pack(frame_number, timestamp, time.time() if sent is None else sent, len(bones))
+    payload += bones.tobytes()
+    return PACKET_HEADER.pack(MESSAGE_FRAME_OF_DATA, len(payload)) + payload
+
+
+def decode_packet(data: bytes, received: float = None):
+    """
+    (Message Id, Bone Names or MotiveFrame), Raising ValueError on a Malformed Packet
+    """
+    if len(data) < PACKET_HEADER.size:
+        raise ValueError("Packet Shorter than its Header")
+    message_id, payload_size = PACKET_HEADER.unpack_from(data)
+    if len(data) != PACKET_HEADER.size + payload_size:
+        raise ValueError(f"Packet of {len(data)} Bytes Declares a {payload_size} Byte Payload")
+    if message_id == MESSAGE_MODEL_DEF:
+        return message_id, data[PACKET_HEADER.size:].decode().split("\0")
+    if message_id == MESSAGE_FRAME_OF_DATA:
+        frame_number, timestamp, sent, bone_count = FRAME_HEADER.unpack_from(data, PACKET_HEADER.size)
+        offset = PACKET_HEADER.size + FRAME_HEADER.size
+        if len(data) - offset != bone_count * BONE_DTYPE.itemsize:
+            raise ValueError(f"Frame {frame_number} Declares {bone_count} Bones")
+        bones = np.frombuffer(data, dtype=BONE_DTYPE, count=bone_count, offset=offset)
+        return message_id, MotiveFrame(frame_number, timestamp, sent, time.time() if received is None else received,
+                                       bones["id"], bones["position"], bones["rotation"])
+    raise ValueError(f"Unknown Message Id {message_id}")
+#endregion
+
+#region RECEIVER
+class FrameRingBuffer:
+    """
+    Bounded Buffer between the Receiver Thread and the Preview: the Receiver Pushes every Frame
+    (a Full Buffer Overwrites its Oldest), the Preview Takes the Newest and Drops the Rest
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.frames = collections.deque(maxlen=capacity)
+        self.lock = threading.Lock()
+        self.received = 0
+        self.overwritten = 0
+
+    def push(self, frame: MotiveFrame):
+        with self.lock:
+            if len(self.frames) == self.frames.maxlen:
+                self.overwritten += 1
+            self.frames.append(frame)
+            self.received += 1
+
+    def take_latest(self) -> tuple:
+        """
+        Newest Frame (or None) and how many Older Frames were Dropped with it
+        """
+        with self.lock:
+            if not self.frames:
+                return None, 0
+            frame = self.frames[-1]
+            skipped = len(self.frames) - 1
+            self.frames.clear()
+        return frame, skipped
+
+
+class MotiveStreamProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, receiver):
+        self.receiver = receiver
+
+    def datagram_received(self, data, addr):
+        try:
+            message_id, value = decode_packet(data)
+        except ValueError:
+            self.receiver.malformed += 1
+            return
+        if message_id == MESSAGE_MODEL_DEF:
+            if value != self.receiver.bone_names:
+                self.receiver.bone_names = value
+        else:
+            self.receiver.ring.push(value)
+
+
+class MotiveStreamReceiver:
+    """
+    asyncio UDP Receiver on a Background Thread, Filling a Ring Buffer (Port 0 Picks a Free Port)
+    """
+
+    def __init__(self, ring: FrameRingBuffer, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.ring = ring
+        self.host = host
+        self.port = port
+        self.bone_names = None
+        self.malformed = 0
+        self.loop = None
+        self.thread = None
+        self.error = None
+
+    def start(self):
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(ready,), name="MotiveStreamReceiver", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def run(self, ready: threading.Event):
+        self.loop = asyncio.new_event_loop()
+        try:
+            transport, _ = self.loop.run_until_complete(self.loop.create_datagram_endpoint(
+                lambda: MotiveStreamProtocol(self), local_addr=(self.host, self.port)))
+        except OSError as error:
+            self.error = error
+            ready.set()
+            self.loop.close()
+            return
+        self.port = transport.get_extra_info("sockname")[1]
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            transport.close()
+            self.loop.run_until_complete(asyncio.sleep(0))
+            self.loop.close()
+
+    def stop(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+        self.thread = None
+#endregion
+
+#region PREVIEW
+class LivePreview:
+    """
+    Apply the Newest Streamed Frame to an Armature on a Timer, Dropping Stale Frames.
+    Without an Armature it only Receives and Measures (Monitor Mode).
+    """
+
+    def __init__(self, selected_armature=None, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 fps: float = 60.0, max_latency: float = 0.1, capacity: int = 8, bone_map: dict = None):
+        self.selected_armature = selected_armature
+        self.interval = 1.0 / fps
+        self.max_latency = max_latency
+        self.bone_map = bone_map
+        self.ring = FrameRingBuffer(capacity)
+        self.receiver = MotiveStreamReceiver(self.ring, host, port)
+        self.running = False
+        # Blender Finds Timers by Identity, and every self.tick Access is a New Bound Method
+        self._tick = self.tick
+
+        self.bone_names = None
+        self.stream_indices = None
+        self.pose_indices = None
+        self.basis = None
+        self.last_sent = float("-inf")
+        self.clock_offset = None
+        self.last_frame = None
+        self.applied = 0
+        self.dropped = {"stale": 0, "late": 0, "out_of_order": 0, "unmapped": 0}
+        self.latencies = collections.deque(maxlen=4096)
+
+    def start(self):
+        self.receiver.start()
+        self.running = True
+        if bpy is not None and self.selected_armature is not None:
+            bpy.app.timers.register(self._tick, first_interval=0.0)
+        print(PROGRAM_NAME + f": Previewing port {self.receiver.port} on "
+              f"{self.selected_armature.name if self.selected_armature is not None else 'no armature'}.")
+
+    def stop(self):
+        self.running = False
+        if bpy is not None and bpy.app.timers.is_registered(self._tick):
+            bpy.app.timers.unregister(self._tick)
+        self.receiver.stop()
+        print(PROGRAM_NAME + ": " + format_stats(self.stats()))
+
+    def tick(self):
+        """
+        Timer Callback: Apply the Newest Frame, then Run again after the Interval (or Stop)
+        """
+        if not self.running:
+            return None
+        self.update()
+        return self.interval
+
+    def update(self) -> bool:
+        """
+        Take the Newest Frame and Apply it unless it is Older than the Latency Bound or the Last Applied
+        """
+        frame, skipped = self.ring.take_latest()
+        self.dropped["stale"] += skipped
+        if frame is None:
+            return False
+        if frame.sent < self.last_sent:
+            self.dropped["out_of_order"] += 1
+            return False
+        if self.latency(frame) > self.max_latency:
+            self.dropped["late"] += 1
+            return False
+        if self.receiver.bone_names is None:
+            self.dropped["unmapped"] += 1
+            return False
+        if self.receiver.bone_names is not self.bone_names:
+            self.map_bones(self.receiver.bone_names)
+
+        self.apply_frame(frame)
+        self.last_sent = frame.sent
+        self.last_frame = frame
+        self.applied += 1
+        self.latencies.append(self.latency(frame))
+        return True
+
+    def latency(self, frame: MotiveFrame) -> float:
+        """
+        Seconds since the Frame was Sent, on the Receiver's Clock: its Transit (Receive Time less Send Time,
+        less the Offset between the two Clocks) and its Wait in the Buffer. The Offset is Taken from the
+        First Frame and Lowered by any Frame Arriving Faster, so it Holds the Fastest Transit's Offset
+        """
+        clock_offset = frame.received - frame.sent
+        if self.clock_offset is None or clock_offset < self.clock_offset:
+            self.clock_offset = clock_offset
+        return (frame.received - frame.sent - self.clock_offset) + (time.time() - frame.received)
+
+    def map_bones(self, bone_names: list):
+        """
+        Pair the Streamed Bones with the Armature's and Read its Rest Pose and Current Basis Matrices
+        """
+        self.bone_names = bone_names
+        if self.selected_armature is None:
+            return
+        pairs = match_bones({"bones": dict.fromkeys(bone_names)}, self.selected_armature, self.bone_map)
+        armature_names = [armature_name for _, armature_name in pairs]
+        pose_bones = self.selected_armature.pose.bones
+        pose_indices = {pose_bone.name: index for index, pose_bone in enumerate(pose_bones)}
+        stream_indices = {name: index for index, name in enumerate(bone_names)}
+        self.stream_indices = np.array([stream_indices[csv_name] for csv_name, _ in pairs], dtype=np.intp)
+        self.pose_indices = np.array([pose_indices[name] for name in armature_names], dtype=np.intp)
+        self.rest_matrices, self.parent_indices = read_rest_pose(self.selected_armature, armature_names)
+
+        # Bones not in the Stream Keep their Current Basis
+        basis = np.empty(len(pose_bones) * 16, dtype=np.float32)
+        pose_bones.foreach_get("matrix_basis", basis)
+        self.basis = basis.reshape(-1, 4, 4).transpose(0, 2, 1).copy()
+        print(PROGRAM_NAME + f": Streaming {len(pairs)} of {len(bone_names)} bones onto {self.selected_armature.name}.")
+
+    def apply_frame(self, frame: MotiveFrame):
+        """
+        Convert the Frame to Pose-Bone Basis Matrices and Set them All at once (Occluded Bones Keep their Pose)
+        """
+        if self.selected_armature is None:
+            return
+        positions = np.full((len(self.bone_names), 3), np.nan)
+        rotations = np.full((len(self.bone_names), 4), np.nan)
+        positions[frame.bone_ids] = frame.positions
+        rotations[frame.bone_ids] = frame.rotations
+        positions, rotations = positions[self.stream_indices], rotations[self.stream_indices]
+
+        locations, quaternions = motive_to_pose_basis(
+            rotations[None], positions[None], self.rest_matrices, self.parent_indices,
+            np.asarray(self.selected_armature.matrix_world, dtype=np.float64))
+        # Occluded Bones (and Children Posed Relative to them) come out NaN
+        visible = ~(np.isnan(locations[0]).any(axis=-1) | np.isnan(quaternions[0]).any(axis=-1))
+        pose_indices = self.pose_indices[visible]
+        self.basis[pose_indices, :3, :3] = quaternions_to_matrices(quaternions[0, visible])
+        self.basis[pose_indices, :3, 3] = locations[0, visible]
+
+        # Blender Flattens Matrices Column-Major
+        self.selected_armature.pose.bones.foreach_set("matrix_basis", self.basis.transpose(0, 2, 1).ravel())
+        self.selected_armature.update_tag()
+
+    def stats(self) -> dict:
+        latencies = np.array(self.latencies) * 1000.0
+        return {
+            "received": self.ring.received,
+            "applied": self.applied,
+            "dropped": dict(self.dropped, overwritten=self.ring.overwritten, malformed=self.receiver.malformed),
+            "pending": len(self.ring.frames),
+            "latency_ms": {
+                "mean": float(latencies.mean()) if len(latencies) else None,
+                "p95": float(np.percentile(latencies, 95)) if len(latencies) else None,
+                "max": float(latencies.max()) if len(latencies) else None,
+            },
+        }
+
+
+def format_stats(stats: dict) -> str:
+    latency = stats["latency_ms"]
+    dropped = ", ".join(f"{count} {reason}" for reason, count in stats["dropped"].items() if count)
+    text = f"{stats['applied']} of {stats['received']} frames applied (dropped: {dropped or 'none'})"
+    if latency["mean"] is not None:
+        text += f", latency mean {latency['mean']:.1f} ms, p95 {latency['p95']:.1f} ms, max {latency['max']:.1f} ms"
+    return text
+
+
+async def drive_preview(preview: LivePreview, seconds: float, apply_seconds: float = 0.0):
+    """
+    Tick a Preview from an asyncio Loop instead of a Blender Timer (Optionally Simulating Apply Cost)
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        tick_start = time.perf_counter()
+        if preview.update() and apply_seconds:
+            time.sleep(apply_seconds)
+        await asyncio.sleep(max(0.0, preview.interval - (time.perf_counter() - tick_start)))
+#endregion
+
+#region REPLAY
+async def replay_take(path: str, host: str = "127.0.0.1", port: int = DEFAULT_PORT, speed: float = 1.0,
+                      loop_take: bool = False, seconds: float = None, chunk_frames: int = 4096) -> dict:
+    """
+    Stream a Motive CSV Take as Frame Packets at its Frame Rate (Scaled by Speed), Positions in Meters
+    """
+    header = read_motive_header(path)
+    bone_names = list(header["bones"])
+    if len(bone_names) > MAX_STREAM_BONES:
+        raise ValueError(f"{path} has {len(bone_names)} bones; a frame packet carries at most {MAX_STREAM_BONES}.")
+    event_loop = asyncio.get_running_loop()
+    transport, _ = await event_loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=(host, port))
+    model_def = encode_model_def(bone_names)
+
+    sent = 0
+    start = event_loop.time()
+    last_model_def = float("-inf")
+    take_offset = 0.0
+    first_time = None
+    try:
+        while True:
+            take_time = 0.0
+            for times, rotations, positions in iter_motive_chunks(path, header, bone_names, chunk_frames):
+                positions = positions * header["unit_scale"]
+                for index, frame_time in enumerate(times):
+                    first_time = frame_time if first_time is None else first_time
+                    take_time = frame_time - first_time
+                    due = start + (take_offset + take_time) / speed
+                    if seconds is not None and due - start > seconds:
+                        return {"frames": sent, "seconds": event_loop.time() - start}
+                    delay = due - event_loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    if event_loop.time() - last_model_def >= MODEL_DEF_INTERVAL:
+                        transport.sendto(model_def)
+                        last_model_def = event_loop.time()
+                    transport.sendto(encode_frame(sent, frame_time, positions[index], rotations[index]))
+                    sent += 1
+            if not loop_take:
+                return {"frames": sent, "seconds": event_loop.time() - start}
+            take_offset += take_time + 1.0 / header["frame_rate"]
+    finally:
+        transport.close()
+
+
+async def run_offline(path: str, preview: LivePreview, seconds: float, speed: float = 1.0,
+                      apply_seconds: float = 0.0) -> dict:
+    """
+    Replay a Take (Looped) to a Preview in this Process and Return the Preview's Statistics
+    """
+    preview.receiver.start()
+    try:
+        replay = asyncio.ensure_future(replay_take(path, port=preview.receiver.port, speed=speed, loop_take=True,
+                                                   seconds=seconds))
+        await drive_preview(preview, seconds, apply_seconds)
+        replay_stats = await replay
+        # Frames still in Flight when the Replay Ended are Received, not Lost
+        await asyncio.sleep(0.05)
+    finally:
+        preview.receiver.stop()
+    stats = preview.stats()
+    stats["sent"] = replay_stats["frames"]
+    return stats
+#endregion
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    replay = subparsers.add_parser("replay", help="Stream a Motive CSV Take")
+    replay.add_argument("take", help="Motive CSV Take (Global Quaternions)")
+    replay.add_argument("--host", default="127.0.0.1")
+    replay.add_argument("--port", type=int, default=DEFAULT_PORT)
+    replay.add_argument("--speed", type=float, default=1.0, help="Playback Speed Factor")
+    replay.add_argument("--loop", action="store_true", help="Restart the Take at its End")
+    replay.add_argument("--seconds", type=float, default=None, help="Stop after this many Seconds")
+
+    for name, help_text in (("monitor", "Receive a Stream and Report Latency and Drops"),
+                            ("offline", "Replay a Take to a Local Monitor and Report Latency and Drops")):
+        command = subparsers.add_parser(name, help=help_text)
+        if name == "offline":
+            command.add_argument("take", help="Motive CSV Take (Global Quaternions)")
+            command.add_argument("--speed", type=float, default=1.0, help="Playback Speed Factor")
+        else:
+            command.add_argument("--host", default="127.0.0.1")
+            command.add_argument("--port", type=int, default=DEFAULT_PORT)
+        command.add_argument("--seconds", type=float, default=10.0)
+        command.add_argument("--fps", type=float, default=60.0, help="Preview Updates per Second")
+        command.add_argument("--max-latency", type=float, default=0.1, help="Drop Frames Older than this (s)")
+        command.add_argument("--capacity", type=int, default=8, help="Ring Buffer Frames")
+        command.add_argument("--apply-ms", type=float, default=0.0, help="Simulated Cost of Applying a Frame")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "replay":
+        stats = asyncio.run(replay_take(args.take, args.host, args.port, args.speed, args.loop, args.seconds))
+        print(PROGRAM_NAME + f": Sent {stats['frames']} frames in {stats['seconds']:.1f}s.")
+    elif args.command == "monitor":
+        preview = LivePreview(None, args.host, args.port, args.fps, args.max_latency, args.capacity)
+        preview.start()
+        try:
+            asyncio.run(drive_preview(preview, args.seconds, args.apply_ms / 1000.0))
+        finally:
+            preview.stop()
+    else:
+        preview = LivePreview(None, port=0, fps=args.fps, max_latency=args.max_latency, capacity=args.capacity)
+        stats = asyncio.run(run_offline(args.take, preview, args.seconds, args.speed, args.apply_ms / 1000.0))
+        print(PROGRAM_NAME + f": Sent {stats['sent']} frames; " + format_stats(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    if bpy is not None and bpy.context.active_object is not None and bpy.context.active_object.type == "ARMATURE":
+        live_preview = LivePreview(bpy.context.active_object)
+        live_preview.start()
+    else:
+        sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Content-Addressed Cache of Prepared Skeletal-Mesh FBX Files for the Batch Stage
+
+Prepared outputs are stored under a key hashing the input skeleton, the preparation
+options and the script version, so takes sharing a skeleton reuse one prepared FBX.
+Byte-identical inputs are additionally memoized by file digest (and script version),
+letting batch_prepare.py skip Blender entirely on re-runs. Eviction is least-recently-used, bounded by total size
+and entry count. Pure Python, usable both inside and outside Blender.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+# Sources the Prepared Output Depends on, Relative to this Directory (pipeline_trace Proxies bpy.ops)
+SCRIPT_SOURCES = ("skeletal_mesh_preparation.py", "batch_worker.py", "prep_cache.py", "keyframe_reduction.py",
+                  os.path.join(os.pardir, "Common", "pipeline_trace.py"))
+
+# Worker Options that don't Change the Prepared Output
+LOCATION_OPTIONS = ("cache_dir", "trace_dir")
+
+
+def script_version() -> str:
+    """
+    Hash the Preparation Scripts, so any Code Change Invalidates the Cache
+    """
+    digest = hashlib.sha256()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    for source in SCRIPT_SOURCES:
+        with open(os.path.join(script_dir, source), "rb") as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+def options_digest(worker_options: dict) -> str:
+    """
+    Hash the Worker Options that Affect the Output (the Cache and Trace Locations Excluded)
+    """
+    relevant_options = {key: value for key, value in worker_options.items() if key not in LOCATION_OPTIONS}
+    return hashlib.sha256(json.dumps(relevant_options, sort_keys=True).encode()).hexdigest()
+
+
+def cache_key(skeleton_digest: str, worker_options: dict, version: str = None) -> str:
+    """
+    Content Address of a Prepared Output
+    """
+    digest = hashlib.sha256()
+    for part in (skeleton_digest, options_digest(worker_options), version or script_version()):
+        digest.update(part.encode())
+    return digest.hexdigest()
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Stream a File through SHA-256
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as input_file:
+        for chunk in iter(lambda: input_file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PrepCache:
+
+    def __init__(self, cache_dir: str, max_bytes: int = None, max_entries: int = None, version: str = None):
+        self.cache_dir = cache_dir
+        # Script Version (Computed once per Cache) the Input Memos are Valid for
+        self.version = script_version() if version is None else version
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.inputs_dir = os.path.join(cache_dir, "inputs")
+        self.stats_path = os.path.join(cache_dir, "stats.json")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.inputs_dir, exist_ok=True)
+
+    def object_path(self, key: str) -> str:
+        return os.path.join(self.objects_dir, key + ".fbx")
+
+    def lookup(self, key: str) -> str:
+        """
+        Get the Cached Output for a Key (Touching it for LRU), or None
+        """
+        path = self.object_path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def store(self, key: str, output_path: str):
+        """
+        Copy a Prepared Output into the Cache (Atomic, Safe with Concurrent Workers)
+        """
+        temp_path = self.object_path(key) + f".{os.getpid()}.tmp"
+        shutil.copyfile(output_path, temp_path)
+        os.replace(temp_path, self.object_path(key))
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """
+        Copy a Cached Output to the Output Path if the Key is Cached
+        """
+        path = self.lookup(key)
+        if path is None:
+            return False
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        shutil.copyfile(path, output_path)
+        return True
+
+    def input_memo_path(self, input_digest: str, worker_options: dict) -> str:
+        return os.path.join(self.inputs_dir,
+                            f"{input_digest}-{options_digest(worker_options)[:16]}-{self.version[:16]}.key")
+
+    def lookup_input(self, input_digest: str, worker_options: dict) -> str:
+        """
+        Get the Cache Key Previously Produced by a Byte-Identical Input with the Same Scripts, or None
+        """
+        try:
+            with open(self.input_memo_path(input_digest, worker_options)) as memo_file:
+                return memo_file.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def store_input(self, input_digest: str, worker_options: dict, key: str):
+        with open(self.input_memo_path(input_digest, worker_options), "w") as memo_file:
+            memo_file.write(key)
+
+    def entries(self) -> list:
+        """
+        Cached Outputs as (Last Used, Size, Path), Least Recently Used First
+        """
+        entries = []
+        with os.scandir(self.objects_dir) as scan:
+            for entry in scan:
+                if entry.name.endswith(".fbx"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self) -> int:
+        """
+        Remove Least Recently Used Outputs until the Size and Entry Limits Hold
+        """
+        entries = self.entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            over_entries = self.max_entries is not None and len(entries) - evicted > self.max_entries
+            if not (over_bytes or over_entries):
+                break
+            os.remove(path)
+            total_bytes -= size
+            evicted += 1
+
+        # Drop Input Memos Pointing at Evicted Outputs
+        if evicted:
+            with os.scandir(self.inputs_dir) as scan:
+                for entry in scan:
+                    with open(entry.path) as memo_file:
+                        key = memo_file.read().strip()
+                    if not os.path.exists(self.object_path(key)):
+                        os.remove(entry.path)
+        return evicted
+
+    def record_stats(self, hits: int, misses: int, input_hits: int, evictions: int) -> dict:
+        """
+        Add a Batch's Hits and Misses to the Cache's Lifetime Statistics
+        """
+        stats = {"hits": 0, "misses": 0, "input_hits": 0, "evictions": 0}
+        if os.path.exists(self.stats_path):
+            with open(self.stats_path) as stats_file:
+                stats.update(json.load(stats_file))
+        stats["hits"] += hits
+        stats["misses"] += misses
+        stats["input_hits"] += input_hits
+        stats["evictions"] += evictions
+        entries = self.entries()
+        stats["entries"] = len(entries)
+        stats["bytes"] = sum(size for _, size, _ in entries)
+        with open(self.stats_path, "w") as stats_file:
+            json.dump(stats, stats_file, indent=2)
+        return stats
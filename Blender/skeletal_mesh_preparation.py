@@ -1,4 +1,23 @@
+import contextlib
+import hashlib
+from types import SimpleNamespace
+
 import bpy
+import bmesh
+import numpy as np
+from mathutils import Matrix
+
+try:
+    # Common is Put on sys.path by the Entry Points (loader.py, batch_prepare.py and batch_worker.py)
+    import pipeline_trace
+except ImportError:
+    # Run on its own (Blender's Text Editor): Trace Nothing
+    pipeline_trace = SimpleNamespace(
+        span=lambda name, **args: contextlib.nullcontext(SimpleNamespace(set=lambda **args: None)),
+        traced=lambda name=None: lambda function: function,
+        count=lambda name, n=1: None,
+        counted=lambda target, name: target,
+    )
 
 PROGRAM_NAME = "OptiSkelUE5Pipe-SKMPrep"
 
@@ -65,59 +84,312 @@ SKP_CHAIN_MATERIAL = {
         }
     }
 }
+
+SKP_FINGER_CHAIN_MATERIAL = {
+    "LeftThumb": {
+        "bones": ["LeftHandThumb"],
+        "material_data": {
+            "color": (250, 190, 212)
+        }
+    },
+    "LeftIndex": {
+        "bones": ["LeftHandIndex"],
+        "material_data": {
+            "color": (0, 128, 128)
+        }
+    },
+    "LeftMiddle": {
+        "bones": ["LeftHandMiddle"],
+        "material_data": {
+            "color": (220, 190, 255)
+        }
+    },
+    "LeftRing": {
+        "bones": ["LeftHandRing"],
+        "material_data": {
+            "color": (170, 110, 40)
+        }
+    },
+    "LeftPinky": {
+        "bones": ["LeftHandPinky"],
+        "material_data": {
+            "color": (255, 250, 200)
+        }
+    },
+    "RightThumb": {
+        "bones": ["RightHandThumb"],
+        "material_data": {
+            "color": (128, 0, 0)
+        }
+    },
+    "RightIndex": {
+        "bones": ["RightHandIndex"],
+        "material_data": {
+            "color": (170, 255, 195)
+        }
+    },
+    "RightMiddle": {
+        "bones": ["RightHandMiddle"],
+        "material_data": {
+            "color": (128, 128, 0)
+        }
+    },
+    "RightRing": {
+        "bones": ["RightHandRing"],
+        "material_data": {
+            "color": (255, 215, 180)
+        }
+    },
+    "RightPinky": {
+        "bones": ["RightHandPinky"],
+        "material_data": {
+            "color": (0, 0, 128)
+        }
+    }
+}
+
+SKP_UE5_MANNEQUIN_CHAIN_MATERIAL = {
+    "Spine": {
+        "bones": ["spine_"],
+        "material_data": SKP_CHAIN_MATERIAL["Spine"]["material_data"]
+    },
+    "Neck": {
+        "bones": ["neck_"],
+        "material_data": SKP_CHAIN_MATERIAL["Neck"]["material_data"]
+    },
+    "Head": {
+        "bones": ["head"],
+        "material_data": SKP_CHAIN_MATERIAL["Head"]["material_data"]
+    },
+    "LeftClavicle": {
+        "bones": ["clavicle_l"],
+        "material_data": SKP_CHAIN_MATERIAL["LeftClavicle"]["material_data"]
+    },
+    "LeftArm": {
+        "bones": ["upperarm_l", "lowerarm_l", "hand_l"],
+        "material_data": SKP_CHAIN_MATERIAL["LeftArm"]["material_data"]
+    },
+    "RightClavicle": {
+        "bones": ["clavicle_r"],
+        "material_data": SKP_CHAIN_MATERIAL["RightClavicle"]["material_data"]
+    },
+    "RightArm": {
+        "bones": ["upperarm_r", "lowerarm_r", "hand_r"],
+        "material_data": SKP_CHAIN_MATERIAL["RightArm"]["material_data"]
+    },
+    "LeftLeg": {
+        "bones": ["thigh_l", "calf_l", "foot_l", "ball_l"],
+        "material_data": SKP_CHAIN_MATERIAL["LeftLeg"]["material_data"]
+    },
+    "RightLeg": {
+        "bones": ["thigh_r", "calf_r", "foot_r", "ball_r"],
+        "material_data": SKP_CHAIN_MATERIAL["RightLeg"]["material_data"]
+    },
+    "Default": {
+        "bones": [],
+        "material_data": SKP_CHAIN_MATERIAL["Default"]["material_data"]
+    }
+}
+
+# Chain Tables by Name. Earlier Chains win when Bone Prefixes Overlap (Fingers before "LeftHand").
+# "strip_prefix" removes the OptiTrack "<Skeleton>_" Prefix before Matching.
+# MetaHuman Bodies use the UE5 Mannequin Bone Names.
+SKP_CHAIN_TABLES = {
+    "OPTITRACK": {
+        "strip_prefix": True,
+        "chains": SKP_CHAIN_MATERIAL
+    },
+    "OPTITRACK_FINGERS": {
+        "strip_prefix": True,
+        "chains": {**SKP_FINGER_CHAIN_MATERIAL, **SKP_CHAIN_MATERIAL}
+    },
+    "UE5_MANNEQUIN": {
+        "strip_prefix": False,
+        "chains": SKP_UE5_MANNEQUIN_CHAIN_MATERIAL
+    },
+    "METAHUMAN": {
+        "strip_prefix": False,
+        "chains": SKP_UE5_MANNEQUIN_CHAIN_MATERIAL
+    }
+}
 #endregion
 
+class ChainIndex:
+    """
+    Bone Name to Chain Index Compiled Once from a Chain Table (Prefix Trie with Memoized Lookups)
+    """
+
+    def __init__(self, chains: dict, strip_prefix: bool = True, default_chain: str = "Default"):
+        self.chains = chains
+        self.strip_prefix = strip_prefix
+        self.default_chain = default_chain
+        self.trie = {}
+        self.lookups = {}
+
+        # Each Trie Node ending a Core Name keeps the Earliest Chain in Table Order
+        for order, (key, value) in enumerate(chains.items()):
+            for core_name in value["bones"]:
+                node = self.trie
+                for char in core_name:
+                    node = node.setdefault(char, {})
+                node[None] = min(node.get(None, (order, key)), (order, key))
+
+    def find(self, bone_name: str) -> str:
+        """
+        Find the Bone's Chain Group (Earliest Chain with a Core Name Prefixing the Bone Name)
+        """
+        chain_group = self.lookups.get(bone_name)
+        if chain_group is None:
+            chain_group = self.lookups[bone_name] = self.match(bone_name)
+        return chain_group
+
+    def match(self, bone_name: str) -> str:
+        """
+        Walk the Trie along the Bone Name
+        """
+        if self.strip_prefix:
+            bone_name = bone_name.split("_")[-1]
+
+        best = None
+        node = self.trie
+        for char in bone_name:
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node and (best is None or node[None] < best):
+                best = node[None]
+        return best[1] if best else self.default_chain
+
 class SkeletalMeshPreparation:
 
     def __init__(self, 
                  mesh_primitive: str = "CUBE", 
                  mesh_size: float = 0.5, 
                  mesh_color_method: str = "CHAIN",
-                 armature_rename: bool = False):
+                 armature_rename: bool = False,
+                 build_mode: str = "OPERATOR",
+                 mesh_instancing: bool = False,
+                 output_mode: str = "OBJECTS",
+                 chain_table = "OPTITRACK"):
         self.mesh_primitive = mesh_primitive
         self.mesh_size = mesh_size
         self.mesh_color_method = mesh_color_method
         self.armature_rename = armature_rename
+        self.build_mode = build_mode
+        self.mesh_instancing = mesh_instancing
+        self.output_mode = output_mode
+
+        # Chain Table by Name (SKP_CHAIN_TABLES) or as a Custom {"strip_prefix", "chains"} Table
+        if isinstance(chain_table, str):
+            chain_table = SKP_CHAIN_TABLES[chain_table]
+        self.chain_index = ChainIndex(chain_table["chains"], strip_prefix=chain_table["strip_prefix"])
+        self.reset_caches()
+
+    def reset_caches(self):
+        """
+        Reset the per-Run Caches of Datablocks and Matrices (and the Operator Call Counting)
+        """
+        self.ops = pipeline_trace.counted(bpy.ops, "bpy.ops")
+        self.shared_meshes = {}
+        self.bone_world_matrices = {}
+        self.chain_materials = {}
+        self.bone_materials = {}
+        self.palette_indices = {}
+        self.placeholder_changes = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
 
     def create_primitive_adapter(self):
         """
         Adapter method to create Blender primitives
         """
         if self.mesh_primitive == "CUBE":
-            bpy.ops.mesh.primitive_cube_add(size=self.mesh_size, location=(0, 0, 0))
+            self.ops.mesh.primitive_cube_add(size=self.mesh_size, location=(0, 0, 0))
             return
         if self.mesh_primitive == "SPHERE":
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=self.mesh_size, location=(0, 0, 0), segments=16, ring_count=8)
+            self.ops.mesh.primitive_uv_sphere_add(radius=self.mesh_size, location=(0, 0, 0), segments=16, ring_count=8)
+
+    def create_primitive_mesh(self, mesh_name: str) -> bpy.types.Mesh:
+        """
+        Create Primitive Mesh Data without Operators (Scale Baked into the Vertices)
+        """
+        bm = bmesh.new()
+        bm.loops.layers.uv.new("UVMap")
+
+        # Same Geometry as the Operator Adapter followed by the Scale Apply
+        scale_matrix = Matrix.Scale(self.mesh_size, 4)
+        if self.mesh_primitive == "CUBE":
+            bmesh.ops.create_cube(bm, size=self.mesh_size, matrix=scale_matrix, calc_uvs=True)
+        if self.mesh_primitive == "SPHERE":
+            bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=self.mesh_size,
+                                      matrix=scale_matrix, calc_uvs=True)
+
+        mesh = bpy.data.meshes.new(mesh_name)
+        bm.to_mesh(mesh)
+        bm.free()
+        return mesh
+
+    def get_shared_mesh(self, bone_name: str) -> bpy.types.Mesh:
+        """
+        Get the Placeholder Mesh Shared by every Bone with the same Primitive, Size and Material
+        """
+        material = self.get_materials_by_method(bone_name)
+        # Palette Meshes share the Material, so they are Told Apart by their Chain (Palette UVs)
+        chain_group = self.find_bone_chain_group(bone_name) if self.mesh_color_method == "PALETTE" else None
+        mesh_name = self.construct_shared_mesh_name(material, chain_group)
+        if mesh_name not in self.shared_meshes:
+            mesh = bpy.data.meshes.get(mesh_name)
+            if mesh is None:
+                mesh = self.create_primitive_mesh(mesh_name)
+                mesh.materials.append(material)
+                self.paint_mesh_by_method(mesh, bone_name)
+            self.shared_meshes[mesh_name] = mesh
+        return self.shared_meshes[mesh_name]
+
+    def create_shared_meshes(self, bone_names: list):
+        """
+        Build the Shared Placeholder Mesh of every Primitive, Size and Material Key once, before the Bones are Placed
+        """
+        for bone_name in bone_names:
+            self.get_shared_mesh(bone_name)
+
+    def construct_shared_mesh_name(self, material, chain_group: str = None) -> str:
+        """
+        Construct Shared Placeholder Mesh Name by Primitive, Size, Material (and Chain for Palettes)
+        """
+        material_name = material.name if material else "None"
+        if chain_group is not None:
+            return f"PM_{self.mesh_primitive}_{self.mesh_size:g}_{material_name}_{chain_group}"
+        return f"PM_{self.mesh_primitive}_{self.mesh_size:g}_{material_name}"
 
     def get_materials_by_method(self, bone_name: str) -> bpy.types.Material:
         """
-        Get Existing Material by Defined Mesh Coloring Method
+        Get Existing Material by Defined Mesh Coloring Method (Memoized per Bone)
         """
-        if self.mesh_color_method == "CHAIN":
-            chain_group = self.find_bone_chain_group(bone_name)
-            return self.get_materials_skp_chain(chain_group)
+        if bone_name not in self.bone_materials:
+            if self.mesh_color_method == "CHAIN":
+                chain_group = self.find_bone_chain_group(bone_name)
+                self.bone_materials[bone_name] = self.get_materials_skp_chain(chain_group)
+            elif self.mesh_color_method == "PALETTE":
+                self.bone_materials[bone_name] = self.get_materials_skp_chain("Palette")
+            else:
+                self.bone_materials[bone_name] = None
+        return self.bone_materials[bone_name]
     
     def get_materials_skp_chain(self, bone_name: str) -> bpy.types.Material:
         """
-        Get Existing Material by Skeletal Mesh Placeholder Chain Grouping (Specific for UE5)
+        Get Existing Material by Skeletal Mesh Placeholder Chain Grouping (Memoized per Chain)
         """
-        mat_name = self.construct_material_name(bone_name)
-        if mat_name not in bpy.data.materials:
-            mat_name = self.construct_material_name("Default")
-        return bpy.data.materials[mat_name]
+        if bone_name not in self.chain_materials:
+            mat_name = self.construct_material_name(bone_name)
+            if mat_name not in bpy.data.materials:
+                mat_name = self.construct_material_name(self.chain_index.default_chain)
+            self.chain_materials[bone_name] = bpy.data.materials[mat_name]
+        return self.chain_materials[bone_name]
         
     def find_bone_chain_group(self, bone_name: str) -> str:
         """
         Find the Bone's Chain Group
         """
-        prefixes = bone_name.split("_")
-        if len(prefixes) > 1:
-            bone_name = prefixes[-1]
-
-        for key, value in SKP_CHAIN_MATERIAL.items():
-            if any(bone_name.startswith(core_name) for core_name in value["bones"]):
-                return key
-        return "Default"
+        return self.chain_index.find(bone_name)
     
     def create_materials_by_method(self):
         """
@@ -126,27 +398,136 @@ class SkeletalMeshPreparation:
         if self.mesh_color_method == "CHAIN":
             self.create_materials_skp_chain()
             return
+        if self.mesh_color_method == "PALETTE":
+            self.create_materials_skp_palette()
+            return
         return
 
     def create_materials_skp_chain(self):
         """
         Create Materials by Skeletal Mesh Placeholder Chain Grouping (Specific for UE5)
         """
-        for key, value in SKP_CHAIN_MATERIAL.items():
+        # Custom Tables without a Default Chain still get the Fallback Material for Unmatched Bones
+        chains = dict(self.chain_index.chains)
+        chains.setdefault(self.chain_index.default_chain, SKP_CHAIN_MATERIAL["Default"])
+        for key, value in chains.items():
             mat_name = self.construct_material_name(key)
-            if mat_name not in bpy.data.materials:
+            # Chain Colors are sRGB, Base Color is Scene Linear (the Palette Texture and Attribute Store sRGB)
+            mat_color = tuple(float(channel) for channel in
+                              self.srgb_to_linear(np.array(value["material_data"]["color"]) / 255)) + (1.0,)
+
+            # Only Create Missing Materials and Recolor Changed Ones
+            mat = bpy.data.materials.get(mat_name)
+            if mat is None:
                 mat = bpy.data.materials.new(name=mat_name)
                 mat.use_nodes = True
-                p_bsdf = mat.node_tree.nodes.get("Principled BSDF")
+            elif all(abs(current - target) < 1e-6 for current, target in zip(mat.diffuse_color, mat_color)):
+                continue
 
-                if p_bsdf:
-                    mat_color = (
-                        value["material_data"]["color"][0]/255, 
-                        value["material_data"]["color"][1]/255, 
-                        value["material_data"]["color"][2]/255, 1.0
-                    )
-                    p_bsdf.inputs["Base Color"].default_value = mat_color
-                    mat.diffuse_color = mat_color
+            p_bsdf = mat.node_tree.nodes.get("Principled BSDF")
+            if p_bsdf:
+                p_bsdf.inputs["Base Color"].default_value = mat_color
+                mat.diffuse_color = mat_color
+
+    @staticmethod
+    def srgb_to_linear(colors: np.ndarray) -> np.ndarray:
+        """
+        Convert sRGB Color Channels (0 to 1) to Scene Linear, as Blender Decodes an sRGB Texture
+        """
+        return np.where(colors <= 0.04045, colors / 12.92, ((colors + 0.055) / 1.055) ** 2.4)
+
+    def get_palette_chains(self) -> list:
+        """
+        Palette Slots in Chain Table Order (the Default Chain is always Included)
+        """
+        palette_chains = list(self.chain_index.chains)
+        if self.chain_index.default_chain not in palette_chains:
+            palette_chains.append(self.chain_index.default_chain)
+        return palette_chains
+
+    def get_palette_colors(self) -> np.ndarray:
+        """
+        Get the (N, 4) sRGB Colors of the Palette Slots
+        """
+        chains = self.chain_index.chains
+        palette_colors = [
+            chains[key]["material_data"]["color"] if key in chains else SKP_CHAIN_MATERIAL["Default"]["material_data"]["color"]
+            for key in self.get_palette_chains()
+        ]
+        return np.hstack([np.array(palette_colors, dtype=np.float32) / 255, np.ones((len(palette_colors), 1), dtype=np.float32)])
+
+    def get_palette_index(self, bone_name: str) -> int:
+        """
+        Get the Palette Slot of the Bone's Chain
+        """
+        if not self.palette_indices:
+            self.palette_indices = {key: index for index, key in enumerate(self.get_palette_chains())}
+        return self.palette_indices[self.find_bone_chain_group(bone_name)]
+
+    def create_materials_skp_palette(self):
+        """
+        Create one Material for All Chains, Colored by a Palette Texture (one Pixel per Chain)
+        """
+        palette_colors = self.get_palette_colors()
+        image_name = self.construct_palette_image_name()
+        image = bpy.data.images.get(image_name)
+        if image is None:
+            image = bpy.data.images.new(image_name, width=len(palette_colors), height=1, alpha=False)
+        elif tuple(image.size) != (len(palette_colors), 1):
+            image.scale(len(palette_colors), 1)
+
+        # Only Rewrite (and Repack for the FBX Export) a Changed Palette
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        if image.packed_file is None or not np.allclose(pixels, palette_colors.ravel(), atol=1e-6):
+            image.pixels.foreach_set(palette_colors.ravel())
+            image.pack()
+
+        mat_name = self.construct_material_name("Palette")
+        mat = bpy.data.materials.get(mat_name)
+        if mat is None:
+            mat = bpy.data.materials.new(name=mat_name)
+            mat.use_nodes = True
+
+        p_bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        p_texture = mat.node_tree.nodes.get("Palette")
+        if p_bsdf and p_texture is None:
+            p_texture = mat.node_tree.nodes.new("ShaderNodeTexImage")
+            p_texture.name = "Palette"
+            p_texture.interpolation = "Closest"
+            mat.node_tree.links.new(p_texture.outputs["Color"], p_bsdf.inputs["Base Color"])
+        if p_texture:
+            p_texture.image = image
+
+    def construct_palette_image_name(self) -> str:
+        """
+        Construct Palette Texture Name
+        """
+        return f"T_{self.__class__.__name__}_PALETTE"
+
+    def paint_mesh_by_method(self, mesh, bone_name: str):
+        """
+        Write a Placeholder Mesh's per-Bone Coloring (only the Palette Method Paints Meshes)
+        """
+        if self.mesh_color_method == "PALETTE":
+            self.paint_mesh_palette(mesh, np.full(len(mesh.loops), self.get_palette_index(bone_name), dtype=np.int32))
+
+    def paint_mesh_palette(self, mesh, loop_palette_indices: np.ndarray):
+        """
+        Write Palette UVs (Center of the Chain's Pixel) and the Chain Colors as a Face-Corner
+        Color Attribute for every Loop in Bulk
+        """
+        palette_colors = self.get_palette_colors()
+        palette_uvs = np.empty((len(loop_palette_indices), 2), dtype=np.float32)
+        palette_uvs[:, 0] = (loop_palette_indices + 0.5) / len(palette_colors)
+        palette_uvs[:, 1] = 0.5
+
+        uv_layer = mesh.uv_layers.get("UVMap") or mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", palette_uvs.ravel())
+        color_attribute = mesh.color_attributes.get("ChainColor")
+        if color_attribute is None:
+            color_attribute = mesh.color_attributes.new("ChainColor", "BYTE_COLOR", "CORNER")
+        color_attribute.data.foreach_set("color_srgb", palette_colors[loop_palette_indices].ravel())
 
     def construct_material_name(self, key):
         """
@@ -163,93 +544,404 @@ class SkeletalMeshPreparation:
             return prefixes[-1]
         return part_name
 
-    def place_mesh_armature_bone_tip(self, selected_armature):
+    def get_bone_world_matrices(self, selected_armature) -> np.ndarray:
+        """
+        Get the (N, 4, 4) World Matrices of the Armature's Pose Bones in Pose Bone Order.
+        Read once per Run with foreach_get and Cached, so other Stages can Reuse them.
+        """
+        armature_key = selected_armature.as_pointer()
+        if armature_key not in self.bone_world_matrices:
+            pose_bones = selected_armature.pose.bones
+            pose_matrices = np.empty(len(pose_bones) * 16, dtype=np.float32)
+            pose_bones.foreach_get("matrix", pose_matrices)
+
+            # foreach_get Flattens Matrices Column-Major
+            pose_matrices = pose_matrices.reshape(-1, 4, 4).transpose(0, 2, 1)
+            self.bone_world_matrices[armature_key] = np.asarray(selected_armature.matrix_world) @ pose_matrices
+        return self.bone_world_matrices[armature_key]
+
+    def get_placeholder_basis_matrices(self, selected_armature) -> np.ndarray:
         """
-        Place Primitives with Material on Armature's Bone's Tip Position
+        Get the (N, 4, 4) Bone World Matrices with their Scale Removed (the Placeholders' Basis)
+        """
+        basis_matrices = self.get_bone_world_matrices(selected_armature).copy()
+        basis_matrices[:, :3, :3] /= np.linalg.norm(basis_matrices[:, :3, :3], axis=1, keepdims=True)
+        return basis_matrices
+
+    def get_data_bone_indices(self, selected_armature) -> np.ndarray:
+        """
+        Get the Index in the Armature's Bones of each Pose Bone (None when both are in the Same Order),
+        so Rest Data Read with foreach_get Lines up with Pose Data
+        """
+        pose_bone_names = [pose_bone.name for pose_bone in selected_armature.pose.bones]
+        bone_names = [bone.name for bone in selected_armature.data.bones]
+        if pose_bone_names == bone_names:
+            return None
+        bone_indices = {name: index for index, name in enumerate(bone_names)}
+        return np.array([bone_indices[name] for name in pose_bone_names], dtype=np.intp)
+
+    def get_bone_lengths(self, selected_armature) -> np.ndarray:
+        """
+        Get the (N,) Rest Lengths of the Armature's Bones in Pose Bone Order
+        """
+        bones = selected_armature.data.bones
+        bone_lengths = np.empty(len(bones), dtype=np.float32)
+        bones.foreach_get("length", bone_lengths)
+        data_bone_indices = self.get_data_bone_indices(selected_armature)
+        return bone_lengths if data_bone_indices is None else bone_lengths[data_bone_indices]
+
+    def get_bone_rest_tip_matrices(self, selected_armature) -> np.ndarray:
+        """
+        Get the (N, 4, 4) Armature-Space Rest Matrices of the Bones moved to their Tips, in Pose Bone Order
+        """
+        bones = selected_armature.data.bones
+        rest_matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix_local", rest_matrices)
+        rest_matrices = rest_matrices.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+        data_bone_indices = self.get_data_bone_indices(selected_armature)
+        if data_bone_indices is not None:
+            rest_matrices = rest_matrices[data_bone_indices]
+        rest_matrices[:, :3, 3] += rest_matrices[:, :3, 1] * self.get_bone_lengths(selected_armature)[:, None]
+        return rest_matrices
+
+    def prepare_armature(self, selected_armature) -> bool:
+        """
+        Check the Armature, Switch to Object Mode and Rename its Parts (if Enabled)
         """
 
         # Check that Object is an Armature
         if selected_armature is None or selected_armature.type != "ARMATURE":
             print(PROGRAM_NAME + ": " + f"Couldn't find an Armature named {selected_armature.data.name}.")
-            return
+            return False
         
         # Set to Object Mode
-        if bpy.ops.object.mode_set.poll():
+        if self.ops.object.mode_set.poll():
             if bpy.context.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-
-        bpy.ops.object.select_all(action="DESELECT")
+                self.ops.object.mode_set(mode="OBJECT")
 
-        # Rename Armature Pose
+        # Rename Armature Pose and Bones (remove OptiTrack Prefix)
         if (self.armature_rename):
             selected_armature.data.name = self.rename_armature(selected_armature.data.name)
+            for pose_bone in selected_armature.pose.bones:
+                pose_bone.name = self.rename_armature(pose_bone.name)
+        return True
 
-        # Iterate for All Bones in the Armature
-        for pose_bone in selected_armature.pose.bones:
+    def place_mesh_armature_bone_tip(self, selected_armature):
+        """
+        Place Primitives with Material on Armature's Bone's Tip Position.
+        Existing Placeholders are Kept when their Fingerprint is Unchanged, otherwise Rebuilt.
+        """
+        if self.build_mode != "DATA":
+            self.ops.object.select_all(action="DESELECT")
 
-            # Rename Bone (remove OptiTrack Prefix)
+        # World Matrices of All Bones in one Batch
+        bone_world_matrices = self.get_bone_world_matrices(selected_armature)
+        placeholder_basis_matrices = self.get_placeholder_basis_matrices(selected_armature)
+        bone_fingerprints = self.get_bone_fingerprints(selected_armature)
+
+        # Existing Placeholders by Bone, Deleting those of Removed Bones or of the Skinned Output
+        bone_names = {pose_bone.name for pose_bone in selected_armature.pose.bones}
+        existing_placeholders = {}
+        for pobj in self.find_existing_placeholders(selected_armature):
+            if (pobj.get("skp_output", "OBJECTS") == "OBJECTS" and pobj.parent_bone in bone_names
+                    and pobj.parent_bone not in existing_placeholders):
+                existing_placeholders[pobj.parent_bone] = pobj
+            else:
+                self.remove_placeholder(pobj)
+                self.placeholder_changes["deleted"] += 1
+
+        # Shared Meshes are Built once per Key, in either Build Mode
+        if self.mesh_instancing:
+            self.create_shared_meshes([pose_bone.name for pose_bone in selected_armature.pose.bones])
+
+        # Iterate for All Bones in the Armature
+        for index, pose_bone in enumerate(selected_armature.pose.bones):
             bone_name = pose_bone.name
-            if (self.armature_rename):
-                pose_bone.name = self.rename_armature(pose_bone.name)
-                bone_name = pose_bone.name
-            
-            # Create Primitive as Placeholder for UE5 SKM
+
+            pobj = existing_placeholders.get(bone_name)
+            if pobj is not None:
+                if pobj.get("skp_fingerprint") == bone_fingerprints[index]:
+                    self.placeholder_changes["unchanged"] += 1
+                    continue
+                self.remove_placeholder(pobj)
+                self.placeholder_changes["updated"] += 1
+            else:
+                self.placeholder_changes["created"] += 1
+
+            with pipeline_trace.span("place_bone", bone=bone_name):
+                if self.build_mode == "DATA":
+                    pobj = self.place_mesh_bone_data(selected_armature, bone_name, Matrix(placeholder_basis_matrices[index]))
+                else:
+                    pobj = self.place_mesh_bone_operator(selected_armature, bone_name, Matrix(bone_world_matrices[index]))
+            pobj["skp_output"] = "OBJECTS"
+            pobj["skp_fingerprint"] = bone_fingerprints[index]
+
+            print(PROGRAM_NAME + f": Created P_{bone_name} attached to {bone_name} of {selected_armature.name}.")
+    
+    def place_mesh_bone_operator(self, selected_armature, bone_name: str, bone_world_matrix: Matrix):
+        """
+        Place a Bone's Placeholder using Blender Operators
+        """
+        # Create Primitive as Placeholder for UE5 SKM (or Link the Shared Mesh, Scale and Material already Set)
+        if self.mesh_instancing:
+            pobj = bpy.data.objects.new(f"P_{bone_name}", self.get_shared_mesh(bone_name))
+            bpy.context.view_layer.active_layer_collection.collection.objects.link(pobj)
+        else:
             self.create_primitive_adapter()
             pobj = bpy.context.active_object
             pobj.name = f"P_{bone_name}"
-            
-            # Place the Primitive to the Bone
-            bone_world_matrix = selected_armature.matrix_world @ pose_bone.matrix
-            pobj.matrix_world = bone_world_matrix
+        
+        # Place the Primitive to the Bone
+        pobj.matrix_world = bone_world_matrix
 
-            bpy.ops.object.select_all(action="DESELECT")
-            pobj.select_set(True)
-            selected_armature.select_set(True)
-            bpy.context.view_layer.objects.active = selected_armature
+        self.ops.object.select_all(action="DESELECT")
+        pobj.select_set(True)
+        selected_armature.select_set(True)
+        bpy.context.view_layer.objects.active = selected_armature
 
-            # Set Material based on SKM Chain for Primitive
+        # Set Material based on SKM Chain for Primitive
+        if not self.mesh_instancing:
             proxy_material = self.get_materials_by_method(bone_name)
 
             if pobj.data.materials:
                 pobj.data.materials[0] = proxy_material
             else:
                 pobj.data.materials.append(proxy_material)
-            
-            # Constraint place Primitive as a Child of the Bone
-            pobj.parent = selected_armature
-            pobj.parent_type = 'BONE'
-            pobj.parent_bone = bone_name
-            
-            pobj_contraint = pobj.constraints.new(type="CHILD_OF")
-            pobj_contraint.target = selected_armature
-            pobj_contraint.subtarget = bone_name
-
-            bpy.ops.object.select_all(action="DESELECT")
-            pobj.select_set(True)
-            bpy.context.view_layer.objects.active = pobj
-            
-            bpy.ops.constraint.childof_set_inverse(constraint=pobj_contraint.name, owner="OBJECT")
+            self.paint_mesh_by_method(pobj.data, bone_name)
+        
+        # Constraint place Primitive as a Child of the Bone
+        pobj.parent = selected_armature
+        pobj.parent_type = 'BONE'
+        pobj.parent_bone = bone_name
+        
+        pobj_contraint = pobj.constraints.new(type="CHILD_OF")
+        pobj_contraint.target = selected_armature
+        pobj_contraint.subtarget = bone_name
+
+        self.ops.object.select_all(action="DESELECT")
+        pobj.select_set(True)
+        bpy.context.view_layer.objects.active = pobj
+        
+        self.ops.constraint.childof_set_inverse(constraint=pobj_contraint.name, owner="OBJECT")
 
+        if not self.mesh_instancing:
             pobj.scale = (self.mesh_size, self.mesh_size, self.mesh_size)
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-            
-            bpy.ops.object.select_all(action="DESELECT")
-            pobj.select_set(True)
-            bpy.context.view_layer.objects.active = pobj
-            
-            bpy.ops.constraint.apply(constraint=pobj_contraint.name, owner="OBJECT")
-            
-            print(PROGRAM_NAME + f": Created P_{bone_name} attached to {bone_name} of {selected_armature.name}.")
-    
+            self.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        
+        self.ops.object.select_all(action="DESELECT")
+        pobj.select_set(True)
+        bpy.context.view_layer.objects.active = pobj
+        
+        self.ops.constraint.apply(constraint=pobj_contraint.name, owner="OBJECT")
+        return pobj
+
+    def place_mesh_bone_data(self, selected_armature, bone_name: str, placeholder_basis_matrix: Matrix):
+        """
+        Place a Bone's Placeholder through bpy.data, bmesh and Matrix Math (No Operators, No Scene Updates)
+        """
+        # Create Primitive as Placeholder for UE5 SKM
+        if self.mesh_instancing:
+            pmesh = self.get_shared_mesh(bone_name)
+        else:
+            pmesh = self.create_primitive_mesh(f"P_{bone_name}")
+            pmesh.materials.append(self.get_materials_by_method(bone_name))
+            self.paint_mesh_by_method(pmesh, bone_name)
+
+        pobj = bpy.data.objects.new(f"P_{bone_name}", pmesh)
+        bpy.context.view_layer.active_layer_collection.collection.objects.link(pobj)
+
+        # Place the Primitive to the Bone (the Operator Path replaces the Scale before Applying it)
+        pobj.matrix_basis = placeholder_basis_matrix
+
+        # Parent Primitive to the Bone. The CHILD_OF Inverse cancels its Target when it is set,
+        # so applying the Constraint is an Identity and the Parent Inverse stays the Identity.
+        pobj.parent = selected_armature
+        pobj.parent_type = 'BONE'
+        pobj.parent_bone = bone_name
+        pobj.matrix_parent_inverse = Matrix.Identity(4)
+        return pobj
+
+    def place_skinned_mesh_armature(self, selected_armature):
+        """
+        Build a Single Skinned Mesh of Placeholders for the Whole Armature (One Rigid Vertex Group per Bone)
+        """
+        for pobj in self.find_existing_placeholders(selected_armature):
+            self.remove_placeholder(pobj)
+            self.placeholder_changes["deleted"] += 1
+
+        pose_bones = list(selected_armature.pose.bones)
+        bone_count = len(pose_bones)
+
+        # Read the Primitive (Scale Baked) back in Bulk as a Template
+        template = self.create_primitive_mesh(f"PT_{selected_armature.data.name}")
+        vert_count, loop_count, poly_count = len(template.vertices), len(template.loops), len(template.polygons)
+        template_co = np.empty(vert_count * 3, dtype=np.float32)
+        template.vertices.foreach_get("co", template_co)
+        template_vertex_index = np.empty(loop_count, dtype=np.int32)
+        template.loops.foreach_get("vertex_index", template_vertex_index)
+        template_loop_start = np.empty(poly_count, dtype=np.int32)
+        template.polygons.foreach_get("loop_start", template_loop_start)
+        template_uv = np.empty(loop_count * 2, dtype=np.float32)
+        template.uv_layers[0].data.foreach_get("uv", template_uv)
+        bpy.data.meshes.remove(template)
+
+        # Rest-Space Placement per Bone, so the Armature Modifier Deforms each Primitive
+        # to where the Object Mode would place it (Bone Tail @ Placeholder Basis)
+        placements = self.get_bone_rest_tip_matrices(selected_armature) @ self.get_placeholder_basis_matrices(selected_armature)
+        template_co = template_co.reshape(-1, 3)
+        co = np.einsum("bij,vj->bvi", placements[:, :3, :3], template_co) + placements[:, None, :3, 3]
+
+        # Tile the Template Topology with per-Bone Offsets
+        vert_offsets = np.arange(bone_count, dtype=np.int32)[:, None] * vert_count
+        loop_offsets = np.arange(bone_count, dtype=np.int32)[:, None] * loop_count
+
+        smesh = bpy.data.meshes.new(f"SKM_{selected_armature.data.name}")
+        smesh.vertices.add(bone_count * vert_count)
+        smesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+        smesh.loops.add(bone_count * loop_count)
+        smesh.loops.foreach_set("vertex_index", (template_vertex_index[None, :] + vert_offsets).ravel())
+        smesh.polygons.add(bone_count * poly_count)
+        smesh.polygons.foreach_set("loop_start", (template_loop_start[None, :] + loop_offsets).ravel())
+        if bpy.app.version < (4, 0, 0):
+            template_loop_total = np.diff(np.append(template_loop_start, loop_count)).astype(np.int32)
+            smesh.polygons.foreach_set("loop_total", np.tile(template_loop_total, bone_count))
+        smesh.uv_layers.new(name="UVMap").data.foreach_set("uv", np.tile(template_uv, bone_count))
+
+        # Material Slots follow the Chains
+        slot_indices = {}
+        bone_slots = np.empty(bone_count, dtype=np.int32)
+        for index, pose_bone in enumerate(pose_bones):
+            proxy_material = self.get_materials_by_method(pose_bone.name)
+            slot_key = proxy_material.name if proxy_material else None
+            if slot_key not in slot_indices:
+                slot_indices[slot_key] = len(smesh.materials)
+                smesh.materials.append(proxy_material)
+            bone_slots[index] = slot_indices[slot_key]
+        smesh.polygons.foreach_set("material_index", np.repeat(bone_slots, poly_count))
+        if self.mesh_color_method == "PALETTE":
+            bone_palette_indices = np.array([self.get_palette_index(pose_bone.name) for pose_bone in pose_bones], dtype=np.int32)
+            self.paint_mesh_palette(smesh, np.repeat(bone_palette_indices, loop_count))
+        smesh.update(calc_edges=True)
+
+        sobj = bpy.data.objects.new(smesh.name, smesh)
+        bpy.context.view_layer.active_layer_collection.collection.objects.link(sobj)
+        sobj.parent = selected_armature
+        sobj["skp_output"] = "SKINNED"
+        self.placeholder_changes["created"] += 1
+
+        # Skin every Primitive Rigidly to its Bone
+        for index, pose_bone in enumerate(pose_bones):
+            vertex_group = sobj.vertex_groups.new(name=pose_bone.name)
+            vertex_group.add(range(index * vert_count, (index + 1) * vert_count), 1.0, "REPLACE")
+
+        armature_modifier = sobj.modifiers.new(name="Armature", type="ARMATURE")
+        armature_modifier.object = selected_armature
+
+        print(PROGRAM_NAME + f": Created {sobj.name} skinned to {bone_count} bones of {selected_armature.name}.")
+
+    def get_bone_fingerprints(self, selected_armature) -> list:
+        """
+        Fingerprint every Bone by Name, Chain, Rest and Pose Matrices and the Placeholder Options
+        """
+        # Rounded (and without Negative Zeros) so Float Noise doesn't Trigger Rebuilds
+        rest_matrices = (np.round(self.get_bone_rest_tip_matrices(selected_armature), 5) + 0.0).astype(np.float32)
+        world_matrices = (np.round(self.get_bone_world_matrices(selected_armature), 5) + 0.0).astype(np.float32)
+        chain_colors = [(key, value["material_data"]["color"]) for key, value in self.chain_index.chains.items()]
+        options = repr((self.mesh_primitive, float(self.mesh_size), self.mesh_color_method,
+                        self.mesh_instancing, chain_colors)).encode()
+
+        bone_fingerprints = []
+        for index, pose_bone in enumerate(selected_armature.pose.bones):
+            digest = hashlib.blake2b(options, digest_size=16)
+            digest.update(pose_bone.name.encode())
+            digest.update(self.find_bone_chain_group(pose_bone.name).encode())
+            digest.update(rest_matrices[index].tobytes())
+            digest.update(world_matrices[index].tobytes())
+            bone_fingerprints.append(digest.hexdigest())
+        return bone_fingerprints
+
+    def fingerprint_armature(self, selected_armature) -> str:
+        """
+        Fingerprint the Armature from its Bones' Fingerprints and the Output Mode
+        """
+        digest = hashlib.blake2b(self.output_mode.encode(), digest_size=16)
+        for bone_fingerprint in self.get_bone_fingerprints(selected_armature):
+            digest.update(bone_fingerprint.encode())
+        return digest.hexdigest()
+
+    def find_existing_placeholders(self, selected_armature) -> list:
+        """
+        Find Placeholders of a Previous Run (Tagged, or Untagged from a Run before Placeholders were Tagged)
+        """
+        return [
+            child for child in selected_armature.children
+            if "skp_output" in child or self.is_untagged_placeholder(child)
+        ]
+
+    def is_untagged_placeholder(self, child) -> bool:
+        """
+        Check a Child Matches what an Untagged Run Created: Named P_ after the Bone it is Parented to,
+        with one of this Program's Materials (Objects the User Made are Left Alone)
+        """
+        if child.parent_type != "BONE" or child.name != f"P_{child.parent_bone}" or child.data is None:
+            return False
+        material_prefix = f"M_{self.__class__.__name__}_"
+        return any(material is not None and material.name.startswith(material_prefix)
+                   for material in getattr(child.data, "materials", ()))
+
+    def is_armature_prepared(self, selected_armature, armature_fingerprint: str) -> bool:
+        """
+        Check the Armature was Prepared with the same Fingerprint and its Placeholders still Exist
+        """
+        if selected_armature.get("skp_fingerprint") != armature_fingerprint:
+            return False
+        placeholder_count = sum(
+            1 for pobj in self.find_existing_placeholders(selected_armature)
+            if pobj.get("skp_output") == self.output_mode
+        )
+        if self.output_mode == "SKINNED":
+            return placeholder_count == 1
+        return placeholder_count == len(selected_armature.pose.bones)
+
+    def remove_placeholder(self, pobj):
+        """
+        Remove a Placeholder and its Mesh once no other Placeholder Uses it
+        """
+        pmesh = pobj.data
+        bpy.data.objects.remove(pobj, do_unlink=True)
+        if pmesh is not None and pmesh.users == 0:
+            bpy.data.meshes.remove(pmesh)
+
     def run(self, selected_armature):
         """
-        Run the Skeletal Mesh Placeholder
+        Run the Skeletal Mesh Placeholder (Incremental: only Changed Bones are Rebuilt)
         """
         print(PROGRAM_NAME + f": Running Skeletal Mesh Placeholder Program")
-        self.create_materials_by_method()
-        self.place_mesh_armature_bone_tip(selected_armature)
-        if (self.armature_rename):
-            selected_armature.name = self.rename_armature(selected_armature.name)
+        with pipeline_trace.span("SkeletalMeshPreparation.run", armature=getattr(selected_armature, "name", None),
+                                 build_mode=self.build_mode, output_mode=self.output_mode) as run_span:
+            self.reset_caches()
+            if not self.prepare_armature(selected_armature):
+                return
+
+            with pipeline_trace.span("fingerprint_armature"):
+                armature_fingerprint = self.fingerprint_armature(selected_armature)
+            if self.is_armature_prepared(selected_armature, armature_fingerprint):
+                print(PROGRAM_NAME + f": {selected_armature.name} is Unchanged since the Last Run.")
+                self.placeholder_changes["unchanged"] = 1 if self.output_mode == "SKINNED" else len(selected_armature.pose.bones)
+            else:
+                with pipeline_trace.span("create_materials"):
+                    self.create_materials_by_method()
+                with pipeline_trace.span("place_placeholders"):
+                    if self.output_mode == "SKINNED":
+                        self.place_skinned_mesh_armature(selected_armature)
+                    else:
+                        self.place_mesh_armature_bone_tip(selected_armature)
+                selected_armature["skp_fingerprint"] = armature_fingerprint
+
+            print(PROGRAM_NAME + ": " + ", ".join(f"{count} {change}" for change, count in self.placeholder_changes.items()) + ".")
+            run_span.set(bones=len(selected_armature.pose.bones), **self.placeholder_changes)
+            if (self.armature_rename):
+                selected_armature.name = self.rename_armature(selected_armature.name)
 
 if __name__ == "__main__":
     smp = SkeletalMeshPreparation(mesh_primitive="CUBE", mesh_size=2.0, armature_rename=True)
@@ -0,0 +1,292 @@
+"""
+Lightweight Tracing Shared by the Blender and Unreal Stages
+
+Nested spans (per stage, per asset, per bone), counters and call counting proxies for
+``bpy.ops`` and the IK Rig/Retargeter controllers. Events are Chrome trace events
+buffered to a JSON-lines file (one event per line, so a crashed run keeps everything
+flushed before the crash), which ``export_chrome_trace`` merges into one trace for
+chrome://tracing or Perfetto. Disabled (the default), ``span`` returns a shared no-op
+context manager, ``count`` returns after one flag check and ``counted`` returns the
+object itself.
+
+    import pipeline_trace
+    pipeline_trace.enable("prepare.jsonl")
+    with pipeline_trace.span("prepare", file=input_path):
+        ops = pipeline_trace.counted(bpy.ops, "bpy.ops")
+        ...
+    pipeline_trace.disable()
+    pipeline_trace.export_chrome_trace(["prepare.jsonl"], "prepare.trace.json")
+
+Setting ``OPTISKEL_TRACE`` to a file path enables tracing on import (e.g. in the editor).
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+TRACE_ENV = "OPTISKEL_TRACE"
+
+# Offset from the Performance Counter to Wall Clock Microseconds, so Processes Line Up in one Trace
+_CLOCK_OFFSET = time.time() - time.perf_counter()
+
+_enabled = False
+_writer = None
+_counters = {}
+# Tracing Sessions of this Process, so Counters of Separate Sessions aren't Mixed
+_session = 0
+
+
+class _TraceWriter:
+
+    def __init__(self, path: str, buffer_size: int):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.lock = threading.Lock()
+        # Held across Swapping the Buffer and Writing it, so Batches Reach the File in the Order they were Buffered
+        self.write_lock = threading.Lock()
+        self.pid = os.getpid()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, "a")
+
+    def emit(self, event: dict):
+        with self.lock:
+            self.buffer.append(event)
+            if len(self.buffer) < self.buffer_size:
+                return
+        self.flush()
+
+    def write(self, events: list):
+        """
+        Write Events to the File (the Caller Holds the Write Lock)
+        """
+        self.file.write("".join(json.dumps(event, default=str) + "\n" for event in events))
+        self.file.flush()
+
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                events, self.buffer = self.buffer, []
+            if events:
+                self.write(events)
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        writer = _writer
+        if writer is not None:
+            writer.emit({
+                "name": self.name, "ph": "X", "ts": (self.start + _CLOCK_OFFSET) * 1e6,
+                "dur": (end - self.start) * 1e6, "pid": writer.pid, "tid": threading.get_ident(),
+                "args": self.args,
+            })
+        return False
+
+    def set(self, **args):
+        """
+        Add Arguments Known only inside the Span (e.g. its Outcome)
+        """
+        self.args.update(args)
+
+
+class _CountingProxy:
+    """
+    Count every Call made through an Object (or its Attributes, e.g. bpy.ops.object.select_all)
+    """
+    __slots__ = ("_target", "_name")
+
+    def __init__(self, target, name: str):
+        self._target = target
+        self._name = name
+
+    def __getattr__(self, attribute):
+        return _CountingProxy(getattr(self._target, attribute), self._name + "." + attribute)
+
+    def __call__(self, *args, **kwargs):
+        count(self._name)
+        return self._target(*args, **kwargs)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(path: str, process_name: str = None, buffer_size: int = 1000):
+    """
+    Start Tracing to a JSON-Lines File (Appended to, so Several Runs can share one File)
+    """
+    global _enabled, _writer, _session
+    if _enabled:
+        disable()
+    _session += 1
+    _writer = _TraceWriter(path, buffer_size)
+    _counters.clear()
+    if process_name:
+        _writer.emit({"name": "process_name", "ph": "M", "pid": _writer.pid, "args": {"name": process_name}})
+    _enabled = True
+
+
+def disable():
+    """
+    Stop Tracing, Record the Counter Totals and Flush the File
+    """
+    global _enabled, _writer
+    if not _enabled:
+        return
+    _enabled = False
+    flush()
+    _writer.close()
+    _writer = None
+
+
+def flush():
+    """
+    Record the Counters' Current Totals and Write the Buffered Events
+    """
+    writer = _writer
+    if writer is None:
+        return
+    if _counters:
+        writer.emit({"name": "calls", "ph": "C", "ts": (time.perf_counter() + _CLOCK_OFFSET) * 1e6,
+                     "pid": writer.pid, "id": _session, "args": dict(_counters)})
+    writer.flush()
+
+
+def span(name: str, **args):
+    """
+    Time a Block as a Span (Spans Nest by Time within a Thread)
+    """
+    if not _enabled:
+        return NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: str = None):
+    """
+    Decorator Tracing every Call of a Function as a Span
+    """
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Span(span_name, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, n: int = 1):
+    """
+    Add to a Named Counter (Recorded with every Flush)
+    """
+    if not _enabled:
+        return
+    _counters[name] = _counters.get(name, 0) + n
+
+
+def counted(target, name: str):
+    """
+    Wrap an Object so Calls through it are Counted under its Name (the Object itself when Disabled)
+    """
+    if not _enabled:
+        return target
+    return _CountingProxy(target, name)
+
+
+def read_trace(path: str) -> list:
+    """
+    Read the Events of a JSON-Lines Trace File (a Line Cut Short by a Crash is Skipped)
+    """
+    events = []
+    with open(path) as trace_file:
+        for line in trace_file:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def summarize_trace(events: list) -> dict:
+    """
+    Total Seconds and Count per Span Name (Slowest First) and the Final Counter Totals of all Processes
+    """
+    spans = {}
+    for event in events:
+        if event.get("ph") == "X":
+            totals = spans.setdefault(event["name"], {"count": 0, "seconds": 0.0})
+            totals["count"] += 1
+            totals["seconds"] += event["dur"] / 1e6
+
+    # Counters are Cumulative per Tracing Session: Sum the Last Totals of each
+    last_counters = {}
+    for event in events:
+        if event.get("ph") == "C":
+            last_counters[(event["pid"], event.get("id"), event["name"])] = event["args"]
+    counters = {}
+    for args in last_counters.values():
+        for name, value in args.items():
+            counters[name] = counters.get(name, 0) + value
+
+    return {
+        "spans": dict(sorted(spans.items(), key=lambda item: -item[1]["seconds"])),
+        "counters": dict(sorted(counters.items(), key=lambda item: -item[1])),
+    }
+
+
+def export_chrome_trace(paths: list, output_path: str) -> dict:
+    """
+    Merge JSON-Lines Trace Files into one Chrome Trace and Return its Summary
+    """
+    events = []
+    for path in paths:
+        if os.path.exists(path):
+            events.extend(read_trace(path))
+    with open(output_path, "w") as trace_file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+    return summarize_trace(events)
+
+
+atexit.register(disable)
+
+if os.environ.get(TRACE_ENV):
+    enable(os.environ[TRACE_ENV])
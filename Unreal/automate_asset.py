@@ -1,115 +1,468 @@
+import contextlib
+import copy
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
 from datetime import datetime
+from types import SimpleNamespace
 
 import unreal
 
+try:
+    # Common is Put on sys.path by the Entry Points (loader.py, batch_prepare.py and batch_worker.py)
+    import pipeline_trace
+except ImportError:
+    # Run on its own (the Unreal Python Console): Trace Nothing
+    pipeline_trace = SimpleNamespace(
+        span=lambda name, **args: contextlib.nullcontext(SimpleNamespace(set=lambda **args: None)),
+        traced=lambda name=None: lambda function: function,
+        count=lambda name, n=1: None,
+        counted=lambda target, name: target,
+    )
+
+# Metadata Tags: the Signature of what an IK Rig was Built from, and the Spec and Bones of the Template.
+# List the Signature Tags (with RTG_SIGNATURE_TAG) under Project Settings > Asset Manager > Metadata Tags
+# For Asset Registry, so Up to Date IK Rigs and Retargeters are Recognised without Loading them (DefaultGame.ini:
+# [/Script/Engine.AssetManagerSettings] +MetaDataTagsForAssetRegistry=OptiSkelUE5Pipe.IKRSignature
+# [/Script/Engine.AssetManagerSettings] +MetaDataTagsForAssetRegistry=OptiSkelUE5Pipe.RTGSignature)
+IKR_SIGNATURE_TAG = "OptiSkelUE5Pipe.IKRSignature"
+IKR_SPEC_TAG = "OptiSkelUE5Pipe.IKRSpec"
+IKR_BONES_TAG = "OptiSkelUE5Pipe.IKRBones"
+
+# Canonical IK Rig Cloned for every Mesh with the Template's Bones
+IKR_TEMPLATE_PATH = "/Game/OptiSkelUE5Pipe/Rigs/IKR_Template"
+
+# OptiTrack Motive Skeleton IK Rig: Full Body IK Solver, Goals, Bone Settings and Retarget Chains
+IKR_SPEC = {
+    "solver": {"root_bone": "Hips", "root_behavior": "PRE_PULL", "allow_stretch": True},
+    "retarget_root": "Hips",
+    # Goal Name, Bone
+    "goals": [
+        ("LeftArm_Goal", "LeftHand"),
+        ("RightArm_Goal", "RightHand"),
+        ("LeftLeg_Goal", "LeftToeBase"),
+        ("RightLeg_Goal", "RightToeBase"),
+    ],
+    # Bone, Settings (Preferred Angles Enable use_preferred_angles)
+    "bone_settings": [
+        ("Spine", {"rotation_stiffness": 1}),
+        ("Spine1", {"rotation_stiffness": 1}),
+        ("LeftShoulder", {"rotation_stiffness": 1}),
+        ("RightShoulder", {"rotation_stiffness": 1}),
+        ("LeftForeArm", {"preferred_angles": (0, 0, 90)}),
+        ("RightForeArm", {"preferred_angles": (0, 90, 0)}),
+        ("RightLeg", {"preferred_angles": (0, -90, 0)}),
+        ("LeftLeg", {"preferred_angles": (0, -90, 0)}),
+    ],
+    # Chain Name, Start Bone, End Bone, Goal Name
+    "chains": [
+        ("Spine", "Spine", "Spine1", ""),
+        ("Neck", "Neck", "Neck", ""),
+        ("Head", "Head", "Head", ""),
+        ("LeftClavicle", "LeftShoulder", "LeftShoulder", ""),
+        ("RightClavicle", "RightShoulder", "RightShoulder", ""),
+        ("LeftArm", "LeftArm", "LeftHand", "LeftArm_Goal"),
+        ("RightArm", "RightArm", "RightHand", "RightArm_Goal"),
+        ("LeftLeg", "LeftUpLeg", "LeftToeBase", "LeftLeg_Goal"),
+        ("RightLeg", "RightUpLeg", "RightToeBase", "RightLeg_Goal"),
+    ],
+}
+
+# Hashes of the IK Rig Specs Validated so far, by Spec Identity with a Copy to Detect Changes
+_ikr_spec_hashes = {}
+
+# Metadata Tag on each Retargeter holding the Signature of what it was Built from
+RTG_SIGNATURE_TAG = "OptiSkelUE5Pipe.RTGSignature"
+# Bump when the Retargeter Built by auto_ikr_to_rtg Changes, so Existing Retargeters are Rebuilt
+RTG_VERSION = "1"
+
+# Target Chains Left Unmapped after Fuzzy Mapping
+RTG_IGNORE_CHAINS = [
+    'Root', 
+    # Left Fingers
+    'LeftMiddleMetacarpal', 'LeftMiddle',
+    'LeftPinkyMetacarpal', 'LeftPinky',
+    'LeftRingMetacarpal', 'LeftRing',
+    'LeftIndexMetacarpal', 'LeftIndex',
+    'LeftThumb',
+    # Right Fingers
+    'RightMiddleMetacarpal', 'RightMiddle',
+    'RightPinkyMetacarpal', 'RightPinky',
+    'RightRingMetacarpal', 'RightRing',
+    'RightIndexMetacarpal', 'RightIndex',
+    'RightThumb',
+]
+
 def console_log(message, indexer="Default"):
     unreal.log(f"[{indexer}]: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {message}")
 
-def auto_skm_to_ikr(skm, fpathext="Rigs"):
+def get_ikr_controller(ikr):
     """
-    Automate Creating IK Rigs for a Skeletal Mesh
-    
-    :param skm: Skeletal Mesh Asset
-    :param fpathext: (Optional) Folder Name
+    IK Rig Controller of an IK Rig (its Calls Counted while Tracing)
     """
-    log_indexer = "AutoSKM2IKR-Python"
+    return pipeline_trace.counted(unreal.IKRigController.get_controller(ikr), "IKRigController")
 
-    fname = unreal.EditorAssetLibrary.get_fname(skm)
-    fpath = unreal.EditorAssetLibrary.get_path_name(skm).split(".")[0].replace(str(fname),"")
+def get_rtg_controller(rtg):
+    """
+    IK Retargeter Controller of a Retargeter (its Calls Counted while Tracing)
+    """
+    return pipeline_trace.counted(unreal.IKRetargeterController.get_controller(rtg), "IKRetargeterController")
 
-    # Use the asset tools
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    
-    # Create the IK Rig Asset
-    console_log(message="Creating IK Rig Asset", indexer=log_indexer)
-    ikr = asset_tools.create_asset(asset_name='IKR_{0}'.format(fname),
-        package_path=fpath + fpathext, asset_class=unreal.IKRigDefinition,
-        factory=unreal.IKRigDefinitionFactory())
-    
-    # Get the IK Rig Asset Controller
-    console_log(message="Controlling IK Rig Asset", indexer=log_indexer)
-    ikr_asset_controller = unreal.IKRigController.get_controller(ikr)
-    ikr_asset_controller.set_skeletal_mesh(skm)
-    fbik_index = ikr_asset_controller.add_solver(unreal.IKRigFBIKSolver)
+def validate_ikr_spec(spec):
+    """
+    Raise ValueError if an IK Rig Spec has Duplicate Names, Unknown Settings or Chains with Unknown Goals
+    """
+    goal_names = [goal_name for goal_name, _ in spec["goals"]]
+    chain_names = [chain[0] for chain in spec["chains"]]
+    setting_bones = [bone for bone, _ in spec["bone_settings"]]
+    for kind, names in (("Goal", goal_names), ("Chain", chain_names), ("Bone Setting", setting_bones)):
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError("Duplicate IK Rig {0}s: {1}".format(kind, ", ".join(duplicates)))
+    for bone, settings in spec["bone_settings"]:
+        unknown = set(settings) - {"rotation_stiffness", "preferred_angles"}
+        if unknown:
+            raise ValueError("Unknown Bone Settings for {0}: {1}".format(bone, ", ".join(sorted(unknown))))
+    for chain_name, _, _, goal_name in spec["chains"]:
+        if goal_name and goal_name not in goal_names:
+            raise ValueError("Chain {0} uses Unknown Goal {1}".format(chain_name, goal_name))
+    if not hasattr(unreal.PBIKRootBehavior, spec["solver"]["root_behavior"]):
+        raise ValueError("Unknown Root Behavior {0}".format(spec["solver"]["root_behavior"]))
 
-    # Set IK Goals
-    console_log(message="Creating IK Goals", indexer=log_indexer)
-    ikr_asset_controller.add_new_goal("LeftArm_Goal", "LeftHand")
-    ikr_asset_controller.add_new_goal("RightArm_Goal", "RightHand")
-    ikr_asset_controller.add_new_goal("LeftLeg_Goal", "LeftToeBase")
-    ikr_asset_controller.add_new_goal("RightLeg_Goal", "RightToeBase")
-
-    ikr_asset_controller.add_bone_setting("Spine", 0)
-    ikr_asset_controller.add_bone_setting("Spine1", 0)
-    ikr_asset_controller.add_bone_setting("LeftShoulder", 0)
-    ikr_asset_controller.add_bone_setting("RightShoulder", 0)
-    ikr_asset_controller.add_bone_setting("LeftForeArm", 0)
-    ikr_asset_controller.add_bone_setting("RightForeArm", 0)
-    ikr_asset_controller.add_bone_setting("RightLeg", 0)
-    ikr_asset_controller.add_bone_setting("LeftLeg", 0)
-
-    # Set Spine settings
-    console_log(message="Adjusting Bone Settings", indexer=log_indexer)
-    spine_setting = ikr_asset_controller.get_bone_settings("Spine", 0)
-    spine_setting.rotation_stiffness = 1
-    spine1_setting = ikr_asset_controller.get_bone_settings("Spine1", 0)
-    spine1_setting.rotation_stiffness = 1
+def ikr_spec_bones(spec):
+    """
+    Every Bone an IK Rig Spec Refers to
+    """
+    bones = {spec["solver"]["root_bone"], spec["retarget_root"]}
+    bones.update(bone for _, bone in spec["goals"])
+    bones.update(bone for bone, _ in spec["bone_settings"])
+    bones.update(bone for chain in spec["chains"] for bone in chain[1:3])
+    return bones
+
+def ikr_spec_hash(spec):
+    """
+    Stable Hash of a Validated IK Rig Spec (each Distinct Spec is Validated and Hashed once)
+    """
+    cached = _ikr_spec_hashes.get(id(spec))
+    if cached is not None and cached[0] == spec:
+        return cached[1]
+    validate_ikr_spec(spec)
+    spec_hash = hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:16]
+    _ikr_spec_hashes[id(spec)] = (copy.deepcopy(spec), spec_hash)
+    return spec_hash
+
+# Validate and Hash the Default Spec on Import, so a Broken Spec Fails when Loading
+IKR_SPEC_HASH = ikr_spec_hash(IKR_SPEC)
+
+def bones_hash(bone_names):
+    return hashlib.sha256("\0".join(sorted(bone_names)).encode()).hexdigest()[:16]
+
+def get_skm_bone_names(skm):
+    """
+    Bone Names of a Skeletal Mesh's Skeleton, in Reference Pose Order
+    """
+    pose = unreal.AnimPoseExtensions.get_reference_pose(skm.get_editor_property("skeleton"))
+    return [str(bone_name) for bone_name in unreal.AnimPoseExtensions.get_bone_names(pose)]
+
+def skm_signature(skm, spec=IKR_SPEC, bone_names=None):
+    """
+    Hash of what an IK Rig is Built from: the Rig Spec, the Mesh Path, its Bones and Source Files
+    """
+    digest = hashlib.sha256(ikr_spec_hash(spec).encode())
+    digest.update(unreal.EditorAssetLibrary.get_path_name(skm).encode())
+    digest.update("\0".join(get_skm_bone_names(skm) if bone_names is None else bone_names).encode())
+    import_data = skm.get_editor_property("asset_import_data")
+    for source_file in sorted(import_data.extract_filenames() if import_data else []):
+        digest.update(source_file.encode())
+        if os.path.isfile(source_file):
+            digest.update(str(os.path.getmtime(source_file)).encode())
+    return digest.hexdigest()[:16]
 
-    # other bone settings
-    LeftShoulder_setting = ikr_asset_controller.get_bone_settings("LeftShoulder", 0)
-    LeftShoulder_setting.rotation_stiffness = 1
+def construct_ikr_path(skm, fpathext="Rigs"):
+    """
+    Package Path of the IK Rig for a Skeletal Mesh
+    """
+    fname = unreal.EditorAssetLibrary.get_fname(skm)
+    fpath = unreal.EditorAssetLibrary.get_path_name(skm).split(".")[0].replace(str(fname),"")
+    return "{0}{1}/IKR_{2}".format(fpath, fpathext, fname)
+
+def get_registry_tag(asset_path, tag):
+    """
+    Metadata Tag Value of an Asset from its Asset Registry Tag without Loading it (Assets Saved before the Tag
+    was Listed for the Asset Registry are Loaded to Read it), None when the Asset doesn't Exist
+    """
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset_datas = asset_registry.get_assets(unreal.ARFilter(package_names=[asset_path.split(".")[0]]))
+    if not asset_datas:
+        return None
+    registry_value = asset_datas[0].get_tag_value(tag)
+    if registry_value is not None:
+        return str(registry_value)
+    return unreal.EditorAssetLibrary.get_metadata_tag(unreal.EditorAssetLibrary.load_asset(asset_path), tag)
 
-    RightShoulder_setting = ikr_asset_controller.get_bone_settings("RightShoulder", 0)
-    RightShoulder_setting.rotation_stiffness = 1
+def is_ikr_up_to_date(ikr_path, signature):
+    """
+    Whether the IK Rig Exists and was Built from a Mesh with this Signature, by its Asset Registry Tag
+    """
+    return get_registry_tag(ikr_path, IKR_SIGNATURE_TAG) == signature
 
-    LeftForeArm_setting = ikr_asset_controller.get_bone_settings("LeftForeArm", 0)
-    LeftForeArm_setting.use_preferred_angles = True
-    LeftForeArm_setting.preferred_angles = unreal.Vector(0,0,90)
+def clear_ikr(ikr_asset_controller):
+    """
+    Remove the Solvers, Goals and Retarget Chains of an Existing IK Rig before Rebuilding it
+    """
+    for solver_index in reversed(range(ikr_asset_controller.get_num_solvers())):
+        ikr_asset_controller.remove_solver(solver_index)
+    for goal in ikr_asset_controller.get_all_goals():
+        ikr_asset_controller.remove_goal(goal.goal_name)
+    for chain in ikr_asset_controller.get_retarget_chains():
+        ikr_asset_controller.remove_retarget_chain(chain.chain_name)
 
-    RightForeArm_setting = ikr_asset_controller.get_bone_settings("RightForeArm", 0)
-    RightForeArm_setting.use_preferred_angles = True
-    RightForeArm_setting.preferred_angles = unreal.Vector(0,90,0)
+def build_ikr(ikr_asset_controller, spec=IKR_SPEC, log_indexer="AutoSKM2IKR-Python"):
+    """
+    Add the Solver, Goals, Bone Settings, Root Bones and Retarget Chains of a Spec to an Empty IK Rig
+    """
+    fbik_index = ikr_asset_controller.add_solver(unreal.IKRigFBIKSolver)
 
-    LeftLeg_setting = ikr_asset_controller.get_bone_settings("LeftLeg", 0)
-    LeftLeg_setting.use_preferred_angles = True
-    LeftLeg_setting.preferred_angles = unreal.Vector(0,-90,0)
+    # Set IK Goals
+    console_log(message="Creating IK Goals", indexer=log_indexer)
+    for goal_name, bone in spec["goals"]:
+        ikr_asset_controller.add_new_goal(goal_name, bone)
 
-    RightLeg_setting = ikr_asset_controller.get_bone_settings("RightLeg", 0)
-    RightLeg_setting.use_preferred_angles = True
-    RightLeg_setting.preferred_angles = unreal.Vector(0,-90,0)
+    # Set Bone Settings
+    console_log(message="Adjusting Bone Settings", indexer=log_indexer)
+    for bone, settings in spec["bone_settings"]:
+        ikr_asset_controller.add_bone_setting(bone, fbik_index)
+        bone_setting = ikr_asset_controller.get_bone_settings(bone, fbik_index)
+        if "rotation_stiffness" in settings:
+            bone_setting.rotation_stiffness = settings["rotation_stiffness"]
+        if "preferred_angles" in settings:
+            bone_setting.use_preferred_angles = True
+            bone_setting.preferred_angles = unreal.Vector(*settings["preferred_angles"])
 
     # Set the FBIK Attributes
     console_log(message="Setting IK Solver", indexer=log_indexer)
     fbik = ikr_asset_controller.get_solver_at_index(fbik_index)
-    fbik.root_behavior=unreal.PBIKRootBehavior.PRE_PULL
-    fbik.allow_stretch=True
+    fbik.root_behavior = getattr(unreal.PBIKRootBehavior, spec["solver"]["root_behavior"])
+    fbik.allow_stretch = spec["solver"]["allow_stretch"]
 
     # Set the Root Bone solver
     console_log(message="Setting Retarget Root Bone", indexer=log_indexer)
-    ikr_asset_controller.set_root_bone("Hips", 0)
+    ikr_asset_controller.set_root_bone(spec["solver"]["root_bone"], fbik_index)
 
     # Set the Retarget Root
-    ikr_asset_controller.set_retarget_root("Hips")
+    ikr_asset_controller.set_retarget_root(spec["retarget_root"])
 
     # Set the Retargetting Chains
-    ikr_asset_controller.add_retarget_chain("Spine","Spine","Spine1","")
-    ikr_asset_controller.add_retarget_chain("Neck","Neck","Neck","")
-    ikr_asset_controller.add_retarget_chain("Head","Head","Head","")
+    for chain_name, start_bone, end_bone, goal_name in spec["chains"]:
+        ikr_asset_controller.add_retarget_chain(chain_name, start_bone, end_bone, goal_name)
 
-    ikr_asset_controller.add_retarget_chain("LeftClavicle","LeftShoulder","LeftShoulder","")
-    ikr_asset_controller.add_retarget_chain("RightClavicle","RightShoulder","RightShoulder","")
+@pipeline_trace.traced()
+def create_ikr(skm, ikr_path, spec=IKR_SPEC, bone_names=None, log_indexer="AutoSKM2IKR-Python"):
+    """
+    Create (or Rebuild in Place) the IK Rig at a Path from a Spec, Bound to a Skeletal Mesh
+    """
+    bone_names = get_skm_bone_names(skm) if bone_names is None else bone_names
+    missing_bones = ikr_spec_bones(spec).difference(bone_names)
+    if missing_bones:
+        raise ValueError("Skeletal Mesh {0} is Missing Bones: {1}".format(
+            unreal.EditorAssetLibrary.get_path_name(skm), ", ".join(sorted(missing_bones))))
 
-    ikr_asset_controller.add_retarget_chain("LeftArm","LeftArm","LeftHand","LeftArm_Goal")
-    ikr_asset_controller.add_retarget_chain("RightArm","RightArm","RightHand","RightArm_Goal")
+    if unreal.EditorAssetLibrary.does_asset_exist(ikr_path):
+        console_log(message="Rebuilding IK Rig Asset", indexer=log_indexer)
+        ikr = unreal.EditorAssetLibrary.load_asset(ikr_path)
+        ikr_asset_controller = get_ikr_controller(ikr)
+        clear_ikr(ikr_asset_controller)
+    else:
+        # Use the asset tools
+        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
 
-    ikr_asset_controller.add_retarget_chain("LeftLeg","LeftUpLeg","LeftToeBase","LeftLeg_Goal")
-    ikr_asset_controller.add_retarget_chain("RightLeg","RightUpLeg","RightToeBase","RightLeg_Goal")
+        # Create the IK Rig Asset
+        console_log(message="Creating IK Rig Asset", indexer=log_indexer)
+        fpath, ikr_name = ikr_path.rsplit("/", 1)
+        ikr = asset_tools.create_asset(asset_name=ikr_name,
+            package_path=fpath, asset_class=unreal.IKRigDefinition,
+            factory=unreal.IKRigDefinitionFactory())
+
+        # Get the IK Rig Asset Controller
+        console_log(message="Controlling IK Rig Asset", indexer=log_indexer)
+        ikr_asset_controller = get_ikr_controller(ikr)
+    ikr_asset_controller.set_skeletal_mesh(skm)
+    build_ikr(ikr_asset_controller, spec, log_indexer)
+    return ikr
+
+@pipeline_trace.traced()
+def ensure_ikr_template(skm, spec=IKR_SPEC, template_path=IKR_TEMPLATE_PATH, bone_names=None):
+    """
+    Load the IK Rig Template, First (Re)Building it from this Skeletal Mesh if Missing or Built from another Spec.
+    Returns the Template and whether it was Built.
+    """
+    spec_hash = ikr_spec_hash(spec)
+    if unreal.EditorAssetLibrary.does_asset_exist(template_path):
+        template = unreal.EditorAssetLibrary.load_asset(template_path)
+        if unreal.EditorAssetLibrary.get_metadata_tag(template, IKR_SPEC_TAG) == spec_hash:
+            return template, False
+
+    console_log(message="Building IK Rig Template", indexer="AutoSKM2IKR-Python")
+    bone_names = get_skm_bone_names(skm) if bone_names is None else bone_names
+    template = create_ikr(skm, template_path, spec, bone_names)
+    unreal.EditorAssetLibrary.set_metadata_tag(template, IKR_SPEC_TAG, spec_hash)
+    unreal.EditorAssetLibrary.set_metadata_tag(template, IKR_BONES_TAG, bones_hash(bone_names))
+    return template, True
+
+@pipeline_trace.traced()
+def auto_skm_to_ikr(skm, fpathext="Rigs", save=True, spec=IKR_SPEC, template_path=IKR_TEMPLATE_PATH,
+        bone_names=None, signature=None):
+    """
+    Automate Creating IK Rigs for a Skeletal Mesh: a New Rig is a Copy of the IK Rig Template
+    Rebound to the Mesh when it has the Template's Bones, otherwise (or for an Existing Rig)
+    the Rig is Built from the Spec
+    
+    :param skm: Skeletal Mesh Asset
+    :param fpathext: (Optional) Folder Name
+    :param save: (Optional) Save the IK Rig, Disable to Save many Rigs Together
+    :param spec: (Optional) IK Rig Spec
+    :param template_path: (Optional) IK Rig Template Path, None to Always Build from the Spec
+    :param bone_names: (Optional) Bone Names of the Mesh, if Already Read
+    :param signature: (Optional) Signature of the Mesh (skm_signature), if Already Computed
+    """
+    log_indexer = "AutoSKM2IKR-Python"
+
+    ikr_path = construct_ikr_path(skm, fpathext)
+    bone_names = get_skm_bone_names(skm) if bone_names is None else bone_names
+    ikr = None
+    if template_path and not unreal.EditorAssetLibrary.does_asset_exist(ikr_path):
+        template, template_built = ensure_ikr_template(skm, spec, template_path, bone_names)
+        if save and template_built:
+            unreal.EditorAssetLibrary.save_asset(template_path)
+        if unreal.EditorAssetLibrary.get_metadata_tag(template, IKR_BONES_TAG) == bones_hash(bone_names):
+            # Clone the Template and Rebind the Mesh
+            console_log(message="Cloning IK Rig Template", indexer=log_indexer)
+            ikr = unreal.EditorAssetLibrary.duplicate_asset(template_path, ikr_path)
+            get_ikr_controller(ikr).set_skeletal_mesh(skm)
+        else:
+            console_log(message="Bones Differ from the IK Rig Template, Building from Spec", indexer=log_indexer)
+    if ikr is None:
+        ikr = create_ikr(skm, ikr_path, spec, bone_names, log_indexer)
+
+    # Tag the Rig with what it was Built from
+    if signature is None:
+        signature = skm_signature(skm, spec, bone_names)
+    unreal.EditorAssetLibrary.set_metadata_tag(ikr, IKR_SIGNATURE_TAG, signature)
 
     # Save the Asset
     console_log(message="Finished Successfully", indexer=log_indexer)
-    unreal.EditorAssetLibrary.save_asset(ikr.get_path_name())
+    if save:
+        unreal.EditorAssetLibrary.save_asset(ikr.get_path_name())
     return ikr
 
+def find_asset_datas(package_path, class_path, name_filter="*", recursive=True):
+    """
+    Asset Data (without Loading the Assets) of a Class under a Content Path whose Asset Name Matches
+    a Wildcard Filter, Sorted by Path
+
+    :param package_path: Content Path to Search
+    :param class_path: Class Package and Name, e.g. ("/Script/Engine", "SkeletalMesh")
+    :param name_filter: (Optional) Wildcard Filter on the Asset Name, e.g. "SKM_Actor*"
+    :param recursive: (Optional) Search Sub-Folders
+    """
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    ar_filter = unreal.ARFilter(package_paths=[package_path],
+        class_paths=[unreal.TopLevelAssetPath(*class_path)],
+        recursive_paths=recursive)
+    asset_datas = sorted(asset_registry.get_assets(ar_filter), key=lambda asset_data: str(asset_data.package_name))
+    return [asset_data for asset_data in asset_datas if fnmatch.fnmatchcase(str(asset_data.asset_name), name_filter)]
+
+def find_assets(package_path, class_path, name_filter="*", recursive=True):
+    """
+    Loaded Assets of a Class under a Content Path whose Asset Name Matches a Wildcard Filter, Sorted by Path
+    """
+    return [asset_data.get_asset() for asset_data in find_asset_datas(package_path, class_path, name_filter, recursive)]
+
+def find_skeletal_meshes(package_path="/Game", name_filter="*", recursive=True):
+    """
+    Skeletal Meshes under a Content Path whose Asset Name Matches a Wildcard Filter
+    """
+    return find_assets(package_path, ("/Script/Engine", "SkeletalMesh"), name_filter, recursive)
+
+def find_ik_rigs(package_path="/Game", name_filter="IKR_*", recursive=True):
+    """
+    IK Rigs under a Content Path whose Asset Name Matches a Wildcard Filter, without the IK Rig Template
+    """
+    ikrs = find_assets(package_path, ("/Script/IKRig", "IKRigDefinition"), name_filter, recursive)
+    return [ikr for ikr in ikrs
+        if unreal.EditorAssetLibrary.get_path_name(ikr).split(".")[0] != IKR_TEMPLATE_PATH]
+
+@pipeline_trace.traced()
+def auto_skms_to_ikrs(skms="/Game", fpathext="Rigs", name_filter="*", recursive=True, force=False, spec=IKR_SPEC,
+        template_path=IKR_TEMPLATE_PATH):
+    """
+    Automate Creating IK Rigs for many Skeletal Meshes in one Slow Task and Undo Transaction,
+    Skipping Meshes whose IK Rig is Up to Date and Saving the Built Rigs Together at the End
+
+    :param skms: Content Path to Search for Skeletal Meshes, or a List of Skeletal Mesh Assets
+    :param fpathext: (Optional) Folder Name
+    :param name_filter: (Optional) Wildcard Filter on the Mesh Names when Searching a Content Path
+    :param recursive: (Optional) Search Sub-Folders of the Content Path
+    :param force: (Optional) Rebuild Up to Date IK Rigs as well
+    :param spec: (Optional) IK Rig Spec
+    :param template_path: (Optional) IK Rig Template Path, None to Always Build from the Spec
+    :return: Report of the Built, Skipped and Failed Mesh Paths, the Built and Up to Date IK Rig Paths,
+        per-Mesh and Save Timings
+    """
+    log_indexer = "AutoSKMs2IKRs-Python"
+    start = time.perf_counter()
+    if isinstance(skms, str):
+        skms = find_skeletal_meshes(skms, name_filter, recursive)
+
+    report = {"built": [], "skipped": [], "failed": [], "rigs": [], "timings": {}, "cancelled": False}
+    ikrs = []
+    with unreal.ScopedSlowTask(len(skms), "Creating IK Rigs") as slow_task:
+        slow_task.make_dialog(True)
+        with unreal.ScopedEditorTransaction("Create IK Rigs"):
+            for skm in skms:
+                if slow_task.should_cancel():
+                    report["cancelled"] = True
+                    break
+                skm_path = unreal.EditorAssetLibrary.get_path_name(skm)
+                slow_task.enter_progress_frame(1, "Creating IK Rig for {0}".format(skm_path))
+                skm_start = time.perf_counter()
+                with pipeline_trace.span("skm_to_ikr", asset=skm_path) as asset_span:
+                    try:
+                        ikr_path = construct_ikr_path(skm, fpathext)
+                        bone_names = get_skm_bone_names(skm)
+                        signature = skm_signature(skm, spec, bone_names)
+                        if not force and is_ikr_up_to_date(ikr_path, signature):
+                            report["skipped"].append(skm_path)
+                            report["rigs"].append(ikr_path)
+                            asset_span.set(outcome="skipped")
+                            continue
+                        ikrs.append(auto_skm_to_ikr(skm, fpathext, False, spec, template_path, bone_names, signature))
+                        report["built"].append(skm_path)
+                        report["rigs"].append(ikr_path)
+                        asset_span.set(outcome="built")
+                    except Exception as e:
+                        unreal.log_error("[{0}]: {1}: {2}".format(log_indexer, skm_path, e))
+                        report["failed"].append(skm_path)
+                        asset_span.set(outcome="failed")
+                    finally:
+                        report["timings"][skm_path] = time.perf_counter() - skm_start
+
+    # One Bulk Save for every Built Rig (and the Template if it was Built)
+    save_start = time.perf_counter()
+    if ikrs:
+        if template_path and unreal.EditorAssetLibrary.does_asset_exist(template_path):
+            ikrs.append(unreal.EditorAssetLibrary.load_asset(template_path))
+        unreal.EditorAssetLibrary.save_loaded_assets(ikrs, only_if_is_dirty=True)
+    report["save_seconds"] = time.perf_counter() - save_start
+    report["seconds"] = time.perf_counter() - start
+    console_log(message="Built {0}, Skipped {1}, Failed {2} IK Rigs in {3:.2f}s".format(
+        len(report["built"]), len(report["skipped"]), len(report["failed"]), report["seconds"]),
+        indexer=log_indexer)
+    return report
+
 def create_pin_bone_item(bone_to, bone_from):
     pbd = unreal.PinBoneData()
     pbd.set_editor_property("bone_to_pin", bone_to)
@@ -117,60 +470,115 @@ def create_pin_bone_item(bone_to, bone_from):
     return pbd
 
 
-def auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target, fpathext="Retargets"):
+def describe_ikr(ikr):
+    """
+    Chain Names, Topology Hash (Retarget Root, Chains and their Goals, what Chain Mapping Depends on)
+    and Fingerprint (Topology and Build Signature) of an IK Rig
+    """
+    ikr_asset_controller = get_ikr_controller(ikr)
+    chains = ikr_asset_controller.get_retarget_chains()
+    topology = json.dumps([str(ikr_asset_controller.get_retarget_root()),
+        [(str(chain.chain_name), str(chain.ik_goal_name)) for chain in chains]])
+    topology_hash = hashlib.sha256(topology.encode()).hexdigest()[:16]
+    signature = unreal.EditorAssetLibrary.get_metadata_tag(ikr, IKR_SIGNATURE_TAG)
+    return {
+        "path": unreal.EditorAssetLibrary.get_path_name(ikr),
+        "chains": [str(chain.chain_name) for chain in chains],
+        "topology": topology_hash,
+        "fingerprint": hashlib.sha256((topology_hash + str(signature)).encode()).hexdigest()[:16],
+    }
+
+def rtg_signature(source, target, rotator_source, rotator_target):
+    """
+    Hash of what a Retargeter is Built from: the Retargeter Version, both IK Rig Fingerprints and the Offsets
+    """
+    rotators = [(rotator.roll, rotator.pitch, rotator.yaw) for rotator in (rotator_source, rotator_target)]
+    payload = json.dumps([RTG_VERSION, RTG_IGNORE_CHAINS, source["fingerprint"], target["fingerprint"], rotators])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def construct_rtg_path(ikr_source, ikr_target, fpathext="Retargets"):
     """
-    Automate Creating Retarget Asset for a IK's
+    Package Path of the Retargeter between two IK Rigs, next to the Source IK Rig
+    """
+    fname_source = unreal.EditorAssetLibrary.get_fname(ikr_source)
+    fname_target = unreal.EditorAssetLibrary.get_fname(ikr_target)
+    fpath_source = unreal.EditorAssetLibrary.get_path_name(ikr_source).split(".")[0].replace(str(fname_source),"")
+
+    source_name = str(fname_source).split("_")[1]
+    target_name = str(fname_target).split("_")[1]
+    return "{0}{1}/RTG_{2}-{3}".format(fpath_source, fpathext, source_name, target_name)
+
+def map_rtg_chains(rtg_asset_controller, target_chain_names, chain_mapping=None):
+    """
+    Map the Target Chains: Fuzzy Auto Mapping without the Ignored Chains, or a Mapping Computed Before.
+    Returns the Mapping of each Target Chain to its Source Chain.
+    """
+    if chain_mapping is not None:
+        for target_chain, source_chain in chain_mapping.items():
+            rtg_asset_controller.set_source_chain(source_chain, target_chain)
+        return chain_mapping
+
+    rtg_asset_controller.auto_map_chains(unreal.AutoMapChainType.FUZZY, True)
+    for item in RTG_IGNORE_CHAINS:
+        rtg_asset_controller.set_source_chain("None", item)
+    return {target_chain: str(rtg_asset_controller.get_source_chain(target_chain))
+        for target_chain in target_chain_names}
+
+@pipeline_trace.traced()
+def auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target, fpathext="Retargets", save=True,
+        chain_mappings=None, source=None, target=None, rtg_path=None):
+    """
+    Automate Creating Retarget Asset for a IK's (Reconfiguring the Existing Retargeter in Place)
     
     :param ikr_source: IKR Source
     :param ikr_target: IKR Target
     :param rotator_source: Source Rotator
     :param rotator_target: Target Rotator
     :param fpathext: (Optional) Folder Name
+    :param save: (Optional) Save the Retargeter, Disable to Save many Retargeters Together
+    :param chain_mappings: (Optional) Chain Mappings by (Source, Target) Topology, Reused and Filled in
+    :param source: (Optional) describe_ikr of the Source IK Rig, if Already Known
+    :param target: (Optional) describe_ikr of the Target IK Rig, if Already Known
+    :param rtg_path: (Optional) Retargeter Path from construct_rtg_path, if Already Known
     """
     log_indexer = "AutoRetarget-Python"
 
-    fname_source = unreal.EditorAssetLibrary.get_fname(ikr_source)
-    fname_target = unreal.EditorAssetLibrary.get_fname(ikr_target)
-    fpath_source = unreal.EditorAssetLibrary.get_path_name(ikr_source).split(".")[0].replace(str(fname_source),"")
+    source = describe_ikr(ikr_source) if source is None else source
+    target = describe_ikr(ikr_target) if target is None else target
+    rtg_path = construct_rtg_path(ikr_source, ikr_target, fpathext) if rtg_path is None else rtg_path
 
-    source_name = str(fname_source).split("_")[1]
-    target_name = str(fname_target).split("_")[1]
+    if unreal.EditorAssetLibrary.does_asset_exist(rtg_path):
+        console_log(message="Reconfiguring RTG Asset", indexer=log_indexer)
+        rtg = unreal.EditorAssetLibrary.load_asset(rtg_path)
+        rtg_asset_controller = get_rtg_controller(rtg)
+        rtg_asset_controller.remove_all_ops()
+    else:
+        # Use the asset tools
+        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
 
-    # Use the asset tools
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+        # Create the IK Rig Asset
+        console_log(message="Creating RTG Asset", indexer=log_indexer)
+        fpath, rtg_name = rtg_path.rsplit("/", 1)
+        rtg = asset_tools.create_asset(asset_name=rtg_name,
+            package_path=fpath, asset_class=unreal.IKRetargeter,
+            factory=unreal.IKRetargetFactory())
 
-    # Create the IK Rig Asset
-    console_log(message="Creating RTG Asset", indexer=log_indexer)
-    rtg = asset_tools.create_asset(asset_name='RTG_{0}-{1}'.format(source_name, target_name), 
-        package_path=fpath_source + fpathext, asset_class=unreal.IKRetargeter, 
-        factory=unreal.IKRetargetFactory())
-    
-    # Get the IK Rig Asset Controller
-    console_log(message="Controlling Retarget Asset", indexer=log_indexer)
-    rtg_asset_controller = unreal.IKRetargeterController.get_controller(rtg)
+        # Get the IK Rig Asset Controller
+        console_log(message="Controlling Retarget Asset", indexer=log_indexer)
+        rtg_asset_controller = get_rtg_controller(rtg)
     rtg_asset_controller.set_ik_rig(unreal.RetargetSourceOrTarget.SOURCE, ikr_source)
     rtg_asset_controller.set_ik_rig(unreal.RetargetSourceOrTarget.TARGET, ikr_target)
 
-    console_log(message="Auto Mapping Chains", indexer=log_indexer)
-    rtg_asset_controller.auto_map_chains(unreal.AutoMapChainType.FUZZY, True)
-
-    ignore_chain_list = [
-        'Root', 
-        # Left Fingers
-        'LeftMiddleMetacarpal', 'LeftMiddle',
-        'LeftPinkyMetacarpal', 'LeftPinky',
-        'LeftRingMetacarpal', 'LeftRing',
-        'LeftIndexMetacarpal', 'LeftIndex',
-        'LeftThumb',
-        # Right Fingers
-        'RightMiddleMetacarpal', 'RightMiddle',
-        'RightPinkyMetacarpal', 'RightPinky',
-        'RightRingMetacarpal', 'RightRing',
-        'RightIndexMetacarpal', 'RightIndex',
-        'RightThumb',
-    ]
-    for item in ignore_chain_list:
-        rtg_asset_controller.set_source_chain("None", item)
+    # Fuzzy Mapping Depends only on the Chains, so it Runs once per Topology Pair
+    topology_pair = (source["topology"], target["topology"])
+    chain_mapping = chain_mappings.get(topology_pair) if chain_mappings is not None else None
+    if chain_mapping is None:
+        console_log(message="Auto Mapping Chains", indexer=log_indexer)
+    else:
+        console_log(message="Applying Cached Chain Mapping", indexer=log_indexer)
+    chain_mapping = map_rtg_chains(rtg_asset_controller, target["chains"], chain_mapping)
+    if chain_mappings is not None:
+        chain_mappings[topology_pair] = chain_mapping
 
     # Rotating Root Offset
     console_log(message="Setting Rotation Offset for Root", indexer=log_indexer)
@@ -248,7 +656,395 @@ def auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target, fpat
 
     rtg_pb_op.set_editor_property("maintain_offset", False)
 
+    # Tag the Retargeter with what it was Built from
+    unreal.EditorAssetLibrary.set_metadata_tag(rtg, RTG_SIGNATURE_TAG,
+        rtg_signature(source, target, rotator_source, rotator_target))
+
     console_log(message="Finished Successfully", indexer=log_indexer)
-    unreal.EditorAssetLibrary.save_asset(rtg.get_path_name())
+    if save:
+        unreal.EditorAssetLibrary.save_asset(rtg.get_path_name())
     return rtg
 
+@pipeline_trace.traced()
+def auto_ikrs_to_rtgs(ikr_sources, ikr_targets, rotator_source, rotator_target, fpathext="Retargets", force=False,
+        chain_mappings=None):
+    """
+    Automate Creating the Retargeters from every Source IK Rig to every Target IK Rig in one Slow Task and
+    Undo Transaction, Skipping Retargeters whose Inputs are Unchanged, Mapping Chains once per Topology Pair
+    and Saving the Built Retargeters Together at the End
+
+    :param ikr_sources: Source IK Rigs, or a Content Path to Search for them
+    :param ikr_targets: Target IK Rigs, or a Content Path to Search for them
+    :param rotator_source: Source Rotator
+    :param rotator_target: Target Rotator
+    :param fpathext: (Optional) Folder Name
+    :param force: (Optional) Rebuild Up to Date Retargeters as well
+    :param chain_mappings: (Optional) Chain Mappings by (Source, Target) Topology, Reused and Filled in
+    :return: Report of the Built, Skipped and Failed Retargeter Paths, per-Retargeter and Save Timings
+    """
+    log_indexer = "AutoRetargets-Python"
+    start = time.perf_counter()
+    ikr_sources = find_ik_rigs(ikr_sources) if isinstance(ikr_sources, str) else ikr_sources
+    ikr_targets = find_ik_rigs(ikr_targets) if isinstance(ikr_targets, str) else ikr_targets
+    chain_mappings = {} if chain_mappings is None else chain_mappings
+    mappings_before = len(chain_mappings)
+
+    # Each IK Rig is Described once, not once per Pair
+    sources = [describe_ikr(ikr) for ikr in ikr_sources]
+    targets = [describe_ikr(ikr) for ikr in ikr_targets]
+
+    report = {"built": [], "skipped": [], "failed": [], "timings": {}, "cancelled": False}
+    rtgs = []
+    claimed_paths = {}
+    with unreal.ScopedSlowTask(len(sources) * len(targets), "Creating Retargeters") as slow_task:
+        slow_task.make_dialog(True)
+        with unreal.ScopedEditorTransaction("Create Retargeters"):
+            for ikr_source, source in zip(ikr_sources, sources):
+                for ikr_target, target in zip(ikr_targets, targets):
+                    if slow_task.should_cancel():
+                        report["cancelled"] = True
+                        break
+                    pair_name = "{0} -> {1}".format(source["path"].rsplit(".", 1)[-1],
+                        target["path"].rsplit(".", 1)[-1])
+                    slow_task.enter_progress_frame(1, "Creating Retargeter for {0}".format(pair_name))
+                    rtg_start = time.perf_counter()
+                    with pipeline_trace.span("ikr_to_rtg", asset=pair_name) as asset_span:
+                        rtg_path = pair_name
+                        try:
+                            rtg_path = construct_rtg_path(ikr_source, ikr_target, fpathext)
+                            asset_span.set(asset=rtg_path)
+                            # IK Rig Names Sharing the Part up to their Next Underscore Share a Retargeter Path:
+                            # only the First Pair is Built there, not Overwritten by the Next
+                            if rtg_path in claimed_paths:
+                                raise ValueError("Retargeter Path Already Used for {0}".format(
+                                    claimed_paths[rtg_path]))
+                            claimed_paths[rtg_path] = pair_name
+                            signature = rtg_signature(source, target, rotator_source, rotator_target)
+                            if not force and get_registry_tag(rtg_path, RTG_SIGNATURE_TAG) == signature:
+                                report["skipped"].append(rtg_path)
+                                asset_span.set(outcome="skipped")
+                                continue
+                            rtgs.append(auto_ikr_to_rtg(ikr_source, ikr_target, rotator_source, rotator_target,
+                                fpathext, False, chain_mappings, source, target, rtg_path))
+                            report["built"].append(rtg_path)
+                            asset_span.set(outcome="built")
+                        except Exception as e:
+                            unreal.log_error("[{0}]: {1} ({2}): {3}".format(log_indexer, rtg_path, pair_name, e))
+                            report["failed"].append(rtg_path)
+                            asset_span.set(outcome="failed")
+                        finally:
+                            report["timings"][rtg_path] = time.perf_counter() - rtg_start
+                if report["cancelled"]:
+                    break
+
+    # One Bulk Save for every Built Retargeter
+    save_start = time.perf_counter()
+    if rtgs:
+        unreal.EditorAssetLibrary.save_loaded_assets(rtgs, only_if_is_dirty=True)
+    report["save_seconds"] = time.perf_counter() - save_start
+    report["chain_mappings_computed"] = len(chain_mappings) - mappings_before
+    report["seconds"] = time.perf_counter() - start
+    console_log(message="Built {0}, Skipped {1}, Failed {2} Retargeters ({3} Chain Mappings Computed) in {4:.2f}s".format(
+        len(report["built"]), len(report["skipped"]), len(report["failed"]), report["chain_mappings_computed"],
+        report["seconds"]), indexer=log_indexer)
+    return report
+
+def build_fbx_import_task(filename, destination_path, import_animations=False, replace_existing=True):
+    """
+    Automated (no Dialogs) Import Task for a Prepared Skeletal Mesh FBX File
+
+    :param filename: FBX File
+    :param destination_path: Content Path to Import into
+    :param import_animations: (Optional) Import the File's Animation as well
+    :param replace_existing: (Optional) Re-Import over Existing Assets
+    """
+    fbx_options = unreal.FbxImportUI()
+    fbx_options.set_editor_property("import_mesh", True)
+    fbx_options.set_editor_property("import_as_skeletal", True)
+    fbx_options.set_editor_property("mesh_type_to_import", unreal.FBXImportType.FBXIT_SKELETAL_MESH)
+    fbx_options.set_editor_property("import_animations", import_animations)
+    fbx_options.set_editor_property("import_materials", True)
+    fbx_options.set_editor_property("import_textures", True)
+    fbx_options.set_editor_property("create_physics_asset", False)
+
+    task = unreal.AssetImportTask()
+    task.set_editor_property("filename", filename)
+    task.set_editor_property("destination_path", destination_path)
+    task.set_editor_property("automated", True)
+    task.set_editor_property("replace_existing", replace_existing)
+    # Saved in one Bulk Save after the Batch, not one Save per File
+    task.set_editor_property("save", False)
+    task.set_editor_property("options", fbx_options)
+    return task
+
+@pipeline_trace.traced()
+def auto_import_fbx_folder(fbx_dir, destination_path="/Game/Mocap/Performers", recursive=True,
+        import_animations=False, replace_existing=True):
+    """
+    Automate Importing every FBX File of a Folder (e.g. the Blender Batch Output) in one Import Call,
+    Mirroring Sub-Folders under the Destination Content Path
+
+    :param fbx_dir: Folder of FBX Files
+    :param destination_path: (Optional) Content Path to Import into
+    :param recursive: (Optional) Import Sub-Folders as well
+    :param import_animations: (Optional) Import the Files' Animations as well
+    :param replace_existing: (Optional) Re-Import over Existing Assets
+    :return: Imported Skeletal Meshes and the Files that Produced None
+    """
+    log_indexer = "AutoImport-Python"
+    tasks = []
+    for root, dirs, files in os.walk(fbx_dir):
+        dirs.sort()
+        relative_dir = os.path.relpath(root, fbx_dir).replace(os.sep, "/")
+        task_path = destination_path if relative_dir == "." else "{0}/{1}".format(destination_path, relative_dir)
+        for name in sorted(files):
+            if name.lower().endswith(".fbx"):
+                tasks.append(build_fbx_import_task(os.path.join(root, name), task_path, import_animations,
+                    replace_existing))
+        if not recursive:
+            break
+
+    console_log(message="Importing {0} FBX Files".format(len(tasks)), indexer=log_indexer)
+    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
+
+    # The Tasks Hold what they Imported, so the Asset Registry is not Queried again
+    skms, failed, imported_objects = [], [], []
+    for task in tasks:
+        imported_objects += task.get_objects()
+        imported = [obj for obj in task.get_objects() if isinstance(obj, unreal.SkeletalMesh)]
+        if not imported:
+            unreal.log_error("[{0}]: No Skeletal Mesh Imported from {1}".format(log_indexer,
+                task.get_editor_property("filename")))
+            failed.append(task.get_editor_property("filename"))
+        skms += imported
+    if imported_objects:
+        unreal.EditorAssetLibrary.save_loaded_assets(imported_objects, only_if_is_dirty=True)
+    return skms, failed
+
+@pipeline_trace.traced()
+def auto_fbx_folder_to_rtgs(fbx_dir, ikr_targets, rotator_source, rotator_target,
+        destination_path="/Game/Mocap/Performers", recursive=True, import_animations=False):
+    """
+    Automate the Path from a Folder of Prepared FBX Files to Retargeters in one Editor Session: Import
+    them in one Batch, Create their IK Rigs, then the Retargeters to every Target IK Rig
+
+    :param fbx_dir: Folder of FBX Files (e.g. the Blender Batch Output)
+    :param ikr_targets: Target IK Rigs, or a Content Path to Search for them
+    :param rotator_source: Source Rotator
+    :param rotator_target: Target Rotator
+    :param destination_path: (Optional) Content Path to Import into
+    :param recursive: (Optional) Import Sub-Folders as well
+    :param import_animations: (Optional) Import the Files' Animations as well
+    :return: Report of each Stage (Import, IK Rigs, Retargeters) and their Timings
+    """
+    log_indexer = "AutoFBX2RTG-Python"
+    start = time.perf_counter()
+    timings = {}
+
+    stage_start = time.perf_counter()
+    skms, failed_imports = auto_import_fbx_folder(fbx_dir, destination_path, recursive, import_animations)
+    timings["import"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    ikr_report = auto_skms_to_ikrs(skms)
+    ikr_sources = [unreal.EditorAssetLibrary.load_asset(ikr_path) for ikr_path in ikr_report["rigs"]]
+    timings["ik_rigs"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    rtg_report = auto_ikrs_to_rtgs(ikr_sources, ikr_targets, rotator_source, rotator_target)
+    timings["retargeters"] = time.perf_counter() - stage_start
+
+    timings["total"] = time.perf_counter() - start
+    console_log(message="Imported {0} Meshes ({1} Failed), {2} IK Rigs, {3} Retargeters; Import {4:.2f}s, "
+        "IK Rigs {5:.2f}s, Retargeters {6:.2f}s, Total {7:.2f}s".format(len(skms), len(failed_imports),
+        len(ikr_report["rigs"]), len(rtg_report["built"]) + len(rtg_report["skipped"]), timings["import"],
+        timings["ik_rigs"], timings["retargeters"], timings["total"]), indexer=log_indexer)
+    return {
+        "imported": [unreal.EditorAssetLibrary.get_path_name(skm) for skm in skms],
+        "failed_imports": failed_imports,
+        "ik_rigs": ikr_report,
+        "retargeters": rtg_report,
+        "timings": timings,
+    }
+
+def get_process_memory():
+    """
+    Working Set and Peak Working Set of the Editor Process in Bytes (Peak only where the Current is Unavailable)
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (field, ctypes.c_size_t) for field in ("PeakWorkingSetSize", "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                    "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        ctypes.WinDLL("psapi").GetProcessMemoryInfo(get_current_process(), ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+    import resource
+    # ru_maxrss is in Kilobytes on Linux and Bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"), peak
+    except OSError:
+        return peak, peak
+
+def read_retarget_manifest(manifest_path, rtg_path):
+    """
+    Checkpoint Manifest of a Batch Retarget, or a New one if there is None Yet
+    """
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["retargeter"] != rtg_path:
+            raise ValueError("Manifest {0} is for Retargeter {1}, not {2}".format(
+                manifest_path, manifest["retargeter"], rtg_path))
+        return manifest
+    return {"retargeter": rtg_path, "done": {}, "failed": {}, "chunks": []}
+
+def write_retarget_manifest(manifest_path, manifest):
+    """
+    Write the Checkpoint Manifest Atomically, so a Crash Leaves the Previous one Intact
+    """
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=1)
+    os.replace(temp_path, manifest_path)
+
+@pipeline_trace.traced()
+def unload_asset_packages(package_names):
+    """
+    Unload the Loaded Packages among these and Collect Garbage
+    """
+    packages = [package for package in (unreal.find_package(name) for name in package_names) if package]
+    if packages:
+        unreal.EditorLoadingAndSavingUtils.unload_packages(packages)
+    unreal.SystemLibrary.collect_garbage()
+
+@pipeline_trace.traced()
+def batch_retarget_animations(rtg, anim_sequences="/Game", name_filter="*", recursive=True, chunk_size=50,
+        manifest_path=None, prefix="", suffix=None, source_mesh=None, target_mesh=None):
+    """
+    Automate Retargeting Animation Sequences with a Retargeter in Fixed-Size Chunks. Each Chunk's
+    Results are Saved, then its Packages Unloaded and Garbage Collected, so Editor Memory Stays Flat.
+    Finished Sequences are Recorded in a Checkpoint Manifest after every Chunk, and Skipped when
+    Run Again, e.g. after a Crash. Runs outside an Undo Transaction, which would Keep every Sequence.
+
+    :param rtg: Retargeter Asset
+    :param anim_sequences: Content Path to Search for Animation Sequences, or a List of their Asset Data
+    :param name_filter: (Optional) Wildcard Filter on the Sequence Names when Searching a Content Path
+    :param recursive: (Optional) Search Sub-Folders of the Content Path
+    :param chunk_size: (Optional) Sequences Retargeted between Garbage Collections
+    :param manifest_path: (Optional) Checkpoint Manifest File, Defaults to one per Retargeter in Saved/
+    :param prefix: (Optional) Prefix of the Retargeted Sequence Names
+    :param suffix: (Optional) Suffix of the Retargeted Sequence Names, Defaults to _<Target IK Rig Name>
+    :param source_mesh: (Optional) Source Skeletal Mesh, Defaults to the Retargeter's Source IK Rig Mesh
+    :param target_mesh: (Optional) Target Skeletal Mesh, Defaults to the Retargeter's Target IK Rig Mesh
+    :return: Report of the Retargeted, Resumed and Failed Sequences, per-Chunk Throughput and Memory
+    """
+    log_indexer = "BatchRetarget-Python"
+    start = time.perf_counter()
+    rtg_path = unreal.EditorAssetLibrary.get_path_name(rtg)
+    rtg_asset_controller = get_rtg_controller(rtg)
+    ikr_target = rtg_asset_controller.get_ik_rig(unreal.RetargetSourceOrTarget.TARGET)
+    if source_mesh is None:
+        ikr_source = rtg_asset_controller.get_ik_rig(unreal.RetargetSourceOrTarget.SOURCE)
+        source_mesh = get_ikr_controller(ikr_source).get_skeletal_mesh()
+    if target_mesh is None:
+        target_mesh = get_ikr_controller(ikr_target).get_skeletal_mesh()
+    if suffix is None:
+        suffix = "_" + str(unreal.EditorAssetLibrary.get_fname(ikr_target)).split("_", 1)[-1]
+
+    # Sequences of the Source Skeleton, by Asset Registry Tag without Loading them
+    if isinstance(anim_sequences, str):
+        anim_sequences = find_asset_datas(anim_sequences, ("/Script/Engine", "AnimSequence"), name_filter, recursive)
+    skeleton_path = source_mesh.get_editor_property("skeleton").get_path_name()
+    anim_sequences = [asset_data for asset_data in anim_sequences
+        if skeleton_path in str(asset_data.get_tag_value("Skeleton") or skeleton_path)]
+
+    if manifest_path is None:
+        manifest_path = os.path.join(unreal.Paths.project_saved_dir(), "OptiSkelUE5Pipe",
+            "Retarget_{0}.json".format(rtg_path.rsplit(".", 1)[-1]))
+    manifest = read_retarget_manifest(manifest_path, rtg_path)
+
+    # Sequences Finished Before, or whose Result was Saved just before a Crash
+    pending = []
+    resumed = 0
+    for asset_data in anim_sequences:
+        package_name = str(asset_data.package_name)
+        output_path = "{0}/{1}{2}{3}".format(asset_data.package_path, prefix, asset_data.asset_name, suffix)
+        if package_name in manifest["done"]:
+            resumed += 1
+        elif unreal.EditorAssetLibrary.does_asset_exist(output_path):
+            manifest["done"][package_name] = output_path
+            resumed += 1
+        else:
+            pending.append(asset_data)
+    chunks = [pending[index:index + chunk_size] for index in range(0, len(pending), chunk_size)]
+    console_log(message="Retargeting {0} Sequences in {1} Chunks ({2} Already Done)".format(
+        len(pending), len(chunks), resumed), indexer=log_indexer)
+
+    report = {"retargeted": 0, "resumed": resumed, "failed": [], "chunks": [], "cancelled": False,
+        "manifest": manifest_path}
+    with unreal.ScopedSlowTask(len(pending), "Retargeting Animations with {0}".format(rtg_path)) as slow_task:
+        slow_task.make_dialog(True)
+        for chunk_index, chunk in enumerate(chunks):
+            if slow_task.should_cancel():
+                report["cancelled"] = True
+                break
+            slow_task.enter_progress_frame(len(chunk), "Chunk {0} of {1}".format(chunk_index + 1, len(chunks)))
+            chunk_start = time.perf_counter()
+            package_names = [str(asset_data.package_name) for asset_data in chunk]
+            try:
+                with pipeline_trace.span("retarget_chunk", chunk=chunk_index + 1, sequences=len(chunk)):
+                    retargeted = unreal.IKRetargetBatchOperation.duplicate_and_retarget(chunk, source_mesh,
+                        target_mesh, rtg, "", "", prefix, suffix)
+                with pipeline_trace.span("save_chunk", chunk=chunk_index + 1, assets=len(retargeted)):
+                    unreal.EditorAssetLibrary.save_loaded_assets([asset_data.get_asset() for asset_data in retargeted],
+                        only_if_is_dirty=True)
+                for asset_data in chunk:
+                    manifest["done"][str(asset_data.package_name)] = "{0}/{1}{2}{3}".format(
+                        asset_data.package_path, prefix, asset_data.asset_name, suffix)
+                    manifest["failed"].pop(str(asset_data.package_name), None)
+                package_names += [str(asset_data.package_name) for asset_data in retargeted]
+                report["retargeted"] += len(chunk)
+            except Exception as e:
+                unreal.log_error("[{0}]: Chunk {1}: {2}".format(log_indexer, chunk_index + 1, e))
+                for asset_data in chunk:
+                    manifest["failed"][str(asset_data.package_name)] = str(e)
+                report["failed"] += [str(asset_data.package_name) for asset_data in chunk]
+            retarget_seconds = time.perf_counter() - chunk_start
+            memory_before, _ = get_process_memory()
+            unload_asset_packages(package_names)
+            memory_after, memory_peak = get_process_memory()
+
+            chunk_report = {
+                "chunk": chunk_index + 1,
+                "sequences": len(chunk),
+                "seconds": time.perf_counter() - chunk_start,
+                "sequences_per_second": len(chunk) / retarget_seconds if retarget_seconds else 0.0,
+                "memory_before_gc": memory_before,
+                "memory_after_gc": memory_after,
+                "memory_peak": memory_peak,
+            }
+            report["chunks"].append(chunk_report)
+            manifest["chunks"].append(chunk_report)
+            write_retarget_manifest(manifest_path, manifest)
+            console_log(message="Chunk {0}/{1}: {2} Sequences in {3:.1f}s ({4:.1f}/s), Memory {5:.0f} -> {6:.0f} MB "
+                "after GC, Peak {7:.0f} MB".format(chunk_index + 1, len(chunks), len(chunk), chunk_report["seconds"],
+                chunk_report["sequences_per_second"], memory_before / 2 ** 20, memory_after / 2 ** 20,
+                memory_peak / 2 ** 20), indexer=log_indexer)
+
+    report["seconds"] = time.perf_counter() - start
+    console_log(message="Retargeted {0}, Resumed {1}, Failed {2} Sequences in {3:.2f}s".format(
+        report["retargeted"], report["resumed"], len(report["failed"]), report["seconds"]), indexer=log_indexer)
+    return report
@@ -1,12 +1,208 @@
-import sys, importlib, unreal, os
+"""
+Change-Aware Loader for the Unreal Automation Scripts
+
+Finds the script directory next to this file (or, run without a file, under the project
+directory), puts it and Common on sys.path, and imports the automation modules. Run again,
+it reloads only the modules whose source changed (checked by modification time and size,
+then by content hash, so saving an unchanged file reloads nothing) and the modules
+importing them, dependencies first, so ``from ... import`` bindings are never stale.
 
-script_path = "C:\\Users\\abhis\\Development\\OptiTrack\\OptiSkelUE5Pipe\\Unreal"
-script_dir = os.path.join(unreal.Paths.project_dir(), script_path)
-if script_dir not in sys.path:
-    sys.path.append(script_dir)
+    py "<Project>/OptiSkelUE5Pipe/Unreal/loader.py"     # Import, or Reload what Changed
 
+    import loader
+    autoasset = loader.load()["modules"]["automate_asset"]
+    autoasset.auto_skm_to_ikr(skm)
 """
-import automate_asset as autoasset
-importlib.reload(autoasset)
-autoasset.auto_skm_to_ikr(skm)
-"""
\ No newline at end of file
+import ast
+import hashlib
+import importlib
+import os
+import sys
+import time
+from datetime import datetime
+
+import unreal
+
+# Run without a File (e.g. Pasted into the Python Console): Search the Project for the Scripts
+SCRIPT_DIR_ENV = "OPTISKEL_UNREAL_DIR"
+PROJECT_SCRIPT_DIRS = [
+    ("OptiSkelUE5Pipe", "Unreal"),
+    ("Scripts", "OptiSkelUE5Pipe", "Unreal"),
+    ("Content", "Python", "OptiSkelUE5Pipe", "Unreal"),
+    ("Content", "Python"),
+]
+
+# Modules Imported by load() (their Tracked Imports Follow)
+ENTRY_MODULES = ["automate_asset"]
+
+# Source Fingerprint of each Module as it was Last (Re)Loaded: (mtime_ns, size, sha256)
+_fingerprints = {}
+# Tracked Imports of each Module's Source, by Content Hash (so Unchanged Files aren't Parsed again)
+_imports = {}
+
+def console_log(message, indexer="Loader-Python"):
+    unreal.log(f"[{indexer}]: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {message}")
+
+def find_script_dir():
+    """
+    Directory of the Unreal Scripts: this File's, the OPTISKEL_UNREAL_DIR Environment Variable's,
+    or the first Project Folder with automate_asset.py
+    """
+    if "__file__" in globals():
+        return os.path.dirname(os.path.abspath(__file__))
+    if os.environ.get(SCRIPT_DIR_ENV):
+        return os.path.abspath(os.environ[SCRIPT_DIR_ENV])
+    project_dir = unreal.Paths.project_dir()
+    for parts in PROJECT_SCRIPT_DIRS:
+        script_dir = os.path.abspath(os.path.join(project_dir, *parts))
+        if os.path.isfile(os.path.join(script_dir, "automate_asset.py")):
+            return script_dir
+    raise FileNotFoundError("Unreal Scripts not Found under {0}, Set {1}".format(project_dir, SCRIPT_DIR_ENV))
+
+def find_source_dirs(script_dir=None):
+    """
+    The Script Directory and the Common Directory beside it
+    """
+    script_dir = find_script_dir() if script_dir is None else script_dir
+    return [script_dir, os.path.normpath(os.path.join(script_dir, os.pardir, "Common"))]
+
+def add_source_dirs(source_dirs):
+    for source_dir in source_dirs:
+        if os.path.isdir(source_dir) and source_dir not in sys.path:
+            sys.path.append(source_dir)
+
+def find_modules(source_dirs):
+    """
+    Source File of every Module in the Source Directories, by Module Name (the Loader Excluded)
+    """
+    modules = {}
+    for source_dir in source_dirs:
+        if not os.path.isdir(source_dir):
+            continue
+        for file_name in sorted(os.listdir(source_dir)):
+            module_name, extension = os.path.splitext(file_name)
+            if extension == ".py" and module_name != "loader":
+                modules.setdefault(module_name, os.path.abspath(os.path.join(source_dir, file_name)))
+    return modules
+
+def read_imports(path):
+    """
+    Top-Level Names of the Modules a Source File Imports (at any Depth, e.g. inside Functions)
+    """
+    with open(path, "rb") as source_file:
+        tree = ast.parse(source_file.read(), path)
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.add(node.module.split(".")[0])
+    return frozenset(imports)
+
+def is_loaded_from(module_name, path):
+    """
+    Whether a Module is Imported from the Given Source File (not a Same-Named Module Elsewhere)
+    """
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    return module_file is not None and os.path.normcase(os.path.abspath(module_file)) == os.path.normcase(path)
+
+def fingerprint(path, previous=None):
+    """
+    (mtime_ns, Size, Content Hash) of a Source File, Hashing only when the Modification Time or Size Changed
+    """
+    stat = os.stat(path)
+    if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+        return previous
+    with open(path, "rb") as source_file:
+        return stat.st_mtime_ns, stat.st_size, hashlib.sha256(source_file.read()).hexdigest()
+
+def dependency_order(module_names, imports):
+    """
+    Modules Ordered so every Module Comes after the Modules it Imports (Cycles Kept in Name Order)
+    """
+    ordered, visiting = [], set()
+    def visit(module_name):
+        if module_name in ordered or module_name in visiting:
+            return
+        visiting.add(module_name)
+        for dependency in sorted(imports.get(module_name, ())):
+            if dependency in module_names:
+                visit(dependency)
+        ordered.append(module_name)
+    for module_name in sorted(module_names):
+        visit(module_name)
+    return ordered
+
+def find_changed_modules(modules):
+    """
+    Loaded Modules whose Source Changed since they were Loaded (or were Loaded before the Loader Tracked them),
+    with their New Fingerprints
+    """
+    changed = {}
+    for module_name, path in modules.items():
+        if not is_loaded_from(module_name, path):
+            continue
+        previous = _fingerprints.get(module_name)
+        current = fingerprint(path, previous)
+        if previous is None or current[2] != previous[2]:
+            changed[module_name] = current
+        elif current is not previous:
+            # Saved without Changes: Keep the New Modification Time so it isn't Hashed again
+            _fingerprints[module_name] = current
+    return changed
+
+def load(entry_modules=None, script_dir=None):
+    """
+    Import the Entry Modules, Reloading the Loaded Modules whose Source Changed and every Module Importing them.
+    Returns the Entry Modules by Name, the Reloaded Modules in Reload Order and the Seconds Taken.
+
+    :param entry_modules: (Optional) Module Names to Import, Defaults to ENTRY_MODULES
+    :param script_dir: (Optional) Unreal Script Directory, Found when not Given
+    """
+    start = time.perf_counter()
+    entry_modules = ENTRY_MODULES if entry_modules is None else entry_modules
+    source_dirs = find_source_dirs(script_dir)
+    add_source_dirs(source_dirs)
+    modules = find_modules(source_dirs)
+
+    changed = find_changed_modules(modules)
+    reloaded = []
+    if changed:
+        imports = {}
+        for module_name, path in modules.items():
+            source_hash = (changed.get(module_name) or fingerprint(path, _fingerprints.get(module_name)))[2]
+            if (path, source_hash) not in _imports:
+                _imports[(path, source_hash)] = read_imports(path)
+            imports[module_name] = _imports[(path, source_hash)] & modules.keys()
+        # Importers of a Changed Module Hold Bindings to its Old Objects: Reload them too
+        stale = set(changed)
+        while True:
+            importers = {module_name for module_name, module_imports in imports.items()
+                         if is_loaded_from(module_name, modules[module_name]) and module_imports & stale} - stale
+            if not importers:
+                break
+            stale |= importers
+        for module_name in dependency_order(stale, imports):
+            importlib.reload(sys.modules[module_name])
+            _fingerprints[module_name] = changed.get(module_name) or fingerprint(modules[module_name])
+            reloaded.append(module_name)
+
+    loaded = {}
+    for module_name in entry_modules:
+        loaded[module_name] = importlib.import_module(module_name)
+    # Record the Modules Imported for the First Time (Directly or by the Entry Modules)
+    for module_name, path in modules.items():
+        if module_name not in _fingerprints and is_loaded_from(module_name, path):
+            _fingerprints[module_name] = fingerprint(path)
+
+    seconds = time.perf_counter() - start
+    if reloaded:
+        console_log("Reloaded {0} in {1:.3f}s".format(", ".join(reloaded), seconds))
+    else:
+        console_log("No Changes, Loaded {0} in {1:.3f}s".format(", ".join(entry_modules), seconds))
+    return {"modules": loaded, "reloaded": reloaded, "seconds": seconds}
+
+if __name__ == "__main__":
+    # Keep the Fingerprints in the Imported Loader Module, so they Persist between Runs of this Script
+    add_source_dirs(find_source_dirs())
+    importlib.import_module("loader").load()